@@ -31,7 +31,6 @@ class JisshuxBot(Client):
             api_hash=API_HASH,
             bot_token=BOT_TOKEN,
             workers=50,
-            plugins={"root": "plugins"},
             sleep_threshold=5,
         )
 
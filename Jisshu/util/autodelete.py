@@ -0,0 +1,114 @@
+import time
+import heapq
+import asyncio
+import logging
+from itertools import count
+from bson import ObjectId
+from database.users_chats_db import db
+
+logger = logging.getLogger(__name__)
+
+
+class AutoDeleter:
+    """Deletes messages after a delay without keeping the handler alive.
+
+    Jobs sit in a heap ordered by due time and are saved to mongo in batches,
+    so pending deletions survive a restart. Due jobs are grouped per chat and
+    removed with one ``delete_messages`` call.
+    """
+
+    FLUSH_INTERVAL = 2
+
+    def __init__(self):
+        self.heap = []
+        self.unsaved = []
+        self.seq = count()
+        self.wakeup = asyncio.Event()
+
+    def schedule(self, messages, delay, edit=None):
+        """``messages`` from one chat, ``edit`` is an optional (message, text) done after deleting."""
+        messages = [m for m in messages if m]
+        if not messages:
+            return
+        job = {
+            "_id": ObjectId(),
+            "chat_id": messages[0].chat.id,
+            "ids": [m.id for m in messages],
+            "due": time.time() + delay,
+        }
+        if edit:
+            job["edit_id"], job["edit_text"] = edit[0].id, edit[1]
+        self.unsaved.append(job)
+        self._push(job)
+
+    def _push(self, job):
+        first = self.heap[0][0] if self.heap else None
+        heapq.heappush(self.heap, (job["due"], next(self.seq), job))
+        if first is None or job["due"] < first:
+            self.wakeup.set()
+
+    async def _flush(self):
+        while True:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            if not self.unsaved:
+                continue
+            jobs, self.unsaved = self.unsaved, []
+            try:
+                await db.add_auto_deletes(jobs)
+            except Exception:
+                logger.exception("Saving auto delete jobs failed")
+
+    async def _delete(self, client, chat_id, jobs):
+        ids = [i for job in jobs for i in job["ids"]]
+        for i in range(0, len(ids), 100):
+            chunk = ids[i : i + 100]
+            try:
+                await client.delete_messages(chat_id, chunk)
+            except Exception:
+                # one message we can't delete (e.g. user message without admin
+                # rights) shouldn't keep the rest alive
+                for msg_id in chunk:
+                    try:
+                        await client.delete_messages(chat_id, msg_id)
+                    except Exception:
+                        pass
+        for job in jobs:
+            if job.get("edit_id"):
+                try:
+                    await client.edit_message_text(
+                        chat_id, job["edit_id"], job["edit_text"]
+                    )
+                except Exception:
+                    pass
+
+    async def run(self, client):
+        for job in await db.get_auto_deletes():
+            self._push(job)
+        asyncio.create_task(self._flush())
+        while True:
+            self.wakeup.clear()
+            timeout = self.heap[0][0] - time.time() if self.heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            now = time.time()
+            due = {}
+            while self.heap and self.heap[0][0] <= now:
+                job = heapq.heappop(self.heap)[2]
+                due.setdefault(job["chat_id"], []).append(job)
+            await asyncio.gather(
+                *[self._delete(client, chat_id, jobs) for chat_id, jobs in due.items()]
+            )
+            done = [job["_id"] for jobs in due.values() for job in jobs]
+            finished = set(done)
+            self.unsaved = [job for job in self.unsaved if job["_id"] not in finished]
+            try:
+                await db.remove_auto_deletes(done)
+            except Exception:
+                logger.exception("Removing auto delete jobs failed")
+
+
+auto_deleter = AutoDeleter()
@@ -0,0 +1,139 @@
+import time
+import asyncio
+import logging
+from collections import deque
+from pyrogram.errors import FloodWait
+from info import BROADCAST_RATE, BROADCAST_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.resume_at = 0
+        self.lock = asyncio.Lock()
+
+    def pause(self, seconds):
+        # FloodWait is per bot, so every worker sending through this bucket waits
+        self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+        self.tokens = 0
+        self.updated = self.resume_at
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.resume_at:
+                    await asyncio.sleep(self.resume_at - now)
+                    continue
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class Broadcaster:
+    """Send to many chats with a pool of workers sharing one token bucket.
+
+    ``send(client, chat_id)`` returns a status string and lets FloodWait through,
+    the bucket is paused and the chat is retried.
+    ``run`` takes ``(key, chat_id)`` pairs in key order, ``cursor`` is the last key
+    below which every chat is finished so a job can be resumed from it.
+    """
+
+    # removed from the db; "Invalid" (PeerIdInvalid and the like) is only reported
+    DEAD = ("Blocked", "Deleted", "Removed")
+
+    def __init__(
+        self,
+        send,
+        client,
+        rate=BROADCAST_RATE,
+        workers=BROADCAST_WORKERS,
+        retries=3,
+        done=0,
+        stats=None,
+        cursor=None,
+    ):
+        self.send = send
+        self.client = client
+        self.bucket = TokenBucket(rate)
+        self.workers = workers
+        self.retries = retries
+        self.cancelled = False
+        self.done = done
+        self.stats = dict(stats or {})
+        self.cursor = cursor
+        self.dead = []
+        self.order = deque()
+        self.finished = set()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def pop_dead(self):
+        dead, self.dead = self.dead, []
+        return dead
+
+    def _complete(self, key):
+        self.finished.add(key)
+        while self.order and self.order[0] in self.finished:
+            self.cursor = self.order.popleft()
+            self.finished.discard(self.cursor)
+
+    async def _deliver(self, chat_id):
+        for _ in range(self.retries + 1):
+            await self.bucket.acquire()
+            try:
+                return await self.send(self.client, chat_id)
+            except FloodWait as e:
+                logger.warning(f"FloodWait of {e.value}s while broadcasting")
+                self.bucket.pause(e.value)
+        return "Error"
+
+    async def _worker(self, queue):
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                if self.cancelled:
+                    continue
+                key, chat_id = item
+                try:
+                    sts = await self._deliver(chat_id)
+                except Exception:
+                    logger.exception(f"Broadcast to {chat_id} failed")
+                    sts = "Error"
+                self.stats[sts] = self.stats.get(sts, 0) + 1
+                if sts in self.DEAD:
+                    self.dead.append(chat_id)
+                self.done += 1
+                self._complete(key)
+            finally:
+                queue.task_done()
+
+    async def run(self, items):
+        queue = asyncio.Queue(maxsize=self.workers * 2)
+        workers = [
+            asyncio.create_task(self._worker(queue)) for _ in range(self.workers)
+        ]
+        try:
+            async for key, chat_id in items:
+                if self.cancelled:
+                    break
+                self.order.append(key)
+                await queue.put((key, chat_id))
+        finally:
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers, return_exceptions=True)
+        return self.stats
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from pyrogram.errors import FloodWait
+from pyrogram.file_id import FileId, FileType
+from pyrogram.types import InputMediaDocument, InputMediaVideo
+from Jisshu.util.broadcast import TokenBucket
+from info import SEND_ALL_RATE, SEND_ALL_WORKERS
+
+logger = logging.getLogger(__name__)
+
+ALBUM_SIZE = 10
+
+
+async def deliver(bucket, send, retries=3):
+    for _ in range(retries):
+        await bucket.acquire()
+        try:
+            return await send()
+        except FloodWait as e:
+            bucket.pause(e.value)
+    raise RuntimeError(f"Still flood limited after {retries} tries")
+
+
+def album_kind(file):
+    """InputMedia class a file can go into an album as, None for audio and the rest."""
+    file_type = FileId.decode(file.file_id).file_type
+    # mkv files are often stored as documents even though their mime type is video/*
+    if file_type == FileType.VIDEO:
+        return InputMediaVideo
+    if file_type == FileType.DOCUMENT:
+        return InputMediaDocument
+    return None
+
+
+def album_batches(files):
+    # an album holds 2-10 items of one kind, videos and documents can't be
+    # mixed and audio only goes with audio, so audio is sent on its own
+    batch = []
+    for file in files:
+        kind = album_kind(file)
+        if batch and (
+            len(batch) == ALBUM_SIZE or kind is None or album_kind(batch[-1]) != kind
+        ):
+            yield batch
+            batch = []
+        batch.append(file)
+        if kind is None:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# one bucket and send limit per bot, shared by every chat it is sending to
+limits = {}
+
+
+def client_limits(client):
+    if client not in limits:
+        limits[client] = (
+            TokenBucket(SEND_ALL_RATE),
+            asyncio.Semaphore(SEND_ALL_WORKERS),
+        )
+    return limits[client]
+
+
+async def send_files(client, chat_id, files, caption, markup=None, album=False):
+    """Send stored files to one chat in order, returns the sent messages.
+
+    ``caption(file)`` and ``markup(file)`` build the caption and buttons of a file.
+    A chat gets its files one after another; chats are served side by side,
+    at most SEND_ALL_WORKERS sends at a time and SEND_ALL_RATE per second for
+    the bot, paused on FloodWait. With ``album`` files go out as media groups,
+    which can't carry buttons.
+    """
+    bucket, semaphore = client_limits(client)
+
+    def single(file):
+        async def send():
+            return [
+                await client.send_cached_media(
+                    chat_id=chat_id,
+                    file_id=file.file_id,
+                    caption=caption(file),
+                    reply_markup=markup(file) if markup else None,
+                )
+            ]
+
+        return send
+
+    def group(batch):
+        async def send():
+            return await client.send_media_group(
+                chat_id,
+                [album_kind(file)(file.file_id, caption=caption(file)) for file in batch],
+            )
+
+        return send
+
+    if album:
+        jobs = [
+            group(batch) if len(batch) > 1 else single(batch[0])
+            for batch in album_batches(files)
+        ]
+    else:
+        jobs = [single(file) for file in files]
+
+    sent = []
+    for send in jobs:
+        try:
+            async with semaphore:
+                sent += await deliver(bucket, send)
+        except Exception as e:
+            logger.error(f"Sending file to {chat_id} failed: {e}")
+    return sent
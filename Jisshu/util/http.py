@@ -0,0 +1,25 @@
+import aiohttp
+
+# One pooled session for all outgoing HTTP requests, so connections and DNS
+# lookups are reused instead of paying a new handshake on every request.
+
+session = None
+
+
+def get_session():
+    global session
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return session
+
+
+async def close_session():
+    global session
+    if session is not None and not session.closed:
+        await session.close()
+    session = None
@@ -1,8 +1,8 @@
 import asyncio
 import logging
-import aiohttp
 import traceback
 from info import *
+from Jisshu.util.http import get_session
 
 
 async def ping_server():
@@ -10,12 +10,9 @@ async def ping_server():
     while True:
         await asyncio.sleep(sleep_time)
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as session:
-                async with session.get(URL) as resp:
-                    logging.info("Pinged server with response: {}".format(resp.status))
-        except TimeoutError:
+            async with get_session().get(URL, timeout=10) as resp:
+                logging.info("Pinged server with response: {}".format(resp.status))
+        except asyncio.TimeoutError:
             logging.warning("Couldn't connect to the site URL..!")
         except Exception:
             traceback.print_exc()
@@ -0,0 +1,52 @@
+import time
+import inspect
+import logging
+import importlib
+from pathlib import Path
+from pyrogram.handlers.handler import Handler
+from Jisshu.util.metrics import timed_handler
+
+logger = logging.getLogger(__name__)
+
+
+def load_plugins(client, root="plugins", exclude=(), report=10):
+    """Import every module under ``root`` once, in path order, and register its handlers.
+
+    Used instead of pyrogram's ``plugins`` option so each plugin is imported a
+    single time and slow imports show up in the log.
+    """
+    timings = []
+    handlers = 0
+    for path in sorted(Path(root).rglob("*.py")):
+        if path.stem == "__init__":
+            continue
+        name = ".".join(path.with_suffix("").parts)
+        if name in exclude:
+            continue
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(name)
+        except Exception:
+            logger.exception(f"Failed importing plugin {name}")
+            continue
+        timings.append((time.perf_counter() - start, name))
+        for obj in list(vars(module).values()):
+            # functions imported from another plugin are registered by their own module
+            if getattr(obj, "__module__", None) != name:
+                continue
+            for handler, group in getattr(obj, "handlers", []):
+                if not isinstance(handler, Handler) or not isinstance(group, int):
+                    continue
+                if inspect.iscoroutinefunction(handler.callback) and not getattr(
+                    handler.callback, "timed", False
+                ):
+                    handler.callback = timed_handler(handler.callback)
+                client.add_handler(handler, group)
+                handlers += 1
+    total = sum(took for took, _ in timings)
+    logger.info(
+        f"Loaded {len(timings)} plugins ({handlers} handlers) in {total:.2f}s"
+    )
+    for took, name in sorted(timings, reverse=True)[:report]:
+        logger.info(f"  {took * 1000:8.1f} ms  {name}")
+    return timings
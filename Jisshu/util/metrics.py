@@ -0,0 +1,198 @@
+import time
+import asyncio
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from pymongo import monitoring
+
+# Minimal Prometheus text exporter, served by the web server on /metrics
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+registry = []
+# pymongo calls the listeners from its own threads while /metrics renders on
+# the event loop, so every update and every read of the values holds this
+lock = threading.Lock()
+
+
+def format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    text = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in pairs
+    )
+    return "{" + text + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labels = name, help, labels
+        self.values = defaultdict(float)
+        registry.append(self)
+
+    def inc(self, *labels, amount=1):
+        with lock:
+            self.values[labels] += amount
+
+    def samples(self):
+        with lock:
+            values = list(self.values.items())
+        for labels, value in values:
+            yield self.name + format_labels(self.labels, labels), value
+
+
+class Gauge(Counter):
+    """``collect`` returns ``{label_values: value}`` and is read on every scrape."""
+
+    kind = "gauge"
+
+    def __init__(self, name, help, labels=(), collect=None):
+        super().__init__(name, help, labels)
+        self.collect = collect
+
+    def set(self, value, *labels):
+        with lock:
+            self.values[labels] = value
+
+    def samples(self):
+        if self.collect:
+            values = dict(self.collect())
+            with lock:
+                self.values = values
+        yield from super().samples()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=BUCKETS):
+        self.name, self.help, self.labels = name, help, labels
+        self.buckets = buckets
+        self.counts = {}
+        self.sums = defaultdict(float)
+        registry.append(self)
+
+    def observe(self, value, *labels):
+        with lock:
+            counts = self.counts.get(labels)
+            if counts is None:
+                counts = self.counts[labels] = [0] * (len(self.buckets) + 1)
+            counts[bisect_left(self.buckets, value)] += 1
+            self.sums[labels] += value
+
+    def samples(self):
+        with lock:
+            snapshot = [
+                (labels, list(counts), self.sums[labels])
+                for labels, counts in self.counts.items()
+            ]
+        for labels, counts, total_sum in snapshot:
+            total = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                total += count
+                yield self.name + "_bucket" + format_labels(
+                    self.labels, labels, ("le", bound)
+                ), total
+            yield self.name + "_sum" + format_labels(self.labels, labels), total_sum
+            yield self.name + "_count" + format_labels(self.labels, labels), total
+
+
+def render():
+    lines = []
+    for metric in registry:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines += [f"{name} {value}" for name, value in metric.samples()]
+    return "\n".join(lines) + "\n"
+
+
+loop_lag = Histogram(
+    "bot_event_loop_lag_seconds",
+    "Delay between when a loop callback was due and when it ran",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+handler_latency = Histogram(
+    "bot_handler_seconds", "Time spent in update handlers", ("handler",)
+)
+handler_errors = Counter(
+    "bot_handler_errors_total", "Handlers that raised", ("handler",)
+)
+mongo_latency = Histogram(
+    "bot_mongo_command_seconds", "MongoDB command durations", ("command", "status")
+)
+telegram_latency = Histogram(
+    "bot_telegram_api_seconds",
+    "Telegram API call durations",
+    ("client", "method", "status"),
+)
+
+
+async def monitor_loop_lag(interval=0.5):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        loop_lag.observe(max(0, time.perf_counter() - start - interval))
+
+
+def timed_handler(callback):
+    name = f"{callback.__module__}.{callback.__name__}"
+
+    async def wrapper(client, *args):
+        start = time.perf_counter()
+        try:
+            return await callback(client, *args)
+        except Exception as e:
+            # Stop/ContinuePropagation are control flow, not failures
+            if not type(e).__name__.endswith("Propagation"):
+                handler_errors.inc(name)
+            raise
+        finally:
+            handler_latency.observe(time.perf_counter() - start, name)
+
+    wrapper.timed = True
+    return wrapper
+
+
+def instrument_client(client, name):
+    """Time every raw API call made through ``client``."""
+    invoke = client.invoke
+    if getattr(invoke, "timed", False):
+        return
+
+    async def timed_invoke(query, *args, **kwargs):
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            return await invoke(query, *args, **kwargs)
+        except Exception as e:
+            status = type(e).__name__
+            raise
+        finally:
+            telegram_latency.observe(
+                time.perf_counter() - start, name, type(query).__name__, status
+            )
+
+    timed_invoke.timed = True
+    client.invoke = timed_invoke
+
+
+class CommandTimer(monitoring.CommandListener):
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        mongo_latency.observe(event.duration_micros / 1e6, event.command_name, "ok")
+
+    def failed(self, event):
+        mongo_latency.observe(
+            event.duration_micros / 1e6, event.command_name, "error"
+        )
+
+
+command_timer = CommandTimer()
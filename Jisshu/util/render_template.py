@@ -4,11 +4,11 @@ from utils import temp
 from Jisshu.bot import JisshuBot
 from Jisshu.util.human_readable import humanbytes
 from Jisshu.util.file_properties import get_file_ids
+from Jisshu.util.http import get_session
 from Jisshu.server.exceptions import InvalidHash
 from Template import jisshu_template
 import urllib.parse
 import logging
-import aiohttp
 
 
 async def render_page(id, secure_hash, src=None):
@@ -32,9 +32,9 @@ async def render_page(id, secure_hash, src=None):
         template_file = "Jisshu/template/req.html"
     else:
         template_file = "Jisshu/template/dl.html"
-        async with aiohttp.ClientSession() as s:
-            async with s.get(src) as u:
-                file_size = humanbytes(int(u.headers.get("Content-Length")))
+        # the stream route answers HEAD, no need to open the file body
+        async with get_session().head(src) as u:
+            file_size = humanbytes(int(u.headers.get("Content-Length")))
 
     with open(template_file) as f:
         template = jinja2.Template(f.read())
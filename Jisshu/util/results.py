@@ -0,0 +1,105 @@
+import math
+from collections import OrderedDict
+from pyrogram.types import InlineKeyboardButton
+from database.config_db import mdb
+from utils import temp, get_size, formate_file_name
+from info import MAX_BTN
+
+# labels of files indexed before display_name/size_label were stored,
+# file_id -> (display name, size label)
+LABEL_CACHE_SIZE = 5000
+labels = OrderedDict()
+
+
+def file_label(file):
+    if file.display_name and file.size_label:
+        return file.display_name, file.size_label
+    label = labels.get(file.file_id)
+    if label is None:
+        label = labels[file.file_id] = (
+            formate_file_name(file.file_name),
+            get_size(file.file_size),
+        )
+        if len(labels) > LABEL_CACHE_SIZE:
+            labels.popitem(last=False)
+    else:
+        labels.move_to_end(file.file_id)
+    return label
+
+
+def file_buttons(files, chat_id, start=1, link_mode=False, user_id=None, icon="🔗"):
+    """Returns ``(btn, links)`` for one page of results.
+
+    In link mode the files are listed in the caption and ``btn`` is empty,
+    otherwise each file gets a button; a deep link, or a ``cfiles`` callback
+    when ``user_id`` is given.
+    """
+    if link_mode:
+        links = ""
+        for file_num, file in enumerate(files, start=start):
+            name, size = file_label(file)
+            links += f"""<b>\n\n{file_num}. <a href=https://telegram.dog/{temp.U_NAME}?start=file_{chat_id}_{file.file_id}>[{size}] {name}</a></b>"""
+        return [], links
+    btn = []
+    for file in files:
+        name, size = file_label(file)
+        if user_id is None:
+            target = dict(
+                url=f"https://telegram.dog/{temp.U_NAME}?start=file_{chat_id}_{file.file_id}"
+            )
+        else:
+            target = dict(callback_data=f"cfiles#{user_id}#{file.file_id}")
+        btn.append([InlineKeyboardButton(text=f"{icon} {size}≽ {name}", **target)])
+    return btn, ""
+
+
+def send_all_row(key):
+    return [
+        InlineKeyboardButton("📥 sᴇɴᴅ ᴀʟʟ ғɪʟᴇs 📥", callback_data=f"send_all#{key}")
+    ]
+
+
+def facet_row(key, offset, req):
+    return [
+        InlineKeyboardButton("ǫᴜᴀʟɪᴛʏ", callback_data=f"qualities#{key}#{offset}#{req}"),
+        InlineKeyboardButton("ꜱᴇᴀꜱᴏɴ", callback_data=f"seasons#{key}#{offset}#{req}"),
+        InlineKeyboardButton(
+            "ʟᴀɴɢᴜᴀɢᴇ", callback_data=f"languages#{key}#{offset}#{req}"
+        ),
+    ]
+
+
+def facet_nav(route, value, key, offset, n_offset, total, orginal_offset, req):
+    """Pagination rows of a season/year/quality/language result page."""
+    max_btn = int(MAX_BTN)
+    pages = InlineKeyboardButton(
+        f"{math.ceil(offset / max_btn) + 1}/{math.ceil(total / max_btn)}",
+        callback_data="pages",
+    )
+    back = InlineKeyboardButton(
+        "⋞ ʙᴀᴄᴋ",
+        callback_data=f"{route}#{value}#{key}#{offset - max_btn}#{orginal_offset}#{req}",
+    )
+    nxt = InlineKeyboardButton(
+        "ɴᴇxᴛ ⋟",
+        callback_data=f"{route}#{value}#{key}#{n_offset}#{orginal_offset}#{req}",
+    )
+    if n_offset == 0:
+        row = [back, pages]
+    elif offset == 0:
+        row = [pages, nxt]
+    else:
+        row = [back, pages, nxt]
+    main = InlineKeyboardButton(
+        text="⋞ ʙᴀᴄᴋ ᴛᴏ ᴍᴀɪɴ ᴘᴀɢᴇ",
+        callback_data=f"next_{req}_{key}_{orginal_offset}",
+    )
+    return [row, [main]]
+
+
+async def ads_footer():
+    ads, ads_name, _ = await mdb.get_advirtisment()
+    if ads is None or ads_name is None:
+        return ""
+    ads_url = f"https://telegram.dog/{temp.U_NAME}?start=ads"
+    return f"\n━━━━━━━━━━━━━━━━━━\n <b><a href={ads_url}>{ads_name}</a></b> \n━━━━━━━━━━━━━━━━━━"
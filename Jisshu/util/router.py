@@ -0,0 +1,56 @@
+import time
+from Jisshu.util.metrics import Counter, Histogram
+
+callback_latency = Histogram(
+    "bot_callback_seconds", "Time spent per callback route", ("route",)
+)
+callback_unrouted = Counter(
+    "bot_callback_unrouted_total", "Callback queries without a matching route"
+)
+
+
+class CallbackRouter:
+    """Maps callback data to handlers with dict lookups instead of a filter chain.
+
+    Exact routes are one lookup. Prefix routes are looked up by slicing the data
+    to each registered prefix length, longest first, so the longest matching
+    prefix wins no matter in which order the routes were added.
+    """
+
+    def __init__(self):
+        self.exact = {}
+        self.prefixes = {}
+        self.lengths = []
+
+    def route(self, data, prefix=False):
+        def decorator(func):
+            if prefix:
+                self.prefixes[data] = func
+                self.lengths = sorted({len(p) for p in self.prefixes}, reverse=True)
+            else:
+                self.exact[data] = func
+            return func
+
+        return decorator
+
+    def resolve(self, data):
+        func = self.exact.get(data)
+        if func:
+            return data, func
+        for length in self.lengths:
+            func = self.prefixes.get(data[:length])
+            if func:
+                return data[:length], func
+        return None, None
+
+    async def dispatch(self, client, query):
+        name, func = self.resolve(query.data or "")
+        if not func:
+            callback_unrouted.inc()
+            return False
+        start = time.perf_counter()
+        try:
+            await func(client, query)
+        finally:
+            callback_latency.observe(time.perf_counter() - start, name)
+        return True
@@ -1,7 +1,4 @@
-import sys
-import glob
-import importlib
-from pathlib import Path
+import time
 from pyrogram import idle
 import logging
 import logging.config
@@ -20,7 +17,7 @@ logging.getLogger("aiohttp.web").setLevel(logging.ERROR)
 
 from pyrogram import __version__
 from pyrogram.raw.all import layer
-from database.ia_filterdb import Media
+from database.ia_filterdb import migrate_file_labels
 from database.users_chats_db import db
 from info import *
 from utils import temp
@@ -28,70 +25,117 @@ from Script import script
 from datetime import date, datetime
 import pytz
 from aiohttp import web
-from plugins import web_server, check_expired_premium
+from plugins import web_server, check_expired_premium, refresh_banned
+from plugins.broadcast import resume_broadcasts
+from plugins.channel import announce_queue
+from Jisshu.util.autodelete import auto_deleter
+from database.config_db import mdb
+from database.indexes import ensure_indexes
 import pyrogram.utils
 import asyncio
 from Jisshu.bot import JisshuBot
 from Jisshu.util.keepalive import ping_server
+from Jisshu.util.http import close_session
 from Jisshu.bot.clients import initialize_clients
+from Jisshu.bot import multi_clients
+from Jisshu.util.metrics import instrument_client, monitor_loop_lag
+from Jisshu.util.loader import load_plugins
+from Jisshu import StartTime
 
-ppath = "plugins/*.py"
-files = glob.glob(ppath)
+# the font tables are imported by plugins.helper.font when first used
+load_plugins(JisshuBot, "plugins", exclude=["plugins.helper.fotnt_string"])
 JisshuBot.start()
 loop = asyncio.get_event_loop()
 
 pyrogram.utils.MIN_CHANNEL_ID = -1009147483647
 
 
+startup_times = {}
+
+
+async def step(name, coro, critical=True):
+    start = time.perf_counter()
+    try:
+        return await coro
+    except Exception:
+        logging.exception(f"Startup step {name} failed")
+        if critical:
+            raise
+    finally:
+        startup_times[name] = time.perf_counter() - start
+        if not critical:
+            # background steps finish after the ready line
+            logging.info(f"Startup step {name} took {startup_times[name]:.2f}s")
+
+
+async def start_web_server():
+    app = web.AppRunner(await web_server())
+    await app.setup()
+    bind_address = "0.0.0.0"
+    await web.TCPSite(app, bind_address, PORT).start()
+
+
+async def load_banned():
+    temp.BANNED_USERS, temp.BANNED_CHATS = await db.get_banned()
+
+
+async def send_restart_logs(me):
+    tz = pytz.timezone("Asia/Kolkata")
+    today = date.today()
+    now = datetime.now(tz)
+    restart_time = now.strftime("%H:%M:%S %p")
+    await asyncio.gather(
+        JisshuBot.send_message(
+            chat_id=LOG_CHANNEL,
+            text=script.RESTART_TXT.format(me.mention, today, restart_time),
+        ),
+        JisshuBot.send_message(
+            chat_id=SUPPORT_GROUP, text=f"<b>{me.mention} ʀᴇsᴛᴀʀᴛᴇᴅ 🤖</b>"
+        ),
+    )
+
+
 async def Jisshu_start():
     print("\n")
     print("Credit - Telegram Pro Botz")
-    bot_info = await JisshuBot.get_me()
-    JisshuBot.username = bot_info.username
-    await initialize_clients()
-    for name in files:
-        with open(name) as a:
-            patt = Path(a.name)
-            plugin_name = patt.stem.replace(".py", "")
-            plugins_dir = Path(f"plugins/{plugin_name}.py")
-            import_path = "plugins.{}".format(plugin_name)
-            spec = importlib.util.spec_from_file_location(import_path, plugins_dir)
-            load = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(load)
-            sys.modules["plugins." + plugin_name] = load
-            print("JisshuBot Imported => " + plugin_name)
-    if ON_HEROKU:
-        asyncio.create_task(ping_server())
-    b_users, b_chats = await db.get_banned()
-    temp.BANNED_USERS = b_users
-    temp.BANNED_CHATS = b_chats
-    await Media.ensure_indexes()
-    me = await JisshuBot.get_me()
+    # health checks only need the web server, so it binds before anything else
+    await step("web server", start_web_server())
+    # pyrogram already fetched the bot user in start()
+    me = JisshuBot.me or await JisshuBot.get_me()
+    await asyncio.gather(
+        step("clients", initialize_clients()),
+        step("banned lists", load_banned()),
+    )
+    for client_id, client in multi_clients.items():
+        instrument_client(client, str(client_id))
     temp.ME = me.id
     temp.U_NAME = me.username
     temp.B_NAME = me.first_name
     temp.B_LINK = me.mention
     JisshuBot.username = "@" + me.username
+    asyncio.create_task(monitor_loop_lag())
+    if ON_HEROKU:
+        asyncio.create_task(ping_server())
     JisshuBot.loop.create_task(check_expired_premium(JisshuBot))
+    JisshuBot.loop.create_task(refresh_banned())
+    JisshuBot.loop.create_task(resume_broadcasts(JisshuBot))
+    JisshuBot.loop.create_task(auto_deleter.run(JisshuBot))
+    JisshuBot.loop.create_task(announce_queue.run(JisshuBot))
+    JisshuBot.loop.create_task(mdb.flush_top_messages_forever())
+    # not needed to answer users, finish in the background
+    asyncio.create_task(step("indexes", ensure_indexes(), critical=False))
+    asyncio.create_task(step("file labels", migrate_file_labels(), critical=False))
+    asyncio.create_task(step("restart logs", send_restart_logs(me), critical=False))
     logging.info(
         f"{me.first_name} with for Pyrogram v{__version__} (Layer {layer}) started on {me.username}."
     )
     logging.info(script.LOGO)
-    tz = pytz.timezone("Asia/Kolkata")
-    today = date.today()
-    now = datetime.now(tz)
-    time = now.strftime("%H:%M:%S %p")
-    await JisshuBot.send_message(
-        chat_id=LOG_CHANNEL, text=script.RESTART_TXT.format(me.mention, today, time)
-    )
-    await JisshuBot.send_message(
-        chat_id=SUPPORT_GROUP, text=f"<b>{me.mention} ʀᴇsᴛᴀʀᴛᴇᴅ 🤖</b>"
+    breakdown = ", ".join(f"{name} {took:.2f}s" for name, took in startup_times.items())
+    logging.info(
+        f"Ready in {time.time() - StartTime:.2f}s after process start ({breakdown})"
     )
-    app = web.AppRunner(await web_server())
-    await app.setup()
-    bind_address = "0.0.0.0"
-    await web.TCPSite(app, bind_address, PORT).start()
     await idle()
+    await close_session()
 
 
 if __name__ == "__main__":
@@ -1,43 +1,208 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-from info import DATABASE_URI
-from datetime import datetime
+import time
+import heapq
+import asyncio
+import logging
+from collections import Counter
+from pymongo import UpdateOne
+from database.connections import get_client
+from info import (
+    DATABASE_URI,
+    SEARCH_FLUSH_INTERVAL,
+    TOP_SEARCH_CAPACITY,
+    ADS_CACHE_TTL,
+)
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# day of search counts copied from the old per-user history, sorts before every real day
+LEGACY_DAY = "0000-00-00"
+
+
+class SpaceSaving:
+    """Heavy hitters in at most ``capacity`` counters (Space-Saving).
+
+    A new item takes over the smallest counter and inherits its count, so an
+    item that becomes popular later can still climb the board. Counts are an
+    upper bound, over by at most the inherited value.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = {}
+        # (count, item) with stale entries skipped when popped
+        self.heap = []
+
+    def add(self, item, count=1):
+        if item not in self.counts and len(self.counts) >= self.capacity:
+            floor, victim = self._pop_min()
+            del self.counts[victim]
+            count += floor
+        self.counts[item] = self.counts.get(item, 0) + count
+        heapq.heappush(self.heap, (self.counts[item], item))
+        if len(self.heap) > self.capacity * 4:
+            self.heap = [(c, i) for i, c in self.counts.items()]
+            heapq.heapify(self.heap)
+
+    def _pop_min(self):
+        while True:
+            count, item = heapq.heappop(self.heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+
+class TopSearches:
+    """Approximate most searched queries for the day, last 7 days and all time.
+
+    Every window is a Space-Saving counter of ``capacity`` entries, so memory
+    stays flat and new queries can still make it onto the board. Ranked lists
+    are cached until the next search comes in.
+    """
+
+    WINDOWS = ("day", "week", "all")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.daily = {}
+        self.all_time = SpaceSaving(capacity)
+        self.ranked = {}
+
+    def add_day(self, text, day, count=1):
+        if day not in self.daily:
+            self.daily[day] = SpaceSaving(self.capacity)
+            week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+            for old in [d for d in self.daily if d <= week_ago]:
+                del self.daily[old]
+        self.daily[day].add(text, count)
+        self.ranked.clear()
+
+    def add(self, text, day, count=1):
+        self.add_day(text, day, count)
+        self.all_time.add(text, count)
+
+    def top(self, limit, window="all"):
+        if window not in self.ranked:
+            if window == "day":
+                today = self.daily.get(datetime.now().strftime("%Y-%m-%d"))
+                counter = Counter(today.counts if today else {})
+            elif window == "week":
+                counter = Counter()
+                for day in self.daily.values():
+                    counter.update(day.counts)
+            else:
+                counter = Counter(self.all_time.counts)
+            self.ranked[window] = [
+                text for text, _ in counter.most_common(self.capacity)
+            ]
+        return self.ranked[window][:limit]
 
 
 class Database:
     def __init__(self, uri, db_name):
-        self.client = AsyncIOMotorClient(uri)
+        self.client = get_client(uri)
         self.db = self.client[db_name]
         self.col = self.db.user
         self.config_col = self.db.configuration
+        # one counter per (query, day), filled from search_buffer
+        self.search_col = self.db.search_counts
+        self.search_buffer = Counter()
+        self.top_searches = TopSearches(TOP_SEARCH_CAPACITY)
+        # advertisement doc cached for ADS_CACHE_TTL, impressions are
+        # counted here and written with one $inc by flush_ad_impressions
+        self.ads_cache = None
+        self.ads_loaded_at = 0
+        self.ads_seen = 0
 
-    async def update_top_messages(self, user_id, message_text):
-        user = await self.col.find_one(
-            {"user_id": user_id, "messages.text": message_text}
-        )
+    def update_top_messages(self, message_text):
+        # only buffered here, flush_top_messages writes it out in bulk
+        text = " ".join(str(message_text).split())[:100]
+        if not text or text.startswith("/"):
+            return
+        day = datetime.now().strftime("%Y-%m-%d")
+        self.search_buffer[(text, day)] += 1
+        self.top_searches.add(text, day)
 
-        if not user:
-            await self.col.update_one(
-                {"user_id": user_id},
-                {"$push": {"messages": {"text": message_text, "count": 1}}},
-                upsert=True,
-            )
-        else:
-            await self.col.update_one(
-                {"user_id": user_id, "messages.text": message_text},
-                {"$inc": {"messages.$.count": 1}},
-            )
+    async def backfill_search_counts(self):
+        """One-off copy of the old per-user search history into search_counts.
 
-    async def get_top_messages(self, limit=30):
+        Those counts have no date, so they are filed under LEGACY_DAY and only
+        show up in the all time board.
+        """
+        if await self.get_configuration_value("search_counts_backfilled"):
+            return
         pipeline = [
             {"$unwind": "$messages"},
             {"$group": {"_id": "$messages.text", "count": {"$sum": "$messages.count"}}},
+        ]
+        counts = Counter()
+        async for doc in self.col.aggregate(pipeline, allowDiskUse=True):
+            text = " ".join(str(doc["_id"]).split())[:100]
+            if text and not text.startswith("/"):
+                counts[text] += doc["count"]
+        requests = [
+            UpdateOne(
+                {"query": text, "day": LEGACY_DAY},
+                # $set so an interrupted backfill can simply run again
+                {"$set": {"count": count}},
+                upsert=True,
+            )
+            for text, count in counts.items()
+        ]
+        for i in range(0, len(requests), 1000):
+            await self.search_col.bulk_write(requests[i : i + 1000], ordered=False)
+        await self.update_configuration("search_counts_backfilled", True)
+        logger.info("Copied the old search history into search_counts")
+
+    async def load_top_messages(self):
+        await self.backfill_search_counts()
+        week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+        async for doc in self.search_col.find({"day": {"$gt": week_ago}}):
+            self.top_searches.add_day(doc["query"], doc["day"], doc["count"])
+        pipeline = [
+            {"$group": {"_id": "$query", "count": {"$sum": "$count"}}},
             {"$sort": {"count": -1}},
-            {"$limit": limit},
+            {"$limit": TOP_SEARCH_CAPACITY},
+        ]
+        async for doc in self.search_col.aggregate(pipeline, allowDiskUse=True):
+            self.top_searches.all_time.add(doc["_id"], doc["count"])
+        self.top_searches.ranked.clear()
+
+    async def flush_top_messages(self):
+        if not self.search_buffer:
+            return
+        buffer, self.search_buffer = self.search_buffer, Counter()
+        requests = [
+            UpdateOne(
+                {"query": query, "day": day}, {"$inc": {"count": count}}, upsert=True
+            )
+            for (query, day), count in buffer.items()
         ]
-        results = await self.col.aggregate(pipeline).to_list(limit)
-        return [result["_id"] for result in results]
+        try:
+            await self.search_col.bulk_write(requests, ordered=False)
+        except Exception:
+            logger.exception("Saving search counts failed")
+            self.search_buffer.update(buffer)
+
+    async def flush_top_messages_forever(self):
+        try:
+            await self.load_top_messages()
+        except Exception:
+            logger.exception("Loading top searches failed")
+        while True:
+            await asyncio.sleep(SEARCH_FLUSH_INTERVAL)
+            await self.flush_top_messages()
+            try:
+                await self.flush_ad_impressions()
+            except Exception:
+                logger.exception("Saving ad impressions failed")
+
+    async def get_top_messages(self, limit=30, window="all"):
+        return self.top_searches.top(limit, window)
 
     async def delete_all_messages(self):
+        self.search_buffer.clear()
+        self.top_searches = TopSearches(TOP_SEARCH_CAPACITY)
+        await self.search_col.delete_many({})
         await self.col.delete_many({})
 
     def create_configuration_data(self, advertisement=None):
@@ -70,18 +235,54 @@ class Database:
         await self.config_col.update_one(
             {}, {"$set": {"advertisement": advertisement}}, upsert=True
         )
+        self.ads_seen = 0
+        self._set_ads_cache(advertisement)
 
     async def update_advirtisment_impression(self, impression=None):
         await self.config_col.update_one(
             {}, {"$set": {"advertisement.impression_count": impression}}, upsert=True
         )
+        self.ads_seen = 0
+        self.ads_loaded_at = 0
 
-    async def get_advirtisment(self):
-        configuration = await self.config_col.find_one({})
-        if not configuration:
-            await self.config_col.insert_one(self.create_configuration_data())
+    def _set_ads_cache(self, advertisement):
+        self.ads_cache = advertisement or None
+        self.ads_loaded_at = time.monotonic()
+
+    async def _get_ads(self):
+        if time.monotonic() - self.ads_loaded_at > ADS_CACHE_TTL:
             configuration = await self.config_col.find_one({})
-        advertisement = configuration.get("advertisement", False)
+            if not configuration:
+                await self.config_col.insert_one(self.create_configuration_data())
+                configuration = await self.config_col.find_one({})
+            advertisement = configuration.get("advertisement", False)
+            if advertisement and advertisement.get("impression_count") is not None:
+                # impressions not flushed yet
+                advertisement["impression_count"] -= self.ads_seen
+            self._set_ads_cache(advertisement)
+        return self.ads_cache
+
+    def decrement_advirtisment_impression(self):
+        if self.ads_cache and self.ads_cache.get("impression_count") is not None:
+            self.ads_cache["impression_count"] -= 1
+            self.ads_seen += 1
+
+    async def flush_ad_impressions(self):
+        if not self.ads_seen:
+            return
+        seen, self.ads_seen = self.ads_seen, 0
+        try:
+            await self.config_col.update_one(
+                {"advertisement.impression_count": {"$type": "number"}},
+                {"$inc": {"advertisement.impression_count": -seen}},
+            )
+        except Exception:
+            # written with the next flush
+            self.ads_seen += seen
+            raise
+
+    async def get_advirtisment(self):
+        advertisement = await self._get_ads()
         if advertisement:
             return (
                 advertisement.get("ads_string"),
@@ -91,16 +292,16 @@ class Database:
         return None, None, None
 
     async def reset_advertisement_if_expired(self):
-        configuration = await self.config_col.find_one({})
-        if configuration:
-            advertisement = configuration.get("advertisement", False)
-            if advertisement:
-                impression_count = advertisement.get("impression_count", 0)
-                expiry = advertisement.get("expiry", None)
-                if (impression_count == 0) or (expiry and datetime.now() > expiry):
-                    await self.config_col.update_one(
-                        {}, {"$set": {"advertisement": None}}
-                    )
+        advertisement = await self._get_ads()
+        if advertisement:
+            impression_count = advertisement.get("impression_count", 0)
+            expiry = advertisement.get("expiry", None)
+            if (impression_count is not None and impression_count <= 0) or (
+                expiry and datetime.now() > expiry
+            ):
+                self.ads_seen = 0
+                await self.config_col.update_one({}, {"$set": {"advertisement": None}})
+                self._set_ads_cache(None)
 
     async def update_configuration(self, key, value):
         try:
@@ -0,0 +1,111 @@
+import threading
+from collections import defaultdict
+from pymongo import monitoring, ReadPreference
+from motor.motor_asyncio import AsyncIOMotorClient
+from info import (
+    MONGO_MAX_POOL_SIZE,
+    MONGO_MIN_POOL_SIZE,
+    MONGO_COMPRESSORS,
+    SEARCH_READ_PREFERENCE,
+)
+from Jisshu.util.metrics import Gauge, command_timer
+
+
+class PoolStats(monitoring.ConnectionPoolListener):
+    """Connection pool usage per server, read by /metrics.
+
+    The events come from pymongo's threads, hence the lock.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.open = defaultdict(int)
+        self.in_use = defaultdict(int)
+        self.waiting = defaultdict(int)
+        self.checkout_failed = defaultdict(int)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self.lock:
+            self.open[event.address] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self.lock:
+            self.open[event.address] -= 1
+
+    def connection_check_out_started(self, event):
+        with self.lock:
+            self.waiting[event.address] += 1
+
+    def connection_check_out_failed(self, event):
+        with self.lock:
+            self.waiting[event.address] -= 1
+            self.checkout_failed[event.address] += 1
+
+    def connection_checked_out(self, event):
+        with self.lock:
+            self.waiting[event.address] -= 1
+            self.in_use[event.address] += 1
+
+    def connection_checked_in(self, event):
+        with self.lock:
+            self.in_use[event.address] -= 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                f"{host}:{port}": {
+                    "open": self.open[(host, port)],
+                    "in_use": self.in_use[(host, port)],
+                    "waiting": self.waiting[(host, port)],
+                    "checkout_failed": self.checkout_failed[(host, port)],
+                    "max": MONGO_MAX_POOL_SIZE,
+                }
+                for host, port in set(self.open) | set(self.in_use)
+            }
+
+
+pool_stats = PoolStats()
+clients = {}
+
+for field in ("open", "in_use", "waiting", "checkout_failed"):
+    Gauge(
+        f"bot_mongo_pool_{field}",
+        f"Mongo connection pool {field.replace('_', ' ')} per server",
+        ("server",),
+        collect=lambda field=field: {
+            (server,): stats[field] for server, stats in pool_stats.snapshot().items()
+        },
+    )
+
+# writes and verification reads stay on the primary, file search may be
+# served by secondaries
+search_read_preference = getattr(ReadPreference, SEARCH_READ_PREFERENCE.upper())
+
+
+def get_client(uri):
+    # one client (and pool) per cluster, shared by every database module
+    if uri not in clients:
+        options = dict(
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            event_listeners=[pool_stats, command_timer],
+        )
+        if MONGO_COMPRESSORS:
+            options["compressors"] = MONGO_COMPRESSORS
+        clients[uri] = AsyncIOMotorClient(uri, **options)
+    return clients[uri]
@@ -1,14 +1,19 @@
 from struct import pack
 import re
 import base64
+import logging
+from pymongo import UpdateOne
 from pyrogram.file_id import FileId
 from pymongo.errors import DuplicateKeyError
 from umongo import Instance, Document, fields
-from motor.motor_asyncio import AsyncIOMotorClient
+from database.connections import get_client, search_read_preference
 from marshmallow.exceptions import ValidationError
 from info import FILES_DATABASE, DATABASE_NAME, COLLECTION_NAME, MAX_BTN
+from utils import formate_file_name, get_size
 
-client = AsyncIOMotorClient(FILES_DATABASE)
+logger = logging.getLogger(__name__)
+
+client = get_client(FILES_DATABASE)
 mydb = client[DATABASE_NAME]
 instance = Instance.from_db(mydb)
 
@@ -22,28 +27,61 @@ class Media(Document):
     mime_type = fields.StrField(allow_none=True)
     caption = fields.StrField(allow_none=True)
     file_type = fields.StrField(allow_none=True)
+    # precomputed at ingest so result pages don't rebuild them per file
+    display_name = fields.StrField(allow_none=True)
+    size_label = fields.StrField(allow_none=True)
+    search_key = fields.StrField(allow_none=True)
 
     class Meta:
-        indexes = ("$file_name",)
+        indexes = ("$file_name", "search_key")
         collection_name = COLLECTION_NAME
 
 
+# set once migrate_file_labels has given every file a search_key,
+# until then searches match file_name
+search_keys_ready = False
+
+
+def search_collection():
+    # search only reads, so it may go to a secondary
+    return Media.collection.with_options(read_preference=search_read_preference)
+
+
 async def get_files_db_size():
     return (await mydb.command("dbstats"))["dataSize"]
 
 
+def normalize_name(name):
+    return re.sub(r"(_|\-|\.|\+)", " ", str(name))
+
+
+def make_search_key(name):
+    # lower case, separators as single spaces
+    return " ".join(normalize_name(name).lower().split())
+
+
+def file_labels(file_name, file_size):
+    """display_name, size_label and search_key stored with every file."""
+    return dict(
+        display_name=formate_file_name(file_name),
+        size_label=get_size(file_size),
+        search_key=make_search_key(file_name),
+    )
+
+
 async def save_file(media):
     """Save file in database"""
 
     # TODO: Find better way to get same file_id for same media to avoid duplicates
     file_id, file_ref = unpack_new_file_id(media.file_id)
-    file_name = re.sub(r"(_|\-|\.|\+)", " ", str(media.file_name))
+    file_name = normalize_name(media.file_name)
     try:
         file = Media(
             file_id=file_id,
             file_ref=file_ref,
             file_name=file_name,
             file_size=media.file_size,
+            **file_labels(file_name, media.file_size),
             mime_type=media.mime_type,
             caption=media.caption.html if media.caption else None,
             file_type=media.mime_type.split("/")[0],
@@ -64,23 +102,85 @@ async def save_file(media):
             return "suc"
 
 
+async def migrate_file_labels(batch=1000):
+    """Fill display_name/size_label/search_key on files saved before they existed.
+
+    Files without a search_key are found through its index (a missing field
+    is indexed as null), so once everything is labelled a start costs one
+    index lookup instead of a collection scan.
+    """
+    global search_keys_ready
+    if search_keys_ready:
+        return 0
+    # the index may not be built yet on the first start after the upgrade
+    await Media.ensure_indexes()
+    updated = 0
+    while True:
+        cursor = Media.collection.find(
+            {"search_key": None}, {"file_name": 1, "file_size": 1}
+        ).limit(batch)
+        docs = [doc async for doc in cursor]
+        if not docs:
+            break
+        ops = [
+            UpdateOne(
+                {"_id": doc["_id"]},
+                {
+                    "$set": file_labels(
+                        doc.get("file_name", ""), doc.get("file_size") or 0
+                    )
+                },
+            )
+            for doc in docs
+        ]
+        await Media.collection.bulk_write(ops, ordered=False)
+        updated += len(ops)
+    if updated:
+        logger.info(f"Added display labels to {updated} files")
+    search_keys_ready = True
+    return updated
+
+
+def search_key_pattern(query):
+    words = make_search_key(query).split()
+    if not words:
+        return "."
+    if len(words) == 1:
+        return r"\b" + words[0] + r"\b"
+    return ".* ".join(words)
+
+
 async def get_search_results(query, max_results=MAX_BTN, offset=0, lang=None):
     query = query.strip()
-    if not query:
-        raw_pattern = "."
-    elif " " not in query:
-        raw_pattern = r"(\b|[\.\+\-_])" + query + r"(\b|[\.\+\-_])"
+    if search_keys_ready:
+        # search_key is lower case with plain spaces, so the regex needs no
+        # IGNORECASE and mongo matches it against the search_key index
+        try:
+            regex = re.compile(search_key_pattern(query))
+        except:
+            regex = make_search_key(query)
+        filter = {"search_key": regex}
     else:
-        raw_pattern = query.replace(" ", r".*[\s\.\+\-_]")
-    try:
-        regex = re.compile(raw_pattern, flags=re.IGNORECASE)
-    except:
-        regex = query
-    filter = {"file_name": regex}
-    cursor = Media.find(filter)
+        if not query:
+            raw_pattern = "."
+        elif " " not in query:
+            raw_pattern = r"(\b|[\.\+\-_])" + query + r"(\b|[\.\+\-_])"
+        else:
+            raw_pattern = query.replace(" ", r".*[\s\.\+\-_]")
+        try:
+            regex = re.compile(raw_pattern, flags=re.IGNORECASE)
+        except:
+            regex = query
+        filter = {"file_name": regex}
+    collection = search_collection()
+    cursor = collection.find(filter)
     cursor.sort("$natural", -1)
     if lang:
-        lang_files = [file async for file in cursor if lang in file.file_name.lower()]
+        lang_files = [
+            Media.build_from_mongo(doc)
+            async for doc in cursor
+            if lang in doc["file_name"].lower()
+        ]
         files = lang_files[offset:][:max_results]
         total_results = len(lang_files)
         next_offset = offset + max_results
@@ -88,15 +188,15 @@ async def get_search_results(query, max_results=MAX_BTN, offset=0, lang=None):
             next_offset = ""
         return files, next_offset, total_results
     cursor.skip(offset).limit(max_results)
-    files = await cursor.to_list(length=max_results)
-    total_results = await Media.count_documents(filter)
+    files = [Media.build_from_mongo(doc) async for doc in cursor]
+    total_results = await collection.count_documents(filter)
     next_offset = offset + max_results
     if next_offset >= total_results:
         next_offset = ""
     return files, next_offset, total_results
 
 
-async def get_bad_files(query, file_type=None, offset=0, filter=False):
+def bad_files_filter(query, file_type=None):
     query = query.strip()
     if not query:
         raw_pattern = "."
@@ -107,10 +207,17 @@ async def get_bad_files(query, file_type=None, offset=0, filter=False):
     try:
         regex = re.compile(raw_pattern, flags=re.IGNORECASE)
     except:
-        return []
+        return None
     filter = {"file_name": regex}
     if file_type:
         filter["file_type"] = file_type
+    return filter
+
+
+async def get_bad_files(query, file_type=None, offset=0, filter=False):
+    filter = bad_files_filter(query, file_type)
+    if filter is None:
+        return [], 0
     total_results = await Media.count_documents(filter)
     cursor = Media.find(filter)
     cursor.sort("$natural", -1)
@@ -118,6 +225,56 @@ async def get_bad_files(query, file_type=None, offset=0, filter=False):
     return files, total_results
 
 
+async def count_bad_files(query, file_type=None):
+    filter = bad_files_filter(query, file_type)
+    if filter is None:
+        return 0
+    return await Media.collection.count_documents(filter)
+
+
+async def iter_bad_files(query, file_type=None):
+    """Yield the names of matching files without loading them all."""
+    filter = bad_files_filter(query, file_type)
+    if filter is None:
+        return
+    cursor = Media.collection.find(filter, {"file_name": 1}, batch_size=1000)
+    async for doc in cursor.sort("$natural", -1):
+        yield doc["file_name"]
+
+
+async def delete_bad_files(query, file_type=None, batch=1000, progress=None):
+    """Delete matching files server side, one ``_id`` range per delete_many.
+
+    Only the ids bounding each range are read, ``progress(deleted)`` is awaited
+    after every range.
+    """
+    filter = bad_files_filter(query, file_type)
+    if filter is None:
+        return 0
+    deleted = 0
+    last = None
+    while True:
+        window = dict(filter)
+        if last is not None:
+            window["_id"] = {"$gt": last}
+        ids = [
+            doc["_id"]
+            async for doc in Media.collection.find(window, {"_id": 1})
+            .sort("_id", 1)
+            .limit(batch)
+        ]
+        if not ids:
+            return deleted
+        window["_id"] = {"$lte": ids[-1]}
+        if last is not None:
+            window["_id"]["$gt"] = last
+        result = await Media.collection.delete_many(window)
+        deleted += result.deleted_count
+        last = ids[-1]
+        if progress:
+            await progress(deleted)
+
+
 async def get_file_details(query):
     filter = {"file_id": query}
     cursor = Media.find(filter)
@@ -0,0 +1,68 @@
+import logging
+from info import ANNOUNCE_DEDUPE_TTL
+from database.users_chats_db import db
+from database.config_db import mdb
+from database.topdb import movie_series_db
+from database.jsreferdb import referdb
+from database.ia_filterdb import Media
+
+logger = logging.getLogger(__name__)
+
+# every hot lookup and the index it needs, ensured on startup; an optional
+# third item holds extra create_index options
+INDEXES = [
+    (db.col, [("id", 1)]),
+    (db.col, [("ban_status.is_banned", 1)]),
+    (db.grp, [("id", 1)]),
+    (db.grp, [("chat_status.is_disabled", 1)]),
+    (db.users, [("id", 1)]),
+    (db.users, [("expiry_time", 1)]),
+    (db.misc, [("user_id", 1)]),
+    (db.verify_id, [("user_id", 1), ("hash", 1)]),
+    (db.req, [("id", 1)]),
+    (db.botcol, [("id", 1)]),
+    (db.bcast, [("state", 1)]),
+    (db.auto_delete, [("due", 1)]),
+    (db.announced, [("at", 1)], {"expireAfterSeconds": ANNOUNCE_DEDUPE_TTL}),
+    (mdb.search_col, [("query", 1), ("day", 1)]),
+    (mdb.search_col, [("day", 1)]),
+    (movie_series_db.collection, [("group_id", 1), ("search_count", -1)]),
+    (referdb.user_collection, [("user_id", 1)]),
+    (referdb.refer_collection, [("user_id", 1)]),
+]
+
+
+def index_name(keys):
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+
+async def ensure_indexes():
+    # create_index is a no-op when the index already exists
+    await Media.ensure_indexes()
+    for collection, keys, *options in INDEXES:
+        try:
+            await collection.create_index(
+                keys, name=index_name(keys), **(options[0] if options else {})
+            )
+        except Exception as e:
+            logger.error(f"Index {index_name(keys)} on {collection.name} failed: {e}")
+    logger.info("Database indexes ensured")
+
+
+async def index_report():
+    """Declared indexes that are missing and existing ones never used since the last restart of mongod."""
+    declared = {}
+    for collection, keys, *_ in INDEXES:
+        declared.setdefault(collection.full_name, (collection, set()))
+        declared[collection.full_name][1].add(index_name(keys))
+    missing, unused = [], []
+    for name, (collection, names) in declared.items():
+        existing = await collection.index_information()
+        missing += [f"{name}.{index}" for index in names if index not in existing]
+        try:
+            async for stat in collection.aggregate([{"$indexStats": {}}]):
+                if stat["name"] != "_id_" and not stat["accesses"]["ops"]:
+                    unused.append(f"{name}.{stat['name']}")
+        except Exception as e:
+            logger.warning(f"$indexStats on {name} failed: {e}")
+    return missing, unused
@@ -1,36 +1,43 @@
-import pymongo
-from info import DATABASE_URI, DATABASE_NAME
+from pymongo import ReturnDocument
+from database.users_chats_db import mydb
 import logging
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
-myclient = pymongo.MongoClient(DATABASE_URI)
-mydb = myclient[DATABASE_NAME]
-
 
 class UserTracker:
     def __init__(self):
         self.user_collection = mydb["referusers"]
         self.refer_collection = mydb["refers"]
 
-    def add_user(self, user_id):
-        if not self.is_user_in_list(user_id):
-            self.user_collection.insert_one({"user_id": user_id})
+    async def add_user(self, user_id):
+        await self.user_collection.update_one(
+            {"user_id": user_id}, {"$setOnInsert": {"user_id": user_id}}, upsert=True
+        )
 
-    def remove_user(self, user_id):
-        self.user_collection.delete_one({"user_id": user_id})
+    async def remove_user(self, user_id):
+        await self.user_collection.delete_one({"user_id": user_id})
 
-    def is_user_in_list(self, user_id):
-        return bool(self.user_collection.find_one({"user_id": user_id}))
+    async def is_user_in_list(self, user_id):
+        return bool(await self.user_collection.find_one({"user_id": user_id}))
 
-    def add_refer_points(self, user_id: int, points: int):
-        self.refer_collection.update_one(
+    async def add_refer_points(self, user_id: int, points: int):
+        await self.refer_collection.update_one(
             {"user_id": user_id}, {"$set": {"points": points}}, upsert=True
         )
 
-    def get_refer_points(self, user_id: int):
-        user = self.refer_collection.find_one({"user_id": user_id})
+    async def inc_refer_points(self, user_id: int, points: int):
+        user = await self.refer_collection.find_one_and_update(
+            {"user_id": user_id},
+            {"$inc": {"points": points}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return user["points"]
+
+    async def get_refer_points(self, user_id: int):
+        user = await self.refer_collection.find_one({"user_id": user_id})
         return user.get("points") if user else 0
 
 
@@ -1,11 +1,11 @@
 from info import DATABASE_URI
-import motor.motor_asyncio
+from database.connections import get_client
 import uuid  # for generating unique IDs
 
 
 class JsTopDB:
     def __init__(self, db_uri):
-        self.client = motor.motor_asyncio.AsyncIOMotorClient(db_uri)
+        self.client = get_client(db_uri)
         self.db = self.client["movie_series_db"]
         self.collection = self.db["movie_series"]
 
@@ -34,6 +34,9 @@ class JsTopDB:
         await self.collection.delete_many({"group_id": group_id})
 
 
+movie_series_db = JsTopDB(DATABASE_URI)
+
+
 async def main():
     movie_series_db = JsTopDB(DATABASE_URI)
     while True:
@@ -1,12 +1,18 @@
+import asyncio
 import datetime
 import pytz
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+from database.connections import get_client
 
 # from info import SETTINGS, IS_PM_SEARCH, IS_SEND_MOVIE_UPDATE, PREMIUM_POINT,REF_PREMIUM,IS_VERIFY, SHORTENER_WEBSITE3, SHORTENER_API3, THREE_VERIFY_GAP, LINK_MODE, FILE_CAPTION, TUTORIAL, DATABASE_NAME, DATABASE_URI, IMDB, IMDB_TEMPLATE, PROTECT_CONTENT, AUTO_DELETE, SPELL_CHECK, AUTO_FILTER, LOG_VR_CHANNEL, SHORTENER_WEBSITE, SHORTENER_API, SHORTENER_WEBSITE2, SHORTENER_API2, TWO_VERIFY_GAP
 # from utils import get_seconds
 from info import *
 
-client = AsyncIOMotorClient(DATABASE_URI)
+client = get_client(DATABASE_URI)
+
+# dead recipients kept on a broadcast job document
+DEAD_SAMPLE = 100
 mydb = client[DATABASE_NAME]
 
 
@@ -23,6 +29,13 @@ class Database:
         self.jisshu_ads_link = mydb.jisshu_ads_link
         self.movies_update_channel = mydb.movies_update_channel
         self.botcol = mydb.botcol
+        self.bcast = mydb.broadcasts
+        self.auto_delete = mydb.auto_delete
+        self.announce_queue = mydb.announce_queue
+        self.announced = mydb.announced
+        # set whenever a premium expiry changes so the expiry scheduler reloads
+        self.expiry_changed = asyncio.Event()
+        self.access_cache = {}
 
     default = {
         "spell_check": SPELL_CHECK,
@@ -114,11 +127,19 @@ class Database:
     async def delete_chat(self, id):
         await self.grp.delete_many({"id": int(id)})
 
+    async def delete_users(self, ids):
+        result = await self.col.delete_many({"id": {"$in": [int(i) for i in ids]}})
+        return result.deleted_count
+
+    async def delete_chats(self, ids):
+        result = await self.grp.delete_many({"id": {"$in": [int(i) for i in ids]}})
+        return result.deleted_count
+
     async def get_banned(self):
-        users = self.col.find({"ban_status.is_banned": True})
-        chats = self.grp.find({"chat_status.is_disabled": True})
-        b_chats = [chat["id"] async for chat in chats]
-        b_users = [user["id"] async for user in users]
+        users = self.col.find({"ban_status.is_banned": True}, {"id": 1})
+        chats = self.grp.find({"chat_status.is_disabled": True}, {"id": 1})
+        b_chats = {int(chat["id"]) async for chat in chats}
+        b_users = {int(user["id"]) async for user in users}
         return b_users, b_chats
 
     async def add_chat(self, chat, title):
@@ -136,8 +157,146 @@ class Database:
         count = await self.grp.count_documents({})
         return count
 
-    async def get_all_chats(self):
-        return self.grp.find({})
+    async def get_all_chats(self, projection=None):
+        return self.grp.find({}, projection)
+
+    async def set_members_counts(self, counts):
+        # member counts cached for the /groups report, {chat_id: members}
+        if not counts:
+            return
+        now = datetime.datetime.now()
+        await self.grp.bulk_write(
+            [
+                UpdateOne(
+                    {"id": int(chat_id)},
+                    {"$set": {"members": members, "members_at": now}},
+                )
+                for chat_id, members in counts.items()
+            ],
+            ordered=False,
+        )
+
+    async def create_broadcast(
+        self,
+        kind,
+        chat_id,
+        message_id,
+        is_pin,
+        status_chat,
+        status_id,
+        total,
+        dry_run=False,
+    ):
+        job = dict(
+            kind=kind,
+            chat_id=chat_id,
+            message_id=message_id,
+            is_pin=is_pin,
+            status_chat=status_chat,
+            status_id=status_id,
+            total=total,
+            cursor=None,
+            done=0,
+            stats={},
+            dead=[],
+            removed=0,
+            dry_run=dry_run,
+            state="running",
+            started=datetime.datetime.now(),
+        )
+        result = await self.bcast.insert_one(job)
+        job["_id"] = result.inserted_id
+        return job
+
+    async def update_broadcast(
+        self, job_id, cursor, done, stats, dead=None, removed=0, state=None
+    ):
+        data = {"cursor": cursor, "done": done, "stats": stats}
+        if state:
+            data["state"] = state
+        update = {"$set": data}
+        if dead:
+            # a sample for the report, the full count is in stats
+            update["$push"] = {"dead": {"$each": dead, "$slice": DEAD_SAMPLE}}
+        if removed:
+            update["$inc"] = {"removed": removed}
+        await self.bcast.update_one({"_id": job_id}, update)
+
+    async def get_running_broadcasts(self):
+        return await self.bcast.find({"state": "running"}).to_list(None)
+
+    async def count_broadcast_resume(self, job_id):
+        job = await self.bcast.find_one_and_update(
+            {"_id": job_id}, {"$inc": {"resumes": 1}}, {"resumes": 1}
+        )
+        return job.get("resumes", 0) if job else 0
+
+    async def get_broadcast_targets(self, kind, cursor=None, limit=1000):
+        col = self.col if kind == "users" else self.grp
+        query = {"_id": {"$gt": cursor}} if cursor else {}
+        cursor = col.find(query, {"id": 1}).sort("_id", 1).limit(limit)
+        return await cursor.to_list(limit)
+
+    async def add_auto_deletes(self, jobs):
+        await self.auto_delete.insert_many(jobs, ordered=False)
+
+    async def get_auto_deletes(self):
+        return await self.auto_delete.find({}).to_list(None)
+
+    async def remove_auto_deletes(self, ids):
+        await self.auto_delete.delete_many({"_id": {"$in": ids}})
+
+    async def queue_announcement(self, title, file, first, due):
+        # files stay in mongo until the title is posted, memory only keeps the times
+        await self.announce_queue.update_one(
+            {"_id": title},
+            {
+                "$push": {"files": {"$each": [file], "$slice": ANNOUNCE_MAX_FILES}},
+                "$set": {"due": due},
+                "$setOnInsert": {"first": first},
+            },
+            upsert=True,
+        )
+
+    async def get_queued_announcements(self):
+        return await self.announce_queue.find({}, {"files": 0}).to_list(None)
+
+    async def pop_announcement(self, title):
+        return await self.announce_queue.find_one_and_delete({"_id": title})
+
+    async def requeue_announcement(self, title, files, first, due, attempts):
+        # files that came in meanwhile stay behind the ones being retried
+        await self.announce_queue.update_one(
+            {"_id": title},
+            {
+                "$push": {
+                    "files": {
+                        "$each": files,
+                        "$position": 0,
+                        "$slice": ANNOUNCE_MAX_FILES,
+                    }
+                },
+                "$set": {"due": due, "attempts": attempts},
+                "$setOnInsert": {"first": first},
+            },
+            upsert=True,
+        )
+
+    async def is_announced(self, title):
+        return bool(await self.announced.find_one({"_id": title}, {"_id": 1}))
+
+    async def claim_announcement(self, title):
+        """False when the title was already posted within ANNOUNCE_DEDUPE_TTL."""
+        try:
+            await self.announced.insert_one(
+                {"_id": title, "at": datetime.datetime.utcnow()}
+            )
+        except DuplicateKeyError:
+            return False
+        return True
+
+    async def release_announcement(self, title):
+        await self.announced.delete_one({"_id": title})
 
     async def get_db_size(self):
         return (await mydb.command("dbstats"))["dataSize"]
@@ -147,7 +306,7 @@ class Database:
         user = await self.misc.find_one({"user_id": user_id})
         ist_timezone = pytz.timezone("Asia/Kolkata")
         if not user:
-            res = {
+            user = {
                 "user_id": user_id,
                 "last_verified": datetime.datetime(
                     2020, 5, 17, 0, 0, 0, tzinfo=ist_timezone
@@ -156,124 +315,90 @@ class Database:
                     2019, 5, 17, 0, 0, 0, tzinfo=ist_timezone
                 ),
             }
-            user = await self.misc.insert_one(res)
+            await self.misc.insert_one(dict(user))
         return user
 
     async def update_notcopy_user(self, user_id, value: dict):
         user_id = int(user_id)
+        self.access_cache.pop(user_id, None)
         myquery = {"user_id": user_id}
         newvalues = {"$set": value}
-        return await self.misc.update_one(myquery, newvalues)
-
-    async def is_user_verified(self, user_id):
-        user = await self.get_notcopy_user(user_id)
-        try:
-            pastDate = user["last_verified"]
-        except Exception:
-            user = await self.get_notcopy_user(user_id)
-            pastDate = user["last_verified"]
+        return await self.misc.update_one(myquery, newvalues, upsert=True)
+
+    async def _get_access_docs(self, user_id):
+        cached = self.access_cache.get(user_id)
+        if cached and cached[0] > datetime.datetime.now().timestamp():
+            return cached[1], cached[2]
+        misc, premium = await asyncio.gather(
+            self.misc.find_one({"user_id": user_id}),
+            self.users.find_one({"id": user_id}),
+        )
+        if len(self.access_cache) >= ACCESS_CACHE_SIZE:
+            self.access_cache.pop(next(iter(self.access_cache)))
+        expires = datetime.datetime.now().timestamp() + ACCESS_CACHE_TTL
+        self.access_cache[user_id] = (expires, misc or {}, premium or {})
+        return misc or {}, premium or {}
+
+    async def get_access_state(
+        self, user_id, verify_time=TWO_VERIFY_GAP, third_verify_time=THREE_VERIFY_GAP
+    ):
+        # one (cached) read of the misc and premium docs, every verification
+        # tier is worked out from them in memory
+        user_id = int(user_id)
+        misc, premium = await self._get_access_docs(user_id)
         ist_timezone = pytz.timezone("Asia/Kolkata")
-        pastDate = pastDate.astimezone(ist_timezone)
         current_time = datetime.datetime.now(tz=ist_timezone)
-        seconds_since_midnight = (
-            current_time
-            - datetime.datetime(
-                current_time.year,
-                current_time.month,
-                current_time.day,
-                0,
-                0,
-                0,
-                tzinfo=ist_timezone,
+        midnight = datetime.datetime(
+            current_time.year,
+            current_time.month,
+            current_time.day,
+            0,
+            0,
+            0,
+            tzinfo=ist_timezone,
+        )
+        seconds_since_midnight = (current_time - midnight).total_seconds()
+
+        def verified_at(key, year):
+            date = misc.get(key) or datetime.datetime(
+                year, 5, 17, 0, 0, 0, tzinfo=ist_timezone
             )
-        ).total_seconds()
-        time_diff = current_time - pastDate
-        total_seconds = time_diff.total_seconds()
-        return total_seconds <= seconds_since_midnight
+            return date.astimezone(ist_timezone)
+
+        last = verified_at("last_verified", 2020)
+        second = verified_at("second_time_verified", 2019)
+        third = verified_at("third_time_verified", 2018)
+        verified = (current_time - last).total_seconds() <= seconds_since_midnight
+        second_verified = (
+            current_time - second
+        ).total_seconds() <= seconds_since_midnight
+        expiry_time = premium.get("expiry_time")
+        return {
+            "premium": isinstance(expiry_time, datetime.datetime)
+            and datetime.datetime.now() <= expiry_time,
+            "verified": verified,
+            "second_verified": second_verified,
+            "second_shortener": verified
+            and current_time - last > datetime.timedelta(seconds=verify_time)
+            and second < last,
+            "third_shortener": second_verified
+            and current_time - second > datetime.timedelta(seconds=third_verify_time)
+            and third < second,
+        }
+
+    async def is_user_verified(self, user_id):
+        return (await self.get_access_state(user_id))["verified"]
 
     async def user_verified(self, user_id):
-        user = await self.get_notcopy_user(user_id)
-        try:
-            pastDate = user["second_time_verified"]
-        except Exception:
-            user = await self.get_notcopy_user(user_id)
-            pastDate = user["second_time_verified"]
-        ist_timezone = pytz.timezone("Asia/Kolkata")
-        pastDate = pastDate.astimezone(ist_timezone)
-        current_time = datetime.datetime.now(tz=ist_timezone)
-        seconds_since_midnight = (
-            current_time
-            - datetime.datetime(
-                current_time.year,
-                current_time.month,
-                current_time.day,
-                0,
-                0,
-                0,
-                tzinfo=ist_timezone,
-            )
-        ).total_seconds()
-        time_diff = current_time - pastDate
-        total_seconds = time_diff.total_seconds()
-        return total_seconds <= seconds_since_midnight
+        return (await self.get_access_state(user_id))["second_verified"]
 
     async def use_second_shortener(self, user_id, time):
-        user = await self.get_notcopy_user(user_id)
-        if not user.get("second_time_verified"):
-            ist_timezone = pytz.timezone("Asia/Kolkata")
-            await self.update_notcopy_user(
-                user_id,
-                {
-                    "second_time_verified": datetime.datetime(
-                        2019, 5, 17, 0, 0, 0, tzinfo=ist_timezone
-                    )
-                },
-            )
-            user = await self.get_notcopy_user(user_id)
-        if await self.is_user_verified(user_id):
-            try:
-                pastDate = user["last_verified"]
-            except Exception:
-                user = await self.get_notcopy_user(user_id)
-                pastDate = user["last_verified"]
-            ist_timezone = pytz.timezone("Asia/Kolkata")
-            pastDate = pastDate.astimezone(ist_timezone)
-            current_time = datetime.datetime.now(tz=ist_timezone)
-            time_difference = current_time - pastDate
-            if time_difference > datetime.timedelta(seconds=time):
-                pastDate = user["last_verified"].astimezone(ist_timezone)
-                second_time = user["second_time_verified"].astimezone(ist_timezone)
-                return second_time < pastDate
-        return False
+        state = await self.get_access_state(user_id, verify_time=time)
+        return state["second_shortener"]
 
     async def use_third_shortener(self, user_id, time):
-        user = await self.get_notcopy_user(user_id)
-        if not user.get("third_time_verified"):
-            ist_timezone = pytz.timezone("Asia/Kolkata")
-            await self.update_notcopy_user(
-                user_id,
-                {
-                    "third_time_verified": datetime.datetime(
-                        2018, 5, 17, 0, 0, 0, tzinfo=ist_timezone
-                    )
-                },
-            )
-            user = await self.get_notcopy_user(user_id)
-        if await self.user_verified(user_id):
-            try:
-                pastDate = user["second_time_verified"]
-            except Exception:
-                user = await self.get_notcopy_user(user_id)
-                pastDate = user["second_time_verified"]
-            ist_timezone = pytz.timezone("Asia/Kolkata")
-            pastDate = pastDate.astimezone(ist_timezone)
-            current_time = datetime.datetime.now(tz=ist_timezone)
-            time_difference = current_time - pastDate
-            if time_difference > datetime.timedelta(seconds=time):
-                pastDate = user["second_time_verified"].astimezone(ist_timezone)
-                second_time = user["third_time_verified"].astimezone(ist_timezone)
-                return second_time < pastDate
-        return False
+        state = await self.get_access_state(user_id, third_verify_time=time)
+        return state["third_shortener"]
 
     async def create_verify_id(self, user_id: int, hash):
         res = {"user_id": user_id, "hash": hash, "verified": False}
@@ -310,6 +435,12 @@ class Database:
         await self.users.update_one(
             {"id": user_data["id"]}, {"$set": user_data}, upsert=True
         )
+        if "expiry_time" in user_data:
+            self.access_cache.pop(user_data["id"], None)
+            self.expiry_changed.set()
+
+    async def update_value(self, user_id, key, value):
+        await self.users.update_one({"id": user_id}, {"$set": {key: value}}, upsert=True)
 
     async def get_expired(self, current_time):
         expired_users = []
@@ -318,6 +449,12 @@ class Database:
                 expired_users.append(user)
         return expired_users
 
+    async def get_next_expiries(self, limit):
+        cursor = self.users.find(
+            {"expiry_time": {"$type": "date"}}, {"id": 1, "expiry_time": 1}
+        )
+        return await cursor.sort("expiry_time", 1).to_list(limit)
+
     async def has_premium_access(self, user_id):
         user_data = await self.get_user(user_id)
         if user_data:
@@ -360,7 +497,19 @@ class Database:
             return False
 
     async def remove_premium_access(self, user_id):
-        return await self.update_one({"id": user_id}, {"$set": {"expiry_time": None}})
+        self.access_cache.pop(user_id, None)
+        removed = await self.update_one({"id": user_id}, {"$set": {"expiry_time": None}})
+        self.expiry_changed.set()
+        return removed
+
+    async def expire_premium(self, user_id, now):
+        """Ends premium only if it is still due, False when it was extended or removed meanwhile."""
+        result = await self.users.update_one(
+            {"id": user_id, "expiry_time": {"$lte": now}},
+            {"$set": {"expiry_time": None}},
+        )
+        self.access_cache.pop(user_id, None)
+        return result.modified_count == 1
 
     async def check_trial_status(self, user_id):
         user_data = await self.get_user(user_id)
@@ -392,6 +541,8 @@ class Database:
         expiry_time = datetime.datetime.now() + datetime.timedelta(seconds=seconds)
         user_data = {"id": user_id, "expiry_time": expiry_time, "has_free_trial": True}
         await self.users.update_one({"id": user_id}, {"$set": user_data}, upsert=True)
+        self.access_cache.pop(user_id, None)
+        self.expiry_changed.set()
 
     # JISSHU BOTS
     async def jisshu_set_ads_link(self, link):
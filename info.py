@@ -47,11 +47,22 @@ AUTH_REQ_CHANNEL = int(environ.get("AUTH_REQ_CHANNEL", ""))
 LOG_CHANNEL = int(environ.get("LOG_CHANNEL", ""))
 LOG_API_CHANNEL = int(environ.get("LOG_API_CHANNEL", ""))
 LOG_VR_CHANNEL = int(environ.get("LOG_VR_CHANNEL", ""))
+# Force subscribe membership cache (seconds)
+MEMBER_CACHE_TTL = int(environ.get("MEMBER_CACHE_TTL", "3600"))
+MEMBER_CACHE_NEGATIVE_TTL = int(environ.get("MEMBER_CACHE_NEGATIVE_TTL", "20"))
+MEMBER_CACHE_SIZE = int(environ.get("MEMBER_CACHE_SIZE", "50000"))
 
 # MongoDB
 DATABASE_URI = environ.get("DATABASE_URI", "")
 DATABASE_NAME = environ.get("DATABASE_NAME", "ProBotz")
 
+# Connection pool shared by every database module
+MONGO_MAX_POOL_SIZE = int(environ.get("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(environ.get("MONGO_MIN_POOL_SIZE", "5"))
+MONGO_COMPRESSORS = environ.get("MONGO_COMPRESSORS", "zstd,snappy,zlib")  # missing libs are skipped
+# PRIMARY, PRIMARY_PREFERRED, SECONDARY, SECONDARY_PREFERRED or NEAREST
+SEARCH_READ_PREFERENCE = environ.get("SEARCH_READ_PREFERENCE", "SECONDARY_PREFERRED")
+
 # Files index database url
 FILES_DATABASE = environ.get("FILES_DATABASE", "")
 COLLECTION_NAME = environ.get("COLLECTION_NAME", "CollectionProBotz")
@@ -92,6 +103,8 @@ SHORTENER_API3 = environ.get(
 SHORTENER_WEBSITE3 = environ.get("SHORTENER_WEBSITE3", "shrinkme.top")
 TWO_VERIFY_GAP = int(environ.get("TWO_VERIFY_GAP", "14400"))
 THREE_VERIFY_GAP = int(environ.get("THREE_VERIFY_GAP", "14400"))
+ACCESS_CACHE_TTL = int(environ.get("ACCESS_CACHE_TTL", "30"))  # seconds
+ACCESS_CACHE_SIZE = int(environ.get("ACCESS_CACHE_SIZE", "10000"))
 
 # Language & Quality & Season & Year
 LANGUAGES = [
@@ -179,6 +192,41 @@ else:
     ON_HEROKU = False
 URL = environ.get("FQDN", "")
 
+# Broadcast
+BROADCAST_RATE = int(environ.get("BROADCAST_RATE", "20"))  # messages per second per bot
+GROUP_BROADCAST_RATE = int(environ.get("GROUP_BROADCAST_RATE", "8"))
+BROADCAST_WORKERS = int(environ.get("BROADCAST_WORKERS", "20"))
+
+# /groups report: member count lookups per second, parallel lookups and how long a cached count is used
+GROUPS_REPORT_RATE = int(environ.get("GROUPS_REPORT_RATE", "10"))
+GROUPS_REPORT_WORKERS = int(environ.get("GROUPS_REPORT_WORKERS", "10"))
+GROUP_MEMBERS_TTL = int(environ.get("GROUP_MEMBERS_TTL", "86400"))
+
+# "Send all files" delivery per bot: files per second and parallel sends across
+# chats (each chat gets its files in order), send as albums (no buttons)
+SEND_ALL_RATE = int(environ.get("SEND_ALL_RATE", "25"))
+SEND_ALL_WORKERS = int(environ.get("SEND_ALL_WORKERS", "10"))
+SEND_ALL_ALBUM = is_enabled(environ.get("SEND_ALL_ALBUM", "False"), False)
+
+# Search analytics are buffered and written every SEARCH_FLUSH_INTERVAL seconds
+SEARCH_FLUSH_INTERVAL = int(environ.get("SEARCH_FLUSH_INTERVAL", "30"))
+ADS_CACHE_TTL = int(environ.get("ADS_CACHE_TTL", "300"))
+TOP_SEARCH_CAPACITY = int(environ.get("TOP_SEARCH_CAPACITY", "1000"))  # queries kept per leaderboard
+
+# Premium expiry
+EXPIRY_BATCH = int(environ.get("EXPIRY_BATCH", "100"))  # next expiries kept in memory
+EXPIRY_NOTIFY_RATE = int(environ.get("EXPIRY_NOTIFY_RATE", "5"))  # expiry messages per second
+
+# Movie update posts: seconds of quiet before a title is posted, longest a title
+# waits during a long upload, files kept per post and how long a posted title is not reposted
+ANNOUNCE_DELAY = int(environ.get("ANNOUNCE_DELAY", "10"))
+ANNOUNCE_MAX_WAIT = int(environ.get("ANNOUNCE_MAX_WAIT", "120"))
+ANNOUNCE_MAX_FILES = int(environ.get("ANNOUNCE_MAX_FILES", "200"))
+ANNOUNCE_DEDUPE_TTL = int(environ.get("ANNOUNCE_DEDUPE_TTL", "604800"))
+
+# Banned users / disabled chats are reloaded from the db every BAN_REFRESH_INTERVAL seconds
+BAN_REFRESH_INTERVAL = int(environ.get("BAN_REFRESH_INTERVAL", "60"))
+
 # Commands
 admin_cmds = [
     "/add_premium - Add A User To Premium",
@@ -199,14 +247,15 @@ admin_cmds = [
     "/leave - Leave A Group Or Channel",
     "/ban - Ban A User",
     "/unban - Unban A User",
-    "/broadcast - Broadcast Message",
+    "/broadcast - Broadcast Message (/broadcast dry Keeps Dead Users)",
     "/grp_broadcast - Broadcast Messages To Groups",
     "/delreq - Delete Join Request",
     "/channel - List Of Database Channels",
     "/del_file - Delete A Specific File",
     "/delete - Delete A File(By Reply)",
-    "/deletefiles - Delete Multiple Files",
+    "/deletefiles - Delete Multiple Files (/deletefiles dry keyword Only Counts)",
     "/deleteall - Delete All Files",
+    "/indexes - Missing And Unused Database Indexes",
 ]
 
 cmds = [
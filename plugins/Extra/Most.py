@@ -1,7 +1,7 @@
 import re
 from pyrogram import Client, filters
 from pyrogram.types import ReplyKeyboardMarkup
-from database.config_db import mdb
+from database.config_db import mdb, TopSearches
 
 
 # most search commands
@@ -11,12 +11,16 @@ async def most(client, message):
     def is_alphanumeric(string):
         return bool(re.match("^[a-zA-Z0-9 ]*$", string))
 
-    try:
-        limit = int(message.command[1])
-    except (IndexError, ValueError):
-        limit = 20
+    # /most [day|week|all] [limit]
+    limit = 20
+    window = "all"
+    for arg in message.command[1:]:
+        if arg.isdigit():
+            limit = int(arg)
+        elif arg.lower() in TopSearches.WINDOWS:
+            window = arg.lower()
 
-    top_messages = await mdb.get_top_messages(limit)
+    top_messages = await mdb.get_top_messages(limit, window)
 
     # Use a set to ensure unique messages (case sensitive).
     seen_messages = set()
@@ -59,10 +63,15 @@ async def trendlist(client, message):
     # Set the limit to the default if no argument is provided
     limit = 31
 
-    # Check if an argument is provided and if it's a valid number
-    if len(message.command) > 1:
+    window = "all"
+
+    # Check if an argument is provided and if it's a valid number or window
+    for arg in message.command[1:]:
+        if arg.lower() in TopSearches.WINDOWS:
+            window = arg.lower()
+            continue
         try:
-            limit = int(message.command[1])
+            limit = int(arg)
         except ValueError:
             await message.reply_text(
                 "Invalid number format.\nPlease provide a valid number after the /trendlist command."
@@ -70,7 +79,7 @@ async def trendlist(client, message):
             return  # Exit the function if the argument is not a valid integer
 
     try:
-        top_messages = await mdb.get_top_messages(limit)
+        top_messages = await mdb.get_top_messages(limit, window)
     except Exception as e:
         await message.reply_text(f"Error retrieving messages: {str(e)}")
         return  # Exit the function if there is an error retrieving messages
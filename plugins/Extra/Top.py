@@ -1,9 +1,7 @@
 from pyrogram import Client, filters
-from info import ADMINS, DATABASE_URI
+from info import ADMINS
 from pyrogram.types import ReplyKeyboardMarkup
-from database.topdb import JsTopDB
-
-movie_series_db = JsTopDB(DATABASE_URI)
+from database.topdb import movie_series_db
 
 
 # top trending commands
@@ -1,4 +1,3 @@
-import asyncio
 from pyrogram import Client, filters, enums
 from pyrogram.types import (
     InlineKeyboardMarkup,
@@ -6,6 +5,7 @@ from pyrogram.types import (
     BotCommand,
 )
 from utils import is_check_admin
+from Jisshu.util.autodelete import auto_deleter
 from Script import script
 from info import ADMINS, admin_cmds, cmds
 
@@ -50,9 +50,7 @@ async def admin_cmds_handler(client, message):
         sent_message = await message.reply(
             f"<b>Admin All Commands [auto delete in 2 minutes] 👇</b>\n\n{commands_list}{admin_footer}"
         )
-        await asyncio.sleep(120)
-        await sent_message.delete()
-        await message.delete()
+        auto_deleter.schedule([sent_message, message], 120)
     except Exception as e:
         print(f"Error in admin_cmds_handler: {e}")
         await message.reply("An error occurred while displaying admin commands.")
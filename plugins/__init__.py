@@ -1,9 +1,13 @@
 from aiohttp import web
 from .route import routes
-from asyncio import sleep
+import heapq
+import asyncio
 from datetime import datetime
+from pyrogram.errors import FloodWait
 from database.users_chats_db import db
-from info import LOG_CHANNEL
+from info import LOG_CHANNEL, EXPIRY_BATCH, EXPIRY_NOTIFY_RATE, BAN_REFRESH_INTERVAL
+from Jisshu.util.broadcast import TokenBucket
+from utils import temp
 
 
 async def web_server():
@@ -12,12 +16,12 @@ async def web_server():
     return web_app
 
 
-async def check_expired_premium(client):
-    while 1:
-        data = await db.get_expired(datetime.now())
-        for user in data:
-            user_id = user["id"]
-            await db.remove_premium_access(user_id)
+async def notify_expired(client, queue):
+    bucket = TokenBucket(EXPIRY_NOTIFY_RATE)
+    while True:
+        user_id = await queue.get()
+        for _ in range(3):
+            await bucket.acquire()
             try:
                 user = await client.get_users(user_id)
                 await client.send_message(
@@ -28,7 +32,56 @@ async def check_expired_premium(client):
                     LOG_CHANNEL,
                     text=f"<b>#Premium_Expire\n\nUser name: {user.mention}\nUser id: <code>{user_id}</code>",
                 )
+            except FloodWait as e:
+                bucket.pause(e.value)
+                continue
             except Exception as e:
                 print(e)
-            await sleep(0.5)
-        await sleep(1)
+            break
+
+
+async def check_expired_premium(client):
+    # the next expiries are kept in a heap and we sleep until the first one,
+    # db.expiry_changed wakes us up when premium is given/extended,
+    # expiry_time is indexed by database/indexes.py
+    queue = asyncio.Queue()
+    asyncio.create_task(notify_expired(client, queue))
+    heap = []
+    reload = True
+    while 1:
+        if reload:
+            db.expiry_changed.clear()
+            heap = [
+                (user["expiry_time"], user["id"])
+                for user in await db.get_next_expiries(EXPIRY_BATCH)
+            ]
+            heapq.heapify(heap)
+            reload = False
+        now = datetime.now()
+        expired = False
+        while heap and heap[0][0] <= now:
+            _, user_id = heapq.heappop(heap)
+            # the entry may be stale (extended by another instance, removed
+            # by an admin), only notify when this update really ended it
+            if await db.expire_premium(user_id, now):
+                queue.put_nowait(user_id)
+            expired = True
+        if expired and not heap:
+            reload = True
+            continue
+        timeout = (heap[0][0] - now).total_seconds() if heap else None
+        try:
+            await asyncio.wait_for(db.expiry_changed.wait(), timeout)
+            reload = True
+        except asyncio.TimeoutError:
+            pass
+
+
+async def refresh_banned():
+    # bans made by another instance (or directly in the db) show up here
+    while True:
+        await asyncio.sleep(BAN_REFRESH_INTERVAL)
+        try:
+            temp.BANNED_USERS, temp.BANNED_CHATS = await db.get_banned()
+        except Exception as e:
+            print(f"Refreshing banned list failed: {e}")
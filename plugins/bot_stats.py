@@ -1,13 +1,27 @@
 from pyrogram import Client, filters
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from pyrogram.errors import FloodWait
 from pyrogram.errors.exceptions.bad_request_400 import MessageTooLong
-from info import ADMINS, LOG_CHANNEL, USERNAME
+from info import (
+    ADMINS,
+    LOG_CHANNEL,
+    USERNAME,
+    GROUPS_REPORT_RATE,
+    GROUPS_REPORT_WORKERS,
+    GROUP_MEMBERS_TTL,
+)
 from database.users_chats_db import db
 from database.ia_filterdb import Media, get_files_db_size
+from database.indexes import index_report
 from utils import get_size, temp
+from Jisshu.util.broadcast import TokenBucket
 from Script import script
+from datetime import datetime, timedelta
+import asyncio
+import tempfile
 import psutil
 import time
+import os
 
 
 @Client.on_message(filters.new_chat_members & filters.group)
@@ -73,29 +87,91 @@ async def leave_a_chat(bot, message):
         await message.reply(f"<b>🚫 ᴇʀʀᴏʀ - `{e}`</b>")
 
 
+async def members_count(bot, bucket, semaphore, chat):
+    """Cached member count of a saved group, ``(count, fetched)``."""
+    checked = chat.get("members_at")
+    if checked and datetime.now() - checked < timedelta(seconds=GROUP_MEMBERS_TTL):
+        return chat.get("members"), False
+    async with semaphore:
+        for _ in range(3):
+            await bucket.acquire()
+            try:
+                return await bot.get_chat_members_count(chat["id"]), True
+            except FloodWait as e:
+                bucket.pause(e.value)
+            except Exception:
+                break
+    return None, False
+
+
 @Client.on_message(filters.command("groups") & filters.user(ADMINS))
 async def groups_list(bot, message):
     msg = await message.reply("<b>Searching...</b>")
-    chats = await db.get_all_chats()
+    chats = await db.get_all_chats(
+        {"id": 1, "title": 1, "members": 1, "members_at": 1}
+    )
+    bucket = TokenBucket(GROUPS_REPORT_RATE)
+    semaphore = asyncio.Semaphore(GROUPS_REPORT_WORKERS)
     out = "Groups saved in the database:\n\n"
-    count = 1
-    async for chat in chats:
-        chat_info = await bot.get_chat(chat["id"])
-        members_count = (
-            chat_info.members_count if chat_info.members_count else "Unknown"
-        )
-        out += f"<b>{count}. Title - `{chat['title']}`\nID - `{chat['id']}`\nMembers - `{members_count}`</b>"
-        out += "\n\n"
-        count += 1
+    count = 0
+    fd, path = tempfile.mkstemp(prefix="groups_", suffix=".txt")
     try:
-        if count > 1:
-            await msg.edit_text(out)
-        else:
-            await msg.edit_text("<b>No groups found</b>")
-    except MessageTooLong:
-        with open("chats.txt", "w+") as outfile:
+        with os.fdopen(fd, "w", encoding="utf-8") as outfile:
             outfile.write(out)
-        await message.reply_document("chats.txt", caption="<b>List of all groups</b>")
+            batch = []
+            async for chat in chats:
+                batch.append(chat)
+                if len(batch) < 200:
+                    continue
+                lines, fetched = await groups_batch(
+                    bot, bucket, semaphore, batch, count
+                )
+                count += len(batch)
+                batch = []
+                outfile.writelines(lines)
+                await db.set_members_counts(fetched)
+                try:
+                    await msg.edit_text(f"<b>Searching... {count} groups done</b>")
+                except Exception:
+                    pass
+            if batch:
+                lines, fetched = await groups_batch(
+                    bot, bucket, semaphore, batch, count
+                )
+                count += len(batch)
+                outfile.writelines(lines)
+                await db.set_members_counts(fetched)
+        if count == 0:
+            return await msg.edit_text("<b>No groups found</b>")
+        if count <= 30:
+            with open(path, encoding="utf-8") as outfile:
+                out = outfile.read()
+            try:
+                return await msg.edit_text(out)
+            except MessageTooLong:
+                pass
+        await message.reply_document(
+            path, file_name="chats.txt", caption="<b>List of all groups</b>"
+        )
+        await msg.delete()
+    finally:
+        os.remove(path)
+
+
+async def groups_batch(bot, bucket, semaphore, batch, start):
+    counts = await asyncio.gather(
+        *[members_count(bot, bucket, semaphore, chat) for chat in batch]
+    )
+    lines, fetched = [], {}
+    for number, (chat, (members, new)) in enumerate(
+        zip(batch, counts), start=start + 1
+    ):
+        if new:
+            fetched[chat["id"]] = members
+        lines.append(
+            f"<b>{number}. Title - `{chat.get('title')}`\nID - `{chat['id']}`\nMembers - `{members or 'Unknown'}`</b>\n\n"
+        )
+    return lines, fetched
 
 
 @Client.on_message(filters.command("stats") & filters.user(ADMINS) & filters.incoming)
@@ -117,6 +193,19 @@ async def get_ststs(bot, message):
     )
 
 
+@Client.on_message(filters.command("indexes") & filters.user(ADMINS) & filters.incoming)
+async def indexes_report(bot, message):
+    msg = await message.reply("<b>Checking indexes...</b>")
+    missing, unused = await index_report()
+    text = "<b>Missing indexes:</b>\n" + (
+        "\n".join(f"<code>{i}</code>" for i in missing) or "None"
+    )
+    text += "\n\n<b>Unused indexes:</b>\n" + (
+        "\n".join(f"<code>{i}</code>" for i in unused) or "None"
+    )
+    await msg.edit_text(text)
+
+
 @Client.on_message(filters.command("invite") & filters.private & filters.user(ADMINS))
 async def invite(client, message):
     toGenInvLink = message.command[1]
@@ -1,8 +1,10 @@
 from pyrogram import Client, filters
 import time
+import logging
 from database.users_chats_db import db
-from info import ADMINS
+from info import ADMINS, BROADCAST_RATE, GROUP_BROADCAST_RATE
 from utils import users_broadcast, groups_broadcast, temp, get_readable_time
+from Jisshu.util.broadcast import Broadcaster
 import asyncio
 from pyrogram.types import (
     InlineKeyboardButton,
@@ -10,27 +12,190 @@ from pyrogram.types import (
     ReplyKeyboardMarkup,
 )
 
-lock = asyncio.Lock()
+# a job still running after this many restarts is given up
+MAX_RESUMES = 3
+# in process retries of a job after an error, RETRY_DELAY seconds apart
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 30
 
+# users and groups run side by side, each kind one job at a time
+locks = {"users": asyncio.Lock(), "groups": asyncio.Lock()}
 
-@Client.on_callback_query(filters.regex(r"^broadcast_cancel"))
-async def broadcast_cancel(bot, query):
-    _, ident = query.data.split("#")
-    if ident == "users":
-        await query.message.edit("ᴛʀʏɪɴɢ ᴛᴏ ᴄᴀɴᴄᴇʟ ᴜsᴇʀs ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ...")
-        temp.USERS_CANCEL = True
-    elif ident == "groups":
-        temp.GROUPS_CANCEL = True
-        await query.message.edit("ᴛʀʏɪɴɢ ᴛᴏ ᴄᴀɴᴄᴇʟ ɢʀᴏᴜᴘs ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ...")
+JOBS = {
+    "users": {
+        "name": "Users",
+        "send": users_broadcast,
+        "delete": db.delete_users,
+        "rate": BROADCAST_RATE,
+        "cancel": "USERS_CANCEL",
+    },
+    "groups": {
+        "name": "Groups",
+        "send": groups_broadcast,
+        "delete": db.delete_chats,
+        "rate": GROUP_BROADCAST_RATE,
+        "cancel": "GROUPS_CANCEL",
+    },
+}
 
 
-@Client.on_message(filters.command("broadcast") & filters.user(ADMINS) & filters.reply)
-async def broadcast_users(bot, message):
-    if lock.locked():
+async def iter_targets(kind, cursor, batch=1000):
+    # short queries by _id instead of one cursor held open for hours, which
+    # the server would time out long before a large broadcast is done
+    while True:
+        docs = await db.get_broadcast_targets(kind, cursor, batch)
+        for doc in docs:
+            yield doc["_id"], int(doc["id"])
+        if len(docs) < batch:
+            return
+        cursor = docs[-1]["_id"]
+
+
+def status_text(job, broadcaster, head, time_taken=None):
+    name = JOBS[job["kind"]]["name"]
+    stats = broadcaster.stats
+    text = f"{name} broadcast {head}"
+    if time_taken:
+        text += f"\nCompleted in {time_taken}"
+    text += f"\n\nTotal {name}: <code>{job['total']}</code>\nCompleted: <code>{broadcaster.done} / {job['total']}</code>\nSuccess: <code>{stats.get('Success', 0)}</code>"
+    if job["kind"] == "users":
+        text += f"\nBlocked: <code>{stats.get('Blocked', 0)}</code>\nDeleted: <code>{stats.get('Deleted', 0)}</code>"
+    text += f"\nInvalid: <code>{stats.get('Invalid', 0)}</code>\nFailed: <code>{stats.get('Error', 0)}</code>"
+    dead = sum(stats.get(sts, 0) for sts in Broadcaster.DEAD)
+    if job["dry_run"]:
+        text += f"\nWould remove (dry run): <code>{dead}</code>"
+    else:
+        text += f"\nRemoved from db: <code>{job['removed']}</code>"
+    return text
+
+
+async def save_progress(job, broadcaster, state=None):
+    # dead chats are collected by the workers and removed here in one delete_many
+    dead = broadcaster.pop_dead()
+    removed = 0
+    try:
+        if dead and not job["dry_run"]:
+            removed = await JOBS[job["kind"]]["delete"](dead)
+            job["removed"] += removed
+        await db.update_broadcast(
+            job["_id"],
+            broadcaster.cursor,
+            broadcaster.done,
+            broadcaster.stats,
+            dead=dead,
+            removed=removed,
+            state=state,
+        )
+    except Exception:
+        # removed again with the next save
+        broadcaster.dead = dead + broadcaster.dead
+        raise
+    job["cursor"] = broadcaster.cursor
+    job["done"] = broadcaster.done
+    job["stats"] = dict(broadcaster.stats)
+
+
+async def save_retrying(job, broadcaster, state=None):
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return await save_progress(job, broadcaster, state=state)
+        except Exception:
+            logging.exception(f"Saving broadcast {job['_id']} failed")
+            if attempt + 1 < MAX_ATTEMPTS:
+                await asyncio.sleep(RETRY_DELAY)
+
+
+async def run_broadcast(bot, job):
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            return await process_broadcast(bot, job)
+        except Exception:
+            # job holds the last saved progress, carry on from there
+            logging.exception(
+                f"Broadcast job {job['_id']} failed (attempt {attempt}/{MAX_ATTEMPTS})"
+            )
+            await asyncio.sleep(RETRY_DELAY)
+    # left running, the next start resumes it (at most MAX_RESUMES times)
+    logging.error(f"Broadcast job {job['_id']} stopped until the next restart")
+
+
+async def process_broadcast(bot, job):
+    kind = job["kind"]
+    conf = JOBS[kind]
+    b_msg = await bot.get_messages(job["chat_id"], job["message_id"])
+    if not b_msg or b_msg.empty:
+        logging.error(f"Broadcast message of job {job['_id']} is gone, dropping it")
+        return await db.update_broadcast(
+            job["_id"], job["cursor"], job["done"], job["stats"], state="failed"
+        )
+    job.setdefault("removed", 0)
+    job.setdefault("dry_run", False)
+
+    async def send(client, chat_id):
+        return await conf["send"](client, chat_id, b_msg, job["is_pin"])
+
+    broadcaster = Broadcaster(
+        send,
+        # only the main bot can copy the admin's message and knows every user
+        bot,
+        rate=conf["rate"],
+        done=job["done"],
+        stats=job["stats"],
+        cursor=job["cursor"],
+    )
+    btn = [
+        [InlineKeyboardButton("CANCEL", callback_data=f"broadcast_cancel#{kind}")]
+    ]
+    start_time = time.time()
+
+    async def edit(text, markup=None):
+        try:
+            await bot.edit_message_text(
+                job["status_chat"], job["status_id"], text, reply_markup=markup
+            )
+        except Exception:
+            pass
+
+    async with locks[kind]:
+        task = asyncio.create_task(broadcaster.run(iter_targets(kind, job["cursor"])))
+        try:
+            while not task.done():
+                await asyncio.wait([task], timeout=5)
+                if getattr(temp, conf["cancel"]):
+                    setattr(temp, conf["cancel"], False)
+                    broadcaster.cancel()
+                if task.done() or broadcaster.cancelled:
+                    continue
+                try:
+                    await save_progress(job, broadcaster)
+                except Exception:
+                    logging.exception(f"Saving broadcast {job['_id']} failed")
+                await edit(
+                    status_text(job, broadcaster, "in progress..."),
+                    InlineKeyboardMarkup(btn),
+                )
+            await task
+        except BaseException:
+            # stop the workers and keep what they sent, a retry starts from there
+            if not task.done():
+                broadcaster.cancel()
+                await asyncio.wait([task])
+            await save_retrying(job, broadcaster)
+            raise
+        time_taken = get_readable_time(time.time() - start_time)
+        if broadcaster.cancelled:
+            await save_retrying(job, broadcaster, state="cancelled")
+            return await edit(status_text(job, broadcaster, "Cancelled!", time_taken))
+        await save_retrying(job, broadcaster, state="completed")
+        await edit(status_text(job, broadcaster, "completed.", time_taken))
+
+
+async def start_broadcast(bot, message, kind):
+    if locks[kind].locked():
         return await message.reply("Currently broadcast processing, Wait for complete.")
 
     msg = await message.ask(
-        "<b>Do you want pin this message in users?</b>",
+        f"<b>Do you want pin this message in {kind}?</b>",
         reply_markup=ReplyKeyboardMarkup(
             [["Yes", "No"]], one_time_keyboard=True, resize_keyboard=True
         ),
@@ -42,106 +207,59 @@ async def broadcast_users(bot, message):
     else:
         return await msg.edit("Wrong Response!")
     await msg.delete()
-    users = await db.get_all_users()
     b_msg = message.reply_to_message
-    b_sts = await message.reply_text(
-        text="<b>ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ ʏᴏᴜʀ ᴍᴇssᴀɢᴇs ᴛᴏ ᴜsᴇʀs ⌛️</b>"
+    if kind == "users":
+        text = "<b>ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ ʏᴏᴜʀ ᴍᴇssᴀɢᴇs ᴛᴏ ᴜsᴇʀs ⌛️</b>"
+        total = await db.total_users_count()
+    else:
+        text = "<b>ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ ʏᴏᴜʀ ᴍᴇssᴀɢᴇs ᴛᴏ ɢʀᴏᴜᴘs ⏳</b>"
+        total = await db.total_chat_count()
+    b_sts = await message.reply_text(text=text)
+    # "/broadcast dry" only reports dead recipients instead of removing them
+    dry_run = len(message.command) > 1 and message.command[1].lower() == "dry"
+    job = await db.create_broadcast(
+        kind,
+        b_msg.chat.id,
+        b_msg.id,
+        is_pin,
+        b_sts.chat.id,
+        b_sts.id,
+        total,
+        dry_run=dry_run,
     )
-    start_time = time.time()
-    total_users = await db.total_users_count()
-    done = 0
-    blocked = 0
-    deleted = 0
-    failed = 0
-    success = 0
-
-    async with lock:
-        async for user in users:
-            time_taken = get_readable_time(time.time() - start_time)
-            if temp.USERS_CANCEL:
-                temp.USERS_CANCEL = False
-                await b_sts.edit(
-                    f"Users broadcast Cancelled!\nCompleted in {time_taken}\n\nTotal Users: <code>{total_users}</code>\nCompleted: <code>{done} / {total_users}</code>\nSuccess: <code>{success}</code>"
-                )
-                return
-            sts = await users_broadcast(int(user["id"]), b_msg, is_pin)
-            if sts == "Success":
-                success += 1
-            elif sts == "Error":
-                failed += 1
-            done += 1
-            if not done % 80:
-                btn = [
-                    [
-                        InlineKeyboardButton(
-                            "CANCEL", callback_data="broadcast_cancel#users"
-                        )
-                    ]
-                ]
-                await b_sts.edit(
-                    f"Users broadcast in progress...\n\nTotal Users: <code>{total_users}</code>\nCompleted: <code>{done} / {total_users}</code>\nSuccess: <code>{success}</code>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                )
-        await b_sts.edit(
-            f"Users broadcast completed.\nCompleted in {time_taken}\n\nTotal Users: <code>{total_users}</code>\nCompleted: <code>{done} / {total_users}</code>\nSuccess: <code>{success}</code>"
-        )
+    await run_broadcast(bot, job)
+
+
+async def resume_broadcasts(bot):
+    for job in await db.get_running_broadcasts():
+        if await db.count_broadcast_resume(job["_id"]) >= MAX_RESUMES:
+            logging.error(f"Broadcast {job['_id']} kept dying, marking it failed")
+            await db.update_broadcast(
+                job["_id"], job["cursor"], job["done"], job["stats"], state="failed"
+            )
+            continue
+        logging.info(f"Resuming {job['kind']} broadcast {job['_id']}")
+        asyncio.create_task(run_broadcast(bot, job))
+
+
+@Client.on_callback_query(filters.regex(r"^broadcast_cancel"))
+async def broadcast_cancel(bot, query):
+    _, ident = query.data.split("#")
+    if ident == "users":
+        await query.message.edit("ᴛʀʏɪɴɢ ᴛᴏ ᴄᴀɴᴄᴇʟ ᴜsᴇʀs ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ...")
+        temp.USERS_CANCEL = True
+    elif ident == "groups":
+        temp.GROUPS_CANCEL = True
+        await query.message.edit("ᴛʀʏɪɴɢ ᴛᴏ ᴄᴀɴᴄᴇʟ ɢʀᴏᴜᴘs ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ...")
+
+
+@Client.on_message(filters.command("broadcast") & filters.user(ADMINS) & filters.reply)
+async def broadcast_users(bot, message):
+    await start_broadcast(bot, message, "users")
 
 
 @Client.on_message(
     filters.command("grp_broadcast") & filters.user(ADMINS) & filters.reply
 )
 async def broadcast_group(bot, message):
-    msg = await message.ask(
-        "<b>Do you want pin this message in groups?</b>",
-        reply_markup=ReplyKeyboardMarkup(
-            [["Yes", "No"]], one_time_keyboard=True, resize_keyboard=True
-        ),
-    )
-    if msg.text == "Yes":
-        is_pin = True
-    elif msg.text == "No":
-        is_pin = False
-    else:
-        return await msg.edit("Wrong Response!")
-    await msg.delete()
-    chats = await db.get_all_chats()
-    b_msg = message.reply_to_message
-    b_sts = await message.reply_text(
-        text="<b>ʙʀᴏᴀᴅᴄᴀsᴛɪɴɢ ʏᴏᴜʀ ᴍᴇssᴀɢᴇs ᴛᴏ ɢʀᴏᴜᴘs ⏳</b>"
-    )
-    start_time = time.time()
-    total_chats = await db.total_chat_count()
-    done = 0
-    failed = 0
-    success = 0
-
-    async with lock:
-        async for chat in chats:
-            time_taken = get_readable_time(time.time() - start_time)
-            if temp.GROUPS_CANCEL:
-                temp.GROUPS_CANCEL = False
-                await b_sts.edit(
-                    f"Groups broadcast Cancelled!\nCompleted in {time_taken}\n\nTotal Groups: <code>{total_chats}</code>\nCompleted: <code>{done} / {total_chats}</code>\nSuccess: <code>{success}</code>\nFailed: <code>{failed}</code>"
-                )
-                return
-            sts = await groups_broadcast(int(chat["id"]), b_msg, is_pin)
-            if sts == "Success":
-                success += 1
-            elif sts == "Error":
-                failed += 1
-            done += 1
-            if not done % 30:
-                btn = [
-                    [
-                        InlineKeyboardButton(
-                            "CANCEL", callback_data="broadcast_cancel#groups"
-                        )
-                    ]
-                ]
-                await b_sts.edit(
-                    f"Groups groadcast in progress...\n\nTotal Groups: <code>{total_chats}</code>\nCompleted: <code>{done} / {total_chats}</code>\nSuccess: <code>{success}</code>\nFailed: <code>{failed}</code>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                )
-        await b_sts.edit(
-            f"Groups broadcast completed.\nCompleted in {time_taken}\n\nTotal Groups: <code>{total_chats}</code>\nCompleted: <code>{done} / {total_chats}</code>\nSuccess: <code>{success}</code>\nFailed: <code>{failed}</code>"
-        )
+    await start_broadcast(bot, message, "groups")
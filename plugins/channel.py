@@ -1,7 +1,10 @@
 # --| This code created by: Jisshu_bots & SilentXBotz |--#
 import re
+import time
+import heapq
 import hashlib
 import asyncio
+import logging
 from info import *
 from utils import *
 from pyrogram import Client, filters
@@ -9,7 +12,9 @@ from database.users_chats_db import db
 from database.ia_filterdb import save_file, unpack_new_file_id
 import aiohttp
 from typing import Optional
+from Jisshu.util.http import get_session
 from collections import defaultdict
+from Jisshu.util.metrics import Counter, Gauge
 
 CAPTION_LANGUAGES = [
     "Bhojpuri",
@@ -54,10 +59,11 @@ UPDATE_CAPTION = """<b>𝖭𝖤𝖶 {} 𝖠𝖣𝖣𝖤𝖣 ✅</b>
 
 QUALITY_CAPTION = """📦 {} : {}\n"""
 
-notified_movies = set()
-movie_files = defaultdict(list)
-POST_DELAY = 10
-processing_movies = set()
+logger = logging.getLogger(__name__)
+
+# title -> IMDb/poster lookup, shared by every upload of the same title
+LOOKUP_TTL = 6 * 60 * 60
+lookups = {}
 
 media_filter = filters.document | filters.video | filters.audio
 
@@ -99,7 +105,8 @@ async def queue_movie_file(bot, media):
         )
         file_size_str = format_file_size(media.file_size)
         file_id, file_ref = unpack_new_file_id(media.file_id)
-        movie_files[file_name].append(
+        await announce_queue.add(
+            file_name,
             {
                 "quality": quality,
                 "jisshuquality": jisshuquality,
@@ -108,35 +115,28 @@ async def queue_movie_file(bot, media):
                 "caption": caption,
                 "language": language,
                 "year": year,
-            }
+            },
         )
-        if file_name in processing_movies:
-            return
-        processing_movies.add(file_name)
-        try:
-            await asyncio.sleep(POST_DELAY)
-            if file_name in movie_files:
-                await send_movie_update(bot, file_name, movie_files[file_name])
-                del movie_files[file_name]
-        finally:
-            processing_movies.remove(file_name)
     except Exception as e:
         print(f"Error in queue_movie_file: {e}")
-        if file_name in processing_movies:
-            processing_movies.remove(file_name)
         await bot.send_message(LOG_CHANNEL, f"Failed to send movie update. Error - {e}'\n\n<blockquote>If you don’t understand this error, you can ask in our support group: @Jisshu_support.</blockquote>")
 
+
 async def send_movie_update(bot, file_name, files):
     try:
-        if file_name in notified_movies:
-            return
-        notified_movies.add(file_name)
-
-        imdb_data = await get_imdb(file_name)
-        title = imdb_data.get("title", file_name)
         year_match = re.search(r"\b(19|20)\d{2}\b", file_name)
         year = year_match.group(0) if year_match else None
-        poster = await fetch_movie_poster(title, files[0]["year"])
+        # the poster api is queried with the file title so it can run alongside IMDb
+        poster_title = file_name.replace(year, "").strip() if year else file_name
+        imdb_data, poster = await asyncio.gather(
+            cached_lookup("imdb", file_name, lambda: get_imdb(file_name)),
+            cached_lookup(
+                "poster",
+                poster_title,
+                lambda: fetch_movie_poster(poster_title, files[0]["year"]),
+            ),
+        )
+        title = imdb_data.get("title") or file_name
         kind = imdb_data.get("kind", "").strip().upper().replace(" ", "_") if imdb_data else ""
         if kind == "TV_SERIES":
            kind = "SERIES"
@@ -206,10 +206,146 @@ async def send_movie_update(bot, file_name, files):
             caption=full_caption,
             parse_mode=enums.ParseMode.HTML
         )
+        return True
 
     except Exception as e:
         print('Failed to send movie update. Error - ', e)
         await bot.send_message(LOG_CHANNEL, f"Failed to send movie update. Error - {e}'\n\n<blockquote>If you don’t understand this error, you can ask in our support group: @Jisshu_support.</blockquote>")
+        return False
+
+
+class AnnounceQueue:
+    """Debounces movie update posts with one scheduler task.
+
+    Files of a title are pushed to mongo and the title is posted ANNOUNCE_DELAY
+    seconds after its last file, or ANNOUNCE_MAX_WAIT seconds after its first
+    during a long upload. Memory only holds a heap of due times per pending
+    title, and the ``announced`` collection (expiring after ANNOUNCE_DEDUPE_TTL)
+    keeps titles from being posted twice, also across restarts.
+    """
+
+    POST_WORKERS = 3
+    # a post that failed is retried after RETRY_DELAY, RETRIES times at most
+    RETRIES = 3
+    RETRY_DELAY = 60
+
+    def __init__(self):
+        # one (post time, title) entry per pending title; a title whose files
+        # kept coming is pushed back when its entry comes up
+        self.heap = []
+        # title -> (first file time, last file time + ANNOUNCE_DELAY)
+        self.pending = {}
+        self.wakeup = asyncio.Event()
+        self.posting = set()
+        self.workers = asyncio.Semaphore(self.POST_WORKERS)
+
+    @staticmethod
+    def post_time(first, due):
+        return min(due, first + ANNOUNCE_MAX_WAIT)
+
+    def _push(self, title, first, due):
+        queued = title in self.pending
+        self.pending[title] = (first, due)
+        if queued:
+            return
+        when = self.post_time(first, due)
+        if not self.heap or when < self.heap[0][0]:
+            self.wakeup.set()
+        heapq.heappush(self.heap, (when, title))
+
+    async def add(self, title, file):
+        if title not in self.pending and await db.is_announced(title):
+            announcements.inc("duplicate")
+            return
+        now = time.time()
+        first = self.pending.get(title, (now, None))[0]
+        await db.queue_announcement(title, file, first, now + ANNOUNCE_DELAY)
+        self._push(title, first, now + ANNOUNCE_DELAY)
+
+    async def _post(self, bot, title):
+        async with self.workers:
+            try:
+                job = await db.pop_announcement(title)
+                if not job:
+                    return
+                if not await db.claim_announcement(title):
+                    announcements.inc("duplicate")
+                    return
+                if await send_movie_update(bot, title, job["files"]):
+                    announcements.inc("posted")
+                    return
+                announcements.inc("failed")
+                await db.release_announcement(title)
+                attempts = job.get("attempts", 0) + 1
+                if attempts >= self.RETRIES:
+                    logger.error(f"Giving up on movie update for {title}")
+                    return
+                now = time.time()
+                await db.requeue_announcement(
+                    title, job["files"], now, now + self.RETRY_DELAY, attempts
+                )
+                self._push(title, now, now + self.RETRY_DELAY)
+            except Exception:
+                announcements.inc("failed")
+                logger.exception(f"Posting movie update for {title} failed")
+
+    async def run(self, bot):
+        now = time.time()
+        for doc in await db.get_queued_announcements():
+            self._push(doc["_id"], doc.get("first", now), max(doc.get("due", now), now))
+        while True:
+            self.wakeup.clear()
+            timeout = self.heap[0][0] - time.time() if self.heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            _, title = heapq.heappop(self.heap)
+            when = self.post_time(*self.pending[title])
+            if when > time.time():
+                heapq.heappush(self.heap, (when, title))
+                continue
+            del self.pending[title]
+            task = asyncio.create_task(self._post(bot, title))
+            self.posting.add(task)
+            task.add_done_callback(self.posting.discard)
+
+
+announce_queue = AnnounceQueue()
+announce_depth = Gauge(
+    "bot_announce_queue_depth",
+    "Titles waiting for a movie update post",
+    collect=lambda: {(): len(announce_queue.pending)},
+)
+announcements = Counter(
+    "bot_announcements_total", "Movie update titles by outcome", ("result",)
+)
+
+
+def cached_lookup(kind, key, fetch):
+    """Returns the running or finished lookup for ``key``, starting it if needed.
+
+    Empty results are dropped once done so a failed lookup is retried next time.
+    """
+    now = time.monotonic()
+    entry = lookups.get((kind, key))
+    if entry and entry[0] > now:
+        return entry[1]
+    if len(lookups) > 1000:
+        for k in [k for k, (expires, _) in lookups.items() if expires <= now]:
+            del lookups[k]
+    task = asyncio.ensure_future(fetch())
+
+    def forget_empty(done):
+        if done.cancelled() or done.exception() or not done.result():
+            if lookups.get((kind, key), (0, None))[1] is done:
+                del lookups[(kind, key)]
+
+    task.add_done_callback(forget_empty)
+    lookups[(kind, key)] = (now + LOOKUP_TTL, task)
+    return task
 
 
 async def get_imdb(file_name):
@@ -230,34 +366,33 @@ async def get_imdb(file_name):
 
 
 async def fetch_movie_poster(title: str, year: Optional[int] = None) -> Optional[str]:
-    async with aiohttp.ClientSession() as session:
-        query = title.strip().replace(" ", "+")
-        url = f"https://jisshuapis.vercel.app/api.php?query={query}"
-        try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as res:
-                if res.status != 200:
-                    print(f"API Error: HTTP {res.status}")
-                    return None
-                data = await res.json()
-
-                for key in ["jisshu-2", "jisshu-3", "jisshu-4"]:
-                    posters = data.get(key)
-                    if posters and isinstance(posters, list) and posters:
-                        return posters[0]
-
-                print(f"No Poster Found in jisshu-2/3/4 for Title: {title}")
+    query = title.strip().replace(" ", "+")
+    url = f"https://jisshuapis.vercel.app/api.php?query={query}"
+    try:
+        async with get_session().get(url, timeout=aiohttp.ClientTimeout(total=5)) as res:
+            if res.status != 200:
+                print(f"API Error: HTTP {res.status}")
                 return None
+            data = await res.json()
 
-        except aiohttp.ClientError as e:
-            print(f"Network Error: {e}")
-            return None
-        except asyncio.TimeoutError:
-            print("Request Timed Out")
-            return None
-        except Exception as e:
-            print(f"Unexpected Error: {e}")
+            for key in ["jisshu-2", "jisshu-3", "jisshu-4"]:
+                posters = data.get(key)
+                if posters and isinstance(posters, list) and posters:
+                    return posters[0]
+
+            print(f"No Poster Found in jisshu-2/3/4 for Title: {title}")
             return None
 
+    except aiohttp.ClientError as e:
+        print(f"Network Error: {e}")
+        return None
+    except asyncio.TimeoutError:
+        print("Request Timed Out")
+        return None
+    except Exception as e:
+        print(f"Unexpected Error: {e}")
+        return None
+
 
 def generate_unique_id(movie_name):
     return hashlib.md5(movie_name.encode("utf-8")).hexdigest()[:5]
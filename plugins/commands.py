@@ -1,4 +1,5 @@
 import os
+import tempfile
 import requests
 import logging
 import random
@@ -17,21 +18,23 @@ from pyrogram.types import (
 from database.ia_filterdb import (
     Media,
     get_file_details,
-    get_bad_files,
+    count_bad_files,
+    iter_bad_files,
     unpack_new_file_id,
 )
 from database.users_chats_db import db
 from database.config_db import mdb
-from database.topdb import JsTopDB
+from database.topdb import movie_series_db
 from database.jsreferdb import referdb
 from plugins.pm_filter import auto_filter
+from Jisshu.util.autodelete import auto_deleter
+from Jisshu.util.results import file_label
+from Jisshu.util.delivery import send_files
 from utils import (
-    formate_file_name,
     get_settings,
     save_group_settings,
     is_req_subscribed,
     is_subscribed,
-    get_size,
     get_shortlink,
     is_check_admin,
     get_status,
@@ -44,7 +47,6 @@ import base64
 from info import *
 
 logger = logging.getLogger(__name__)
-movie_series_db = JsTopDB(DATABASE_URI)
 verification_ids = {}
 
 
@@ -63,14 +65,11 @@ async def start(client: Client, message):
             await message.reply("<b>ʟɪɴᴋ ᴇxᴘɪʀᴇᴅ ᴛʀʏ ᴀɢᴀɪɴ...</b>")
             return
         ist_timezone = pytz.timezone("Asia/Kolkata")
-        if await db.user_verified(user_id):
+        state = await db.get_access_state(user_id)
+        if state["second_verified"]:
             key = "third_time_verified"
         else:
-            key = (
-                "second_time_verified"
-                if await db.is_user_verified(user_id)
-                else "last_verified"
-            )
+            key = "second_time_verified" if state["verified"] else "last_verified"
         current_time = dt.now(tz=ist_timezone)
         result = await db.update_notcopy_user(user_id, {key: current_time})
         await db.update_verify_id_info(user_id, verify_id, {"verified": True})
@@ -121,9 +120,7 @@ async def start(client: Client, message):
     if message.chat.type in [enums.ChatType.GROUP, enums.ChatType.SUPERGROUP]:
         status = get_status()
         aks = await message.reply_text(f"<b>🔥 ʏᴇs {status},\nʜᴏᴡ ᴄᴀɴ ɪ ʜᴇʟᴘ ʏᴏᴜ??</b>")
-        await asyncio.sleep(600)
-        await aks.delete()
-        await m.delete()
+        auto_deleter.schedule([aks, m], 600)
         if not await db.get_chat(message.chat.id):
             total = await client.get_chat_members_count(message.chat.id)
             group_link = await message.chat.export_invite_link()
@@ -232,7 +229,7 @@ async def start(client: Client, message):
         if user_id == message.from_user.id:
             await message.reply_text("𝖧𝖾𝗒 𝖣𝗎𝖽𝖾 𝖸𝗈𝗎 𝖢𝖺𝗇'𝗍 𝖱𝖾𝖿𝖾𝗋 𝖸𝗈𝗎𝗋𝗌𝖾𝗅𝖿⁉️")
             return
-        if referdb.is_user_in_list(message.from_user.id):
+        if await referdb.is_user_in_list(message.from_user.id):
             await message.reply_text("‼️ 𝖸𝗈𝗎 𝖧𝖺𝗏𝖾 𝖡𝖾𝖾𝗇 𝖠𝗅𝗅𝗋𝖾𝖺𝖽𝗒 𝖨𝗇𝗏𝗂𝗍𝖾𝖽 𝗈𝗋 𝖩𝗈𝗂𝗇𝖾𝖽")
             return
         if await db.is_user_exist(message.from_user.id):
@@ -242,17 +239,16 @@ async def start(client: Client, message):
             uss = await client.get_users(user_id)
         except Exception:
             return
-        referdb.add_user(message.from_user.id)
-        fromuse = referdb.get_refer_points(user_id) + 10
+        await referdb.add_user(message.from_user.id)
+        fromuse = await referdb.inc_refer_points(user_id, 10)
         if fromuse == 100:
-            referdb.add_refer_points(user_id, 0)
+            await referdb.add_refer_points(user_id, 0)
             await message.reply_text(f"𝖸𝗈𝗎 𝖧𝖺𝗏𝖾 𝖡𝖾𝖾𝗇 𝖨𝗇𝗏𝗂𝗍𝖾𝖽 𝖡𝗒 {uss.mention}!")
             await client.send_message(
                 user_id, text=f"𝖸𝗈𝗎 𝖧𝖺𝗏𝖾 𝖡𝖾𝖾𝗇 𝖨𝗇𝗏𝗂𝗍𝖾𝖽 𝖡𝗒 {message.from_user.mention}!"
             )
             await add_premium(client, user_id, uss)
         else:
-            referdb.add_refer_points(user_id, fromuse)
             await message.reply_text(f"𝖸𝗈𝗎 𝖧𝖺𝗏𝖾 𝖡𝖾𝖾𝗇 𝖨𝗇𝗏𝗂𝗍𝖾𝖽 𝖡𝗒 {uss.mention}!")
             await client.send_message(
                 user_id, f"𝖸𝗈𝗎 𝖧𝖺𝗏𝖾 𝖨𝗇𝗏𝗂𝗍𝖾𝖽 {message.from_user.mention}!"
@@ -268,7 +264,7 @@ async def start(client: Client, message):
 
     if len(message.command) == 2 and message.command[1] in ["ads"]:
         msg, _, impression = await mdb.get_advirtisment()
-        user = await db.get_user(message.from_user.id)
+        user = await db.get_user(message.from_user.id) or {}
         seen_ads = user.get("seen_ads", False)
         JISSHU_ADS_LINK = await db.jisshu_get_ads_link()
         buttons = [[InlineKeyboardButton("❌ ᴄʟᴏꜱᴇ ❌", callback_data="close_data")]]
@@ -281,7 +277,7 @@ async def start(client: Client, message):
                 parse_mode=enums.ParseMode.HTML,
             )
             if impression is not None and not seen_ads:
-                await mdb.update_advirtisment_impression(int(impression) - 1)
+                mdb.decrement_advirtisment_impression()
                 await db.update_value(message.from_user.id, "seen_ads", True)
         else:
             await message.reply("<b>No Ads Found</b>")
@@ -331,9 +327,10 @@ async def start(client: Client, message):
         id = settings.get("fsub_id", AUTH_CHANNEL)
         channel = int(id)
         btn = []
-        if channel != AUTH_CHANNEL and not await is_subscribed(
-            client, message.from_user.id, channel
-        ):
+        # both answers come from utils.member_cache after the first click
+        in_channel = await is_subscribed(client, message.from_user.id, channel)
+        req_joined = await is_req_subscribed(client, message)
+        if channel != AUTH_CHANNEL and not in_channel:
             invite_link_custom = await client.create_chat_invite_link(channel)
             btn.append(
                 [
@@ -342,7 +339,7 @@ async def start(client: Client, message):
                     )
                 ]
             )
-        if not await is_req_subscribed(client, message):
+        if not req_joined:
             invite_link_default = await client.create_chat_invite_link(
                 int(AUTH_CHANNEL), creates_join_request=True
             )
@@ -353,10 +350,7 @@ async def start(client: Client, message):
                     )
                 ]
             )
-        if message.command[1] != "subscribe" and (
-            await is_req_subscribed(client, message) is False
-            or await is_subscribed(client, message.from_user.id, channel) is False
-        ):
+        if message.command[1] != "subscribe" and (not req_joined or not in_channel):
             btn.append(
                 [
                     InlineKeyboardButton(
@@ -376,18 +370,21 @@ async def start(client: Client, message):
             return
 
     user_id = m.from_user.id
-    if not await db.has_premium_access(user_id):
+    state = await db.get_access_state(user_id)
+    if not state["premium"]:
         grp_id = int(grp_id)
         print(f"Group Id - {grp_id}")
-        user_verified = await db.is_user_verified(user_id)
         settings = await get_settings(grp_id)
         print(f"Id Settings - {settings}")
-        is_second_shortener = await db.use_second_shortener(
-            user_id, settings.get("verify_time", TWO_VERIFY_GAP)
-        )
-        is_third_shortener = await db.use_third_shortener(
-            user_id, settings.get("third_verify_time", THREE_VERIFY_GAP)
+        # served from the cache filled above, no extra round trip
+        state = await db.get_access_state(
+            user_id,
+            settings.get("verify_time", TWO_VERIFY_GAP),
+            settings.get("third_verify_time", THREE_VERIFY_GAP),
         )
+        user_verified = state["verified"]
+        is_second_shortener = state["second_shortener"]
+        is_third_shortener = state["third_shortener"]
         if (
             settings.get("is_verify", IS_VERIFY)
             and not user_verified
@@ -434,7 +431,7 @@ async def start(client: Client, message):
                 ],
             ]
             reply_markup = InlineKeyboardMarkup(buttons)
-            if await db.user_verified(user_id):
+            if state["second_verified"]:
                 msg = script.THIRDT_VERIFICATION_TEXT
             else:
                 msg = (
@@ -448,9 +445,7 @@ async def start(client: Client, message):
                 reply_markup=reply_markup,
                 parse_mode=enums.ParseMode.HTML,
             )
-            await asyncio.sleep(300)
-            await d.delete()
-            await m.delete()
+            auto_deleter.schedule([d, m], 300)
             return
 
     if data and data.startswith("allfiles"):
@@ -459,17 +454,19 @@ async def start(client: Client, message):
         if not files:
             await message.reply_text("<b>⚠️ ᴀʟʟ ꜰɪʟᴇs ɴᴏᴛ ꜰᴏᴜɴᴅ ⚠️</b>")
             return
-        files_to_delete = []
-        for file in files:
-            user_id = message.from_user.id
-            grp_id = temp.CHAT.get(user_id)
-            settings = await get_settings(grp_id)
-            CAPTION = settings["caption"]
-            f_caption = CAPTION.format(
-                file_name=formate_file_name(file.file_name),
-                file_size=get_size(file.file_size),
+        user_id = message.from_user.id
+        settings = await get_settings(temp.CHAT.get(user_id))
+        CAPTION = settings["caption"]
+
+        def caption(file):
+            name, size = file_label(file)
+            return CAPTION.format(
+                file_name=name,
+                file_size=size,
                 file_caption=file.caption,
             )
+
+        def buttons(file):
             btn = [
                 [
                     InlineKeyboardButton(
@@ -477,13 +474,11 @@ async def start(client: Client, message):
                     )
                 ]
             ]
-            toDel = await client.send_cached_media(
-                chat_id=message.from_user.id,
-                file_id=file.file_id,
-                caption=f_caption,
-                reply_markup=InlineKeyboardMarkup(btn),
-            )
-            files_to_delete.append(toDel)
+            return InlineKeyboardMarkup(btn)
+
+        files_to_delete = await send_files(
+            client, user_id, files, caption, buttons, album=SEND_ALL_ALBUM
+        )
 
         delCap = "<i>ᴀʟʟ {} ꜰɪʟᴇꜱ ᴡɪʟʟ ʙᴇ ᴅᴇʟᴇᴛᴇᴅ ᴀꜰᴛᴇʀ {} ᴛᴏ ᴀᴠᴏɪᴅ ᴄᴏᴘʏʀɪɢʜᴛ ᴠɪᴏʟᴀᴛɪᴏɴs!</i>".format(
             len(files_to_delete),
@@ -502,14 +497,8 @@ async def start(client: Client, message):
             ),
         )
         replyed = await message.reply(delCap)
-        await asyncio.sleep(FILE_AUTO_DEL_TIMER)
-        for file in files_to_delete:
-            try:
-                await file.delete()
-            except:
-                pass
-        return await replyed.edit(
-            afterDelCap,
+        return auto_deleter.schedule(
+            files_to_delete, FILE_AUTO_DEL_TIMER, edit=(replyed, afterDelCap)
         )
     if not data:
         return
@@ -523,9 +512,10 @@ async def start(client: Client, message):
     files = files_[0]
     settings = await get_settings(grp_id)
     CAPTION = settings["caption"]
+    name, size = file_label(files)
     f_caption = CAPTION.format(
-        file_name=formate_file_name(files.file_name),
-        file_size=get_size(files.file_size),
+        file_name=name,
+        file_size=size,
         file_caption=files.caption,
     )
     btn = [
@@ -554,9 +544,7 @@ async def start(client: Client, message):
         )
     )
     replyed = await message.reply(delCap, reply_to_message_id=toDel.id)
-    await asyncio.sleep(FILE_AUTO_DEL_TIMER)
-    await toDel.delete()
-    return await replyed.edit(afterDelCap)
+    auto_deleter.schedule([toDel], FILE_AUTO_DEL_TIMER, edit=(replyed, afterDelCap))
 
 
 @Client.on_message(filters.command("delete"))
@@ -816,24 +804,29 @@ async def search_files(bot, message):
         return await message.reply_text(
             f"<b>Hey {message.from_user.mention}, give me a keyword along with the command to delete files.</b>"
         )
-    files, total = await get_bad_files(keyword)
-    if int(total) == 0:
-        await message.reply_text(
-            "<i>I could not find any files with this keyword 😐</i>"
+    total = 0
+    # written while the cursor streams, the result set is never held in memory;
+    # a temp file per request so concurrent searches don't overwrite each other
+    fd, path = tempfile.mkstemp(prefix="search_", suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(f"🚫 Your search - '{keyword}':")
+            async for file_name in iter_bad_files(keyword):
+                total += 1
+                file.write(f"\n\n{total}. {file_name}")
+        if total == 0:
+            await message.reply_text(
+                "<i>I could not find any files with this keyword 😐</i>"
+            )
+            return
+        await message.reply_document(
+            document=path,
+            file_name="file_names.txt",
+            caption=f"<b>♻️ ʙʏ ʏᴏᴜʀ ꜱᴇᴀʀᴄʜ, ɪ ꜰᴏᴜɴᴅ - <code>{total}</code> ꜰɪʟᴇs</b>",
+            parse_mode=enums.ParseMode.HTML,
         )
-        return
-    file_names = "\n\n".join(
-        f"{index + 1}. {item['file_name']}" for index, item in enumerate(files)
-    )
-    file_data = f"🚫 Your search - '{keyword}':\n\n{file_names}"
-    with open("file_names.txt", "w", encoding="utf-8") as file:
-        file.write(file_data)
-    await message.reply_document(
-        document="file_names.txt",
-        caption=f"<b>♻️ ʙʏ ʏᴏᴜʀ ꜱᴇᴀʀᴄʜ, ɪ ꜰᴏᴜɴᴅ - <code>{total}</code> ꜰɪʟᴇs</b>",
-        parse_mode=enums.ParseMode.HTML,
-    )
-    os.remove("file_names.txt")
+    finally:
+        os.remove(path)
 
 
 @Client.on_message(filters.command("deletefiles"))
@@ -854,12 +847,28 @@ async def deletemultiplefiles(bot, message):
         return await message.reply_text(
             f"<b>ʜᴇʏ {message.from_user.mention}, ɢɪᴠᴇ ᴍᴇ ᴀ ᴋᴇʏᴡᴏʀᴅ ᴀʟᴏɴɢ ᴡɪᴛʜ ᴛʜᴇ ᴄᴏᴍᴍᴀɴᴅ ᴛᴏ ᴅᴇʟᴇᴛᴇ ꜰɪʟᴇs.</b>"
         )
-    files, total = await get_bad_files(keyword)
+    # "/deletefiles dry <keyword>" only shows what would be deleted
+    dry_run = False
+    if keyword.split(" ", 1)[0].lower() == "dry" and " " in keyword:
+        dry_run = True
+        keyword = keyword.split(" ", 1)[1]
+    total = await count_bad_files(keyword)
     if int(total) == 0:
         await message.reply_text(
             "<i>ɪ ᴄᴏᴜʟᴅ ɴᴏᴛ ꜰɪɴᴅ ᴀɴʏ ꜰɪʟᴇs ᴡɪᴛʜ ᴛʜɪs ᴋᴇʏᴡᴏʀᴅ 😐</i>"
         )
         return
+    if dry_run:
+        sample = []
+        async for file_name in iter_bad_files(keyword):
+            sample.append(f"{len(sample) + 1}. {file_name}")
+            if len(sample) == 10:
+                break
+        sample = "\n".join(sample)
+        return await message.reply_text(
+            f"<b>Dry run, nothing deleted.\n\n{total} files match <code>{keyword}</code>, first ones:</b>\n\n{sample}",
+            parse_mode=enums.ParseMode.HTML,
+        )
     btn = [
         [
             InlineKeyboardButton(
@@ -1263,8 +1272,7 @@ async def all_settings(client, message):
     dlt = await message.reply_text(
         text, reply_markup=reply_markup, disable_web_page_preview=True
     )
-    await asyncio.sleep(300)
-    await dlt.delete()
+    auto_deleter.schedule([dlt], 300)
 
 
 @Client.on_message(filters.command("set_time_2"))
@@ -1373,7 +1381,7 @@ async def refer(bot, message):
                 url=f"https://telegram.me/share/url?url=https://telegram.dog/{bot.me.username}?start=reff_{message.from_user.id}&text=Hello%21%20Experience%20a%20bot%20that%20offers%20a%20vast%20library%20of%20unlimited%20movies%20and%20series.%20%F0%9F%98%83",
             ),
             InlineKeyboardButton(
-                f"⏳ {referdb.get_refer_points(message.from_user.id)}",
+                f"⏳ {await referdb.get_refer_points(message.from_user.id)}",
                 callback_data="ref_point",
             ),
             InlineKeyboardButton("• ᴄʟᴏsᴇ •", callback_data="close_data"),
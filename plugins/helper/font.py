@@ -1,4 +1,3 @@
-from plugins.helper.fotnt_string import Fonts
 from pyrogram import Client, filters
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
@@ -102,6 +101,9 @@ async def nxt(c, m):
 
 @Client.on_callback_query(filters.regex("^style"))
 async def style(c, m):
+    # the font tables are big, only load them once someone uses /font
+    from plugins.helper.fotnt_string import Fonts
+
     await m.answer()
     cmd, style = m.data.split("+")
 
@@ -1,16 +1,33 @@
-from pyrogram import Client, filters
-from pyrogram.types import ChatJoinRequest
+from pyrogram import Client, filters, enums
+from pyrogram.types import ChatJoinRequest, ChatMemberUpdated
 from database.users_chats_db import db
 from info import ADMINS, AUTH_CHANNEL
+from utils import member_cache
 
 
 @Client.on_chat_join_request(filters.chat(AUTH_CHANNEL))
 async def join_reqs(client, message: ChatJoinRequest):
     if not await db.find_join_req(message.from_user.id):
         await db.add_join_req(message.from_user.id)
+    member_cache.set(("req", AUTH_CHANNEL, message.from_user.id), True)
+
+
+@Client.on_chat_member_updated()
+async def member_updated(client, update: ChatMemberUpdated):
+    # keep the force subscribe cache in sync with joins/leaves
+    member = update.new_chat_member or update.old_chat_member
+    if not member or not member.user:
+        return
+    member_cache.invalidate(update.chat.id, member.user.id)
+    if update.new_chat_member and update.new_chat_member.status not in (
+        enums.ChatMemberStatus.BANNED,
+        enums.ChatMemberStatus.LEFT,
+    ):
+        member_cache.set((update.chat.id, member.user.id), True)
 
 
 @Client.on_message(filters.command("delreq") & filters.private & filters.user(ADMINS))
 async def del_requests(client, message):
     await db.del_join_req()
+    member_cache.clear()
     await message.reply("<b>⚙ ꜱᴜᴄᴄᴇꜱꜱғᴜʟʟʏ ᴄʜᴀɴɴᴇʟ ʟᴇғᴛ ᴜꜱᴇʀꜱ ᴅᴇʟᴇᴛᴇᴅ</b>")
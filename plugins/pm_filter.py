@@ -1,6 +1,7 @@
 import asyncio
 import re
 import math
+import time
 from pyrogram.errors.exceptions.bad_request_400 import (
     MediaEmpty,
     PhotoInvalidDimensions,
@@ -23,19 +24,18 @@ from utils import (
     temp,
     get_settings,
     is_check_admin,
-    get_size,
     save_group_settings,
     get_poster,
     get_status,
     get_readable_time,
-    imdb,
-    formate_file_name,
+    get_imdb,
 )
 from database.users_chats_db import db
 from database.ia_filterdb import (
     Media,
     get_search_results,
-    get_bad_files,
+    count_bad_files,
+    delete_bad_files,
 )
 import random
 
@@ -52,14 +52,26 @@ from database.config_db import mdb
 import logging
 from urllib.parse import quote_plus
 from Jisshu.util.file_properties import get_name, get_hash
+from Jisshu.util.autodelete import auto_deleter
+from Jisshu.util.router import CallbackRouter
+from Jisshu.util.results import (
+    file_buttons,
+    send_all_row,
+    facet_row,
+    facet_nav,
+    ads_footer,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
+# every callback of this plugin goes through cb_handler -> router
+router = CallbackRouter()
+
 
 @Client.on_message(filters.private & filters.text & filters.incoming)
 async def pm_search(client, message):
-    await mdb.update_top_messages(message.from_user.id, message.text)
+    mdb.update_top_messages(message.text)
     bot_id = client.me.id
     user_id = message.from_user.id
     #   if user_id in ADMINS: return
@@ -89,7 +101,7 @@ async def pm_search(client, message):
 @Client.on_message(filters.group & filters.text & filters.incoming)
 async def group_search(client, message):
     # await message.react(emoji=random.choice(REACTIONS))
-    await mdb.update_top_messages(message.from_user.id, message.text)
+    mdb.update_top_messages(message.text)
     user_id = message.from_user.id if message.from_user else None
     chat_id = message.chat.id
     settings = await get_settings(chat_id)
@@ -114,8 +126,7 @@ async def group_search(client, message):
                         ]
                     ),
                 )
-                await asyncio.sleep(300)
-                return await msg.delete()
+                return auto_deleter.schedule([msg], 300)
             else:
                 return
         except Exception as e:
@@ -191,15 +202,10 @@ async def group_search(client, message):
 
     else:
         k = await message.reply_text("<b>⚠️ ᴀᴜᴛᴏ ꜰɪʟᴛᴇʀ ᴍᴏᴅᴇ ɪꜱ ᴏғғ...</b>")
-        await asyncio.sleep(10)
-        await k.delete()
-        try:
-            await message.delete()
-        except:
-            pass
+        auto_deleter.schedule([k, message], 10)
 
 
-@Client.on_callback_query(filters.regex(r"^reffff"))
+@router.route("reffff", prefix=True)
 async def refercall(bot, query):
     btn = [
         [
@@ -208,7 +214,7 @@ async def refercall(bot, query):
                 url=f"https://telegram.me/share/url?url=https://telegram.dog/{bot.me.username}?start=reff_{query.from_user.id}&text=Hello%21%20Experience%20a%20bot%20that%20offers%20a%20vast%20library%20of%20unlimited%20movies%20and%20series.%20%F0%9F%98%83",
             ),
             InlineKeyboardButton(
-                f"⏳ {referdb.get_refer_points(query.from_user.id)}",
+                f"⏳ {await referdb.get_refer_points(query.from_user.id)}",
                 callback_data="ref_point",
             ),
         ],
@@ -225,7 +231,7 @@ async def refercall(bot, query):
     await query.answer()
 
 
-@Client.on_callback_query(filters.regex("admincmd"))
+@router.route("admincmd", prefix=True)
 async def admin_commands(client, query):
     if query.from_user.id not in ADMINS:
         return await query.answer("ᴛʜɪꜱ ɪꜱ ɴᴏᴛ ꜰᴏʀ ʏᴏᴜ ʙʀᴏ!", show_alert=True)
@@ -249,7 +255,7 @@ async def admin_commands(client, query):
     )
 
 
-@Client.on_callback_query(filters.regex(r"^next"))
+@router.route("next", prefix=True)
 async def next_page(bot, query):
     ident, req, key, offset = query.data.split("_")
     if int(req) not in [query.from_user.id, 0]:
@@ -275,56 +281,17 @@ async def next_page(bot, query):
     if not files:
         return
     temp.FILES_ID[key] = files
-    ads, ads_name, _ = await mdb.get_advirtisment()
-    ads_text = ""
-    if ads is not None and ads_name is not None:
-        ads_url = f"https://telegram.dog/{temp.U_NAME}?start=ads"
-        ads_text = f"<a href={ads_url}>{ads_name}</a>"
-    js_ads = (
-        f"\n━━━━━━━━━━━━━━━━━━\n <b>{ads_text}</b> \n━━━━━━━━━━━━━━━━━━"
-        if ads_text
-        else ""
-    )
     settings = await get_settings(query.message.chat.id)
-    reqnxt = query.from_user.id if query.from_user else 0
     temp.CHAT[query.from_user.id] = query.message.chat.id
-    links = ""
-    if settings["link"]:
-        btn = []
-        for file_num, file in enumerate(files, start=offset + 1):
-            links += f"""<b>\n\n{file_num}. <a href=https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
-    else:
-        btn = [
-            [
-                InlineKeyboardButton(
-                    text=f"📁 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}",
-                    url=f"https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}",
-                ),
-            ]
-            for file in files
-        ]
-    btn.insert(
-        0,
-        [
-            InlineKeyboardButton(
-                "📥 sᴇɴᴅ ᴀʟʟ ғɪʟᴇs 📥", callback_data=f"send_all#{key}"
-            ),
-        ],
-    )
-    btn.insert(
-        1,
-        [
-            InlineKeyboardButton(
-                "ǫᴜᴀʟɪᴛʏ ", callback_data=f"qualities#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ꜱᴇᴀꜱᴏɴ", callback_data=f"seasons#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ʟᴀɴɢᴜᴀɢᴇ ", callback_data=f"languages#{key}#{offset}#{req}"
-            ),
-        ],
+    btn, links = file_buttons(
+        files,
+        query.message.chat.id,
+        start=offset + 1,
+        link_mode=settings["link"],
+        icon="📁",
     )
+    btn.insert(0, send_all_row(key))
+    btn.insert(1, facet_row(key, offset, req))
 
     if 0 < offset <= int(MAX_BTN):
         off_set = 0
@@ -373,11 +340,8 @@ async def next_page(bot, query):
             ],
         )
     if settings["link"]:
-        links = ""
-        for file_num, file in enumerate(files, start=offset + 1):
-            links += f"""<b>\n\n{file_num}. <a href=https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
         await query.message.edit_text(
-            cap + links + js_ads,
+            cap + links + await ads_footer(),
             disable_web_page_preview=True,
             parse_mode=enums.ParseMode.HTML,
             reply_markup=InlineKeyboardMarkup(btn),
@@ -390,7 +354,7 @@ async def next_page(bot, query):
     await query.answer()
 
 
-@Client.on_callback_query(filters.regex(r"^seasons#"))
+@router.route("seasons#", prefix=True)
 async def seasons_cb_handler(client: Client, query: CallbackQuery):
     _, key, offset, req = query.data.split("#")
     if int(req) != query.from_user.id:
@@ -424,7 +388,31 @@ async def seasons_cb_handler(client: Client, query: CallbackQuery):
     return
 
 
-@Client.on_callback_query(filters.regex(r"^season_search#"))
+async def show_facet_page(
+    query, route, value, key, files, offset, n_offset, total, orginal_offset, req
+):
+    temp.FILES_ID[key] = files
+    settings = await get_settings(query.message.chat.id)
+    temp.CHAT[query.from_user.id] = query.message.chat.id
+    btn, links = file_buttons(
+        files,
+        query.message.chat.id,
+        start=offset + 1,
+        link_mode=settings["link"],
+        user_id=query.from_user.id,
+    )
+    btn.insert(0, send_all_row(key))
+    btn.insert(1, facet_row(key, offset, req))
+    btn += facet_nav(route, value, key, offset, n_offset, total, orginal_offset, req)
+    await query.message.edit_text(
+        CAP.get(key) + links + await ads_footer(),
+        disable_web_page_preview=True,
+        parse_mode=enums.ParseMode.HTML,
+        reply_markup=InlineKeyboardMarkup(btn),
+    )
+
+
+@router.route("season_search#", prefix=True)
 async def season_search(client: Client, query: CallbackQuery):
     _, season, key, offset, orginal_offset, req = query.data.split("#")
     seas = int(season.split(" ", 1)[1])
@@ -437,7 +425,6 @@ async def season_search(client: Client, query: CallbackQuery):
         return await query.answer(script.ALRT_TXT, show_alert=True)
     offset = int(offset)
     search = BUTTONS.get(key)
-    cap = CAP.get(key)
     if not search:
         await query.answer(
             script.OLD_ALRT_TXT.format(query.from_user.first_name), show_alert=True
@@ -470,125 +457,21 @@ async def season_search(client: Client, query: CallbackQuery):
             )
             return
 
-    temp.FILES_ID[key] = files
-    reqnxt = query.from_user.id if query.from_user else 0
-    settings = await get_settings(query.message.chat.id)
-    temp.CHAT[query.from_user.id] = query.message.chat.id
-    ads, ads_name, _ = await mdb.get_advirtisment()
-    ads_text = ""
-    if ads is not None and ads_name is not None:
-        ads_url = f"https://telegram.dog/{temp.U_NAME}?start=ads"
-        ads_text = f"<a href={ads_url}>{ads_name}</a>"
-    js_ads = (
-        f"\n━━━━━━━━━━━━━━━━━━\n <b>{ads_text}</b> \n━━━━━━━━━━━━━━━━━━"
-        if ads_text
-        else ""
-    )
-    links = ""
-    if settings["link"]:
-        btn = []
-        for file_num, file in enumerate(files, start=offset + 1):
-            links += f"""<b>\n\n{file_num}. <a href=https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
-    else:
-        btn = [
-            [
-                InlineKeyboardButton(
-                    text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}",
-                    callback_data=f"cfiles#{reqnxt}#{file.file_id}",
-                ),
-            ]
-            for file in files
-        ]
-
-    btn.insert(
-        0,
-        [
-            InlineKeyboardButton(
-                "📥 sᴇɴᴅ ᴀʟʟ ғɪʟᴇs 📥", callback_data=f"send_all#{key}"
-            ),
-        ],
-    )
-    btn.insert(
-        1,
-        [
-            InlineKeyboardButton(
-                "ǫᴜᴀʟɪᴛʏ ", callback_data=f"qualities#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ꜱᴇᴀꜱᴏɴ", callback_data=f"seasons#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ʟᴀɴɢᴜᴀɢᴇ ", callback_data=f"languages#{key}#{offset}#{req}"
-            ),
-        ],
-    )
-
-    if n_offset == "":
-        btn.append(
-            [InlineKeyboardButton(text="🚸 ɴᴏ ᴍᴏʀᴇ ᴘᴀɢᴇs 🚸", callback_data="buttons")]
-        )
-    elif n_offset == 0:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    "⋞ ʙᴀᴄᴋ",
-                    callback_data=f"season_search#{season}#{key}#{offset- int(MAX_BTN)}#{orginal_offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-            ]
-        )
-    elif offset == 0:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-                InlineKeyboardButton(
-                    "ɴᴇxᴛ ⋟",
-                    callback_data=f"season_search#{season}#{key}#{n_offset}#{orginal_offset}#{req}",
-                ),
-            ]
-        )
-    else:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    "⋞ ʙᴀᴄᴋ",
-                    callback_data=f"season_search#{season}#{key}#{offset- int(MAX_BTN)}#{orginal_offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-                InlineKeyboardButton(
-                    "ɴᴇxᴛ ⋟",
-                    callback_data=f"season_search#{season}#{key}#{n_offset}#{orginal_offset}#{req}",
-                ),
-            ]
-        )
-
-    btn.append(
-        [
-            InlineKeyboardButton(
-                text="⋞ ʙᴀᴄᴋ ᴛᴏ ᴍᴀɪɴ ᴘᴀɢᴇ",
-                callback_data=f"next_{req}_{key}_{orginal_offset}",
-            ),
-        ]
-    )
-    await query.message.edit_text(
-        cap + links + js_ads,
-        disable_web_page_preview=True,
-        parse_mode=enums.ParseMode.HTML,
-        reply_markup=InlineKeyboardMarkup(btn),
+    await show_facet_page(
+        query,
+        "season_search",
+        season,
+        key,
+        files,
+        offset,
+        n_offset,
+        total,
+        orginal_offset,
+        req,
     )
-    return
 
 
-@Client.on_callback_query(filters.regex(r"^years#"))
+@router.route("years#", prefix=True)
 async def years_cb_handler(client: Client, query: CallbackQuery):
     _, key, offset, req = query.data.split("#")
     if int(req) != query.from_user.id:
@@ -622,14 +505,13 @@ async def years_cb_handler(client: Client, query: CallbackQuery):
     return
 
 
-@Client.on_callback_query(filters.regex(r"^years_search#"))
+@router.route("years_search#", prefix=True)
 async def year_search(client: Client, query: CallbackQuery):
     _, year, key, offset, orginal_offset, req = query.data.split("#")
     if int(req) != query.from_user.id:
         return await query.answer(script.ALRT_TXT, show_alert=True)
     offset = int(offset)
     search = BUTTONS.get(key)
-    cap = CAP.get(key)
     if not search:
         await query.answer(
             script.OLD_ALRT_TXT.format(query.from_user.first_name), show_alert=True
@@ -650,125 +532,21 @@ async def year_search(client: Client, query: CallbackQuery):
         )
         return
 
-    temp.FILES_ID[key] = files
-    reqnxt = query.from_user.id if query.from_user else 0
-    settings = await get_settings(query.message.chat.id)
-    temp.CHAT[query.from_user.id] = query.message.chat.id
-    ads, ads_name, _ = await mdb.get_advirtisment()
-    ads_text = ""
-    if ads is not None and ads_name is not None:
-        ads_url = f"https://telegram.dog/{temp.U_NAME}?start=ads"
-        ads_text = f"<a href={ads_url}>{ads_name}</a>"
-    js_ads = (
-        f"\n━━━━━━━━━━━━━━━━━━\n <b>{ads_text}</b> \n━━━━━━━━━━━━━━━━━━"
-        if ads_text
-        else ""
-    )
-    links = ""
-    if settings["link"]:
-        btn = []
-        for file_num, file in enumerate(files, start=offset + 1):
-            links += f"""<b>\n\n{file_num}. <a href=https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
-    else:
-        btn = [
-            [
-                InlineKeyboardButton(
-                    text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}",
-                    callback_data=f"cfiles#{reqnxt}#{file.file_id}",
-                ),
-            ]
-            for file in files
-        ]
-
-    btn.insert(
-        0,
-        [
-            InlineKeyboardButton(
-                "📥 sᴇɴᴅ ᴀʟʟ ғɪʟᴇs 📥", callback_data=f"send_all#{key}"
-            ),
-        ],
-    )
-    btn.insert(
-        1,
-        [
-            InlineKeyboardButton(
-                "ǫᴜᴀʟɪᴛʏ ", callback_data=f"qualities#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ꜱᴇᴀꜱᴏɴ", callback_data=f"seasons#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ʟᴀɴɢᴜᴀɢᴇ ", callback_data=f"languages#{key}#{offset}#{req}"
-            ),
-        ],
-    )
-
-    if n_offset == "":
-        btn.append(
-            [InlineKeyboardButton(text="🚸 ɴᴏ ᴍᴏʀᴇ ᴘᴀɢᴇs 🚸", callback_data="buttons")]
-        )
-    elif n_offset == 0:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    "⋞ ʙᴀᴄᴋ",
-                    callback_data=f"years_search#{year}#{key}#{offset- int(MAX_BTN)}#{orginal_offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-            ]
-        )
-    elif offset == 0:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-                InlineKeyboardButton(
-                    "ɴᴇxᴛ ⋟",
-                    callback_data=f"years_search#{year}#{key}#{n_offset}#{orginal_offset}#{req}",
-                ),
-            ]
-        )
-    else:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    "⋞ ʙᴀᴄᴋ",
-                    callback_data=f"years_search#{year}#{key}#{offset- int(MAX_BTN)}#{orginal_offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-                InlineKeyboardButton(
-                    "ɴᴇxᴛ ⋟",
-                    callback_data=f"years_search#{year}#{key}#{n_offset}#{orginal_offset}#{req}",
-                ),
-            ]
-        )
-
-    btn.append(
-        [
-            InlineKeyboardButton(
-                text="⋞ ʙᴀᴄᴋ ᴛᴏ ᴍᴀɪɴ ᴘᴀɢᴇ",
-                callback_data=f"next_{req}_{key}_{orginal_offset}",
-            ),
-        ]
-    )
-    await query.message.edit_text(
-        cap + links + js_ads,
-        disable_web_page_preview=True,
-        parse_mode=enums.ParseMode.HTML,
-        reply_markup=InlineKeyboardMarkup(btn),
+    await show_facet_page(
+        query,
+        "years_search",
+        year,
+        key,
+        files,
+        offset,
+        n_offset,
+        total,
+        orginal_offset,
+        req,
     )
-    return
 
 
-@Client.on_callback_query(filters.regex(r"^qualities#"))
+@router.route("qualities#", prefix=True)
 async def quality_cb_handler(client: Client, query: CallbackQuery):
     _, key, offset, req = query.data.split("#")
     if int(req) != query.from_user.id:
@@ -801,14 +579,13 @@ async def quality_cb_handler(client: Client, query: CallbackQuery):
     return
 
 
-@Client.on_callback_query(filters.regex(r"^quality_search#"))
+@router.route("quality_search#", prefix=True)
 async def quality_search(client: Client, query: CallbackQuery):
     _, qul, key, offset, orginal_offset, req = query.data.split("#")
     if int(req) != query.from_user.id:
         return await query.answer(script.ALRT_TXT, show_alert=True)
     offset = int(offset)
     search = BUTTONS.get(key)
-    cap = CAP.get(key)
     if not search:
         await query.answer(
             script.OLD_ALRT_TXT.format(query.from_user.first_name), show_alert=True
@@ -829,158 +606,54 @@ async def quality_search(client: Client, query: CallbackQuery):
         )
         return
 
-    temp.FILES_ID[key] = files
-    reqnxt = query.from_user.id if query.from_user else 0
-    settings = await get_settings(query.message.chat.id)
-    temp.CHAT[query.from_user.id] = query.message.chat.id
-    ads, ads_name, _ = await mdb.get_advirtisment()
-    ads_text = ""
-    if ads is not None and ads_name is not None:
-        ads_url = f"https://telegram.dog/{temp.U_NAME}?start=ads"
-        ads_text = f"<a href={ads_url}>{ads_name}</a>"
-    js_ads = (
-        f"\n━━━━━━━━━━━━━━━━━━\n <b>{ads_text}</b> \n━━━━━━━━━━━━━━━━━━"
-        if ads_text
-        else ""
+    await show_facet_page(
+        query,
+        "quality_search",
+        qul,
+        key,
+        files,
+        offset,
+        n_offset,
+        total,
+        orginal_offset,
+        req,
     )
-    links = ""
-    if settings["link"]:
-        btn = []
-        for file_num, file in enumerate(files, start=offset + 1):
-            links += f"""<b>\n\n{file_num}. <a href=https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
-    else:
-        btn = [
-            [
-                InlineKeyboardButton(
-                    text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}",
-                    callback_data=f"cfiles#{reqnxt}#{file.file_id}",
-                ),
-            ]
-            for file in files
-        ]
 
-    btn.insert(
-        0,
-        [
-            InlineKeyboardButton(
-                "📥 sᴇɴᴅ ᴀʟʟ ғɪʟᴇs 📥", callback_data=f"send_all#{key}"
-            ),
-        ],
-    )
-    btn.insert(
-        1,
-        [
-            InlineKeyboardButton(
-                "ǫᴜᴀʟɪᴛʏ", callback_data=f"qualities#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ꜱᴇᴀꜱᴏɴ", callback_data=f"seasons#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ʟᴀɴɢᴜᴀɢᴇ", callback_data=f"languages#{key}#{offset}#{req}"
-            ),
-        ],
-    )
-    if n_offset == "":
-        btn.append(
-            [InlineKeyboardButton(text="🚸 ɴᴏ ᴍᴏʀᴇ ᴘᴀɢᴇs 🚸", callback_data="buttons")]
-        )
-    elif n_offset == 0:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    "⋞ ʙᴀᴄᴋ",
-                    callback_data=f"quality_search#{qul}#{key}#{offset- int(MAX_BTN)}#{orginal_offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-            ]
-        )
-    elif offset == 0:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-                InlineKeyboardButton(
-                    "ɴᴇxᴛ ⋟",
-                    callback_data=f"quality_search#{qul}#{key}#{n_offset}#{orginal_offset}#{req}",
-                ),
-            ]
-        )
-    else:
+
+@router.route("languages#", prefix=True)
+async def languages_cb_handler(client: Client, query: CallbackQuery):
+    _, key, offset, req = query.data.split("#")
+    if int(req) != query.from_user.id:
+        return await query.answer(script.ALRT_TXT, show_alert=True)
+    btn = []
+    for i in range(0, len(LANGUAGES) - 1, 2):
         btn.append(
             [
                 InlineKeyboardButton(
-                    "⋞ ʙᴀᴄᴋ",
-                    callback_data=f"quality_search#{qul}#{key}#{offset- int(MAX_BTN)}#{orginal_offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
+                    text=LANGUAGES[i].title(),
+                    callback_data=f"lang_search#{LANGUAGES[i].lower()}#{key}#0#{offset}#{req}",
                 ),
                 InlineKeyboardButton(
-                    "ɴᴇxᴛ ⋟",
-                    callback_data=f"quality_search#{qul}#{key}#{n_offset}#{orginal_offset}#{req}",
+                    text=LANGUAGES[i + 1].title(),
+                    callback_data=f"lang_search#{LANGUAGES[i+1].lower()}#{key}#0#{offset}#{req}",
                 ),
             ]
         )
-
     btn.append(
         [
             InlineKeyboardButton(
-                text="⋞ ʙᴀᴄᴋ ᴛᴏ ᴍᴀɪɴ ᴘᴀɢᴇ",
-                callback_data=f"next_{req}_{key}_{orginal_offset}",
-            ),
+                text="⋞ ʙᴀᴄᴋ ᴛᴏ ᴍᴀɪɴ ᴘᴀɢᴇ", callback_data=f"next_{req}_{key}_{offset}"
+            )
         ]
     )
     await query.message.edit_text(
-        cap + links + js_ads,
-        disable_web_page_preview=True,
-        parse_mode=enums.ParseMode.HTML,
-        reply_markup=InlineKeyboardMarkup(btn),
-    )
-    return
-    await query.edit_message_reply_markup(reply_markup=InlineKeyboardMarkup(btn))
-
-
-@Client.on_callback_query(filters.regex(r"^languages#"))
-async def languages_cb_handler(client: Client, query: CallbackQuery):
-    _, key, offset, req = query.data.split("#")
-    if int(req) != query.from_user.id:
-        return await query.answer(script.ALRT_TXT, show_alert=True)
-    btn = []
-    for i in range(0, len(LANGUAGES) - 1, 2):
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    text=LANGUAGES[i].title(),
-                    callback_data=f"lang_search#{LANGUAGES[i].lower()}#{key}#0#{offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    text=LANGUAGES[i + 1].title(),
-                    callback_data=f"lang_search#{LANGUAGES[i+1].lower()}#{key}#0#{offset}#{req}",
-                ),
-            ]
-        )
-    btn.append(
-        [
-            InlineKeyboardButton(
-                text="⋞ ʙᴀᴄᴋ ᴛᴏ ᴍᴀɪɴ ᴘᴀɢᴇ", callback_data=f"next_{req}_{key}_{offset}"
-            )
-        ]
-    )
-    await query.message.edit_text(
-        "<b>ɪɴ ᴡʜɪᴄʜ ʟᴀɴɢᴜᴀɢᴇ ᴅᴏ ʏᴏᴜ ᴡᴀɴᴛ, ᴄʜᴏᴏsᴇ ғʀᴏᴍ ʜᴇʀᴇ ↓↓</b>",
+        "<b>ɪɴ ᴡʜɪᴄʜ ʟᴀɴɢᴜᴀɢᴇ ᴅᴏ ʏᴏᴜ ᴡᴀɴᴛ, ᴄʜᴏᴏsᴇ ғʀᴏᴍ ʜᴇʀᴇ ↓↓</b>",
         reply_markup=InlineKeyboardMarkup(btn),
     )
     return
 
 
-@Client.on_callback_query(filters.regex(r"^lang_search#"))
+@router.route("lang_search#", prefix=True)
 async def lang_search(client: Client, query: CallbackQuery):
     _, lang, key, offset, orginal_offset, req = query.data.split("#")
     lang2 = lang[:3]
@@ -988,7 +661,6 @@ async def lang_search(client: Client, query: CallbackQuery):
         return await query.answer(script.ALRT_TXT, show_alert=True)
     offset = int(offset)
     search = BUTTONS.get(key)
-    cap = CAP.get(key)
     if not search:
         await query.answer(
             script.OLD_ALRT_TXT.format(query.from_user.first_name), show_alert=True
@@ -1019,127 +691,21 @@ async def lang_search(client: Client, query: CallbackQuery):
                 f"sᴏʀʀʏ ʟᴀɴɢᴜᴀɢᴇ {lang.title()} ɴᴏᴛ ғᴏᴜɴᴅ ғᴏʀ {search}", show_alert=1
             )
 
-    temp.FILES_ID[key] = files
-    reqnxt = query.from_user.id if query.from_user else 0
-    settings = await get_settings(query.message.chat.id)
-    group_id = query.message.chat.id
-    temp.CHAT[query.from_user.id] = query.message.chat.id
-    ads, ads_name, _ = await mdb.get_advirtisment()
-    ads_text = ""
-    if ads is not None and ads_name is not None:
-        ads_url = f"https://telegram.dog/{temp.U_NAME}?start=ads"
-        ads_text = f"<a href={ads_url}>{ads_name}</a>"
-
-    js_ads = (
-        f"\n━━━━━━━━━━━━━━━━━━\n <b>{ads_text}</b> \n━━━━━━━━━━━━━━━━━━"
-        if ads_text
-        else ""
-    )
-    links = ""
-    if settings["link"]:
-        btn = []
-        for file_num, file in enumerate(files, start=offset + 1):
-            links += f"""<b>\n\n{file_num}. <a href=https://telegram.dog/{temp.U_NAME}?start=file_{query.message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {' '.join(filter(lambda x: not x.startswith('[') and not x.startswith('@') and not x.startswith('www.'), file.file_name.split()))}</a></b>"""
-    else:
-        btn = [
-            [
-                InlineKeyboardButton(
-                    text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}",
-                    callback_data=f"cfiles#{reqnxt}#{file.file_id}",
-                ),
-            ]
-            for file in files
-        ]
-
-    btn.insert(
-        0,
-        [
-            InlineKeyboardButton(
-                "📥 sᴇɴᴅ ᴀʟʟ ғɪʟᴇs 📥", callback_data=f"send_all#{key}"
-            ),
-        ],
-    )
-    btn.insert(
-        1,
-        [
-            InlineKeyboardButton(
-                "ǫᴜᴀʟɪᴛʏ", callback_data=f"qualities#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ꜱᴇᴀꜱᴏɴ", callback_data=f"seasons#{key}#{offset}#{req}"
-            ),
-            InlineKeyboardButton(
-                "ʟᴀɴɢᴜᴀɢᴇ", callback_data=f"languages#{key}#{offset}#{req}"
-            ),
-        ],
-    )
-    if n_offset == "":
-        btn.append(
-            [InlineKeyboardButton(text="🚸 ɴᴏ ᴍᴏʀᴇ ᴘᴀɢᴇs 🚸", callback_data="buttons")]
-        )
-    elif n_offset == 0:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    "⋞ ʙᴀᴄᴋ",
-                    callback_data=f"lang_search#{lang}#{key}#{offset- int(MAX_BTN)}#{orginal_offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-            ]
-        )
-    elif offset == 0:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-                InlineKeyboardButton(
-                    "ɴᴇxᴛ ⋟",
-                    callback_data=f"lang_search#{lang}#{key}#{n_offset}#{orginal_offset}#{req}",
-                ),
-            ]
-        )
-    else:
-        btn.append(
-            [
-                InlineKeyboardButton(
-                    "⋞ ʙᴀᴄᴋ",
-                    callback_data=f"lang_search#{lang}#{key}#{offset- int(MAX_BTN)}#{orginal_offset}#{req}",
-                ),
-                InlineKeyboardButton(
-                    f"{math.ceil(offset / int(MAX_BTN)) + 1}/{math.ceil(total / int(MAX_BTN))}",
-                    callback_data="pages",
-                ),
-                InlineKeyboardButton(
-                    "ɴᴇxᴛ ⋟",
-                    callback_data=f"lang_search#{lang}#{key}#{n_offset}#{orginal_offset}#{req}",
-                ),
-            ]
-        )
-
-    btn.append(
-        [
-            InlineKeyboardButton(
-                text="⋞ ʙᴀᴄᴋ ᴛᴏ ᴍᴀɪɴ ᴘᴀɢᴇ",
-                callback_data=f"next_{req}_{key}_{orginal_offset}",
-            ),
-        ]
-    )
-    await query.message.edit_text(
-        cap + links + js_ads,
-        disable_web_page_preview=True,
-        parse_mode=enums.ParseMode.HTML,
-        reply_markup=InlineKeyboardMarkup(btn),
+    await show_facet_page(
+        query,
+        "lang_search",
+        lang,
+        key,
+        files,
+        offset,
+        n_offset,
+        total,
+        orginal_offset,
+        req,
     )
-    return
-    await query.edit_message_reply_markup(reply_markup=InlineKeyboardMarkup(btn))
 
 
-@Client.on_callback_query(filters.regex(r"^spol"))
+@router.route("spol", prefix=True)
 async def advantage_spoll_choker(bot, query):
     _, id, user = query.data.split("#")
     if int(user) != 0 and query.from_user.id != int(user):
@@ -1153,15 +719,10 @@ async def advantage_spoll_choker(bot, query):
         await auto_filter(bot, query, k)
     else:
         k = await query.message.edit(script.NO_RESULT_TXT)
-        await asyncio.sleep(60)
-        await k.delete()
-        try:
-            await query.message.reply_to_message.delete()
-        except:
-            pass
+        auto_deleter.schedule([k, query.message.reply_to_message], 60)
 
 
-@Client.on_callback_query(filters.regex(r"^cfiles"))
+@router.route("cfiles", prefix=True)
 async def pmfile_cb(client, query):
     _, userid, fileid = query.data.split("#")
     if query.from_user.id != userid:
@@ -1174,952 +735,1048 @@ async def pmfile_cb(client, query):
     return
 
 
-@Client.on_callback_query()
-async def cb_handler(client: Client, query: CallbackQuery):
-    if query.data == "close_data":
-        try:
-            user = query.message.reply_to_message.from_user.id
-        except:
-            user = query.from_user.id
-        if int(user) != 0 and query.from_user.id != int(user):
-            return await query.answer(script.ALRT_TXT, show_alert=True)
-        await query.answer("ᴛʜᴀɴᴋs ꜰᴏʀ ᴄʟᴏsᴇ 🙈")
+@router.route("close_data")
+async def cb_close_data(client: Client, query: CallbackQuery):
+    try:
+        user = query.message.reply_to_message.from_user.id
+    except:
+        user = query.from_user.id
+    if int(user) != 0 and query.from_user.id != int(user):
+        return await query.answer(script.ALRT_TXT, show_alert=True)
+    await query.answer("ᴛʜᴀɴᴋs ꜰᴏʀ ᴄʟᴏsᴇ 🙈")
+    await query.message.delete()
+    try:
+        await query.message.reply_to_message.delete()
+    except:
+        pass
+
+
+@router.route("delallcancel")
+async def cb_delallcancel(client: Client, query: CallbackQuery):
+    userid = query.from_user.id
+    chat_type = query.message.chat.type
+    if chat_type == enums.ChatType.PRIVATE:
+        await query.message.reply_to_message.delete()
         await query.message.delete()
-        try:
-            await query.message.reply_to_message.delete()
-        except:
-            pass
-    elif query.data == "delallcancel":
-        userid = query.from_user.id
-        chat_type = query.message.chat.type
-        if chat_type == enums.ChatType.PRIVATE:
-            await query.message.reply_to_message.delete()
+    elif chat_type in [enums.ChatType.GROUP, enums.ChatType.SUPERGROUP]:
+        grp_id = query.message.chat.id
+        st = await client.get_chat_member(grp_id, userid)
+        if (st.status == enums.ChatMemberStatus.OWNER) or (str(userid) in ADMINS):
             await query.message.delete()
-        elif chat_type in [enums.ChatType.GROUP, enums.ChatType.SUPERGROUP]:
-            grp_id = query.message.chat.id
-            st = await client.get_chat_member(grp_id, userid)
-            if (st.status == enums.ChatMemberStatus.OWNER) or (str(userid) in ADMINS):
-                await query.message.delete()
-                try:
-                    await query.message.reply_to_message.delete()
-                except:
-                    pass
-            else:
-                await query.answer(
-                    script.ALRT_TXT.format(query.from_user.first_name), show_alert=True
-                )
-
-    elif query.data.startswith("send_all"):
-        ident, key = query.data.split("#")
-        user = query.message.reply_to_message.from_user.id
-        if int(user) != 0 and query.from_user.id != int(user):
-            return await query.answer(script.ALRT_TXT, show_alert=True)
-        files = temp.FILES_ID.get(key)
-        if not files:
+            try:
+                await query.message.reply_to_message.delete()
+            except:
+                pass
+        else:
             await query.answer(
-                script.OLD_ALRT_TXT.format(query.from_user.first_name), show_alert=True
+                script.ALRT_TXT.format(query.from_user.first_name), show_alert=True
             )
-            return
+
+
+@router.route("send_all", prefix=True)
+async def cb_send_all(client: Client, query: CallbackQuery):
+    ident, key = query.data.split("#")
+    user = query.message.reply_to_message.from_user.id
+    if int(user) != 0 and query.from_user.id != int(user):
+        return await query.answer(script.ALRT_TXT, show_alert=True)
+    files = temp.FILES_ID.get(key)
+    if not files:
         await query.answer(
-            url=f"https://t.me/{temp.U_NAME}?start=allfiles_{query.message.chat.id}_{key}"
+            script.OLD_ALRT_TXT.format(query.from_user.first_name), show_alert=True
         )
+        return
+    await query.answer(
+        url=f"https://t.me/{temp.U_NAME}?start=allfiles_{query.message.chat.id}_{key}"
+    )
 
-    elif query.data == "give_trial":
-        user_id = query.from_user.id
-        has_free_trial = await db.check_trial_status(user_id)
-        if has_free_trial:
-            await query.answer(
-                " ʏᴏᴜ'ᴠᴇ ᴀʟʀᴇᴀᴅʏ ᴄʟᴀɪᴍᴇᴅ ʏᴏᴜʀ ꜰʀᴇᴇ ᴛʀɪᴀʟ ᴏɴᴄᴇ !\n\n📌 ᴄʜᴇᴄᴋᴏᴜᴛ ᴏᴜʀ ᴘʟᴀɴꜱ ʙʏ : /plan",
-                show_alert=True,
-            )
-            return
-        else:
-            await db.give_free_trial(user_id)
-            await query.message.edit_text(
-                text="ᴄᴏɴɢʀᴀᴛᴜʟᴀᴛɪᴏɴꜱ🎉 ʏᴏᴜ ᴄᴀɴ ᴜsᴇ ꜰʀᴇᴇ ᴛʀᴀɪʟ ꜰᴏʀ <u>5 ᴍɪɴᴜᴛᴇs</u> ꜰʀᴏᴍ ɴᴏᴡ !\n\nɴᴏᴡ ᴇxᴘᴇʀɪᴇɴᴄᴇ ᴏᴜʀ ᴘʀᴇᴍɪᴜᴍ ꜱᴇʀᴠɪᴄᴇ ꜰᴏʀ 5 ᴍɪɴᴜᴛᴇꜱ. ᴛᴏ ʙᴜʏ ᴏᴜʀ ᴘʀᴇᴍɪᴜᴍ ꜱᴇʀᴠɪᴄᴇ ᴄʟɪᴄᴋ ᴏɴ ʙᴇʟᴏᴡ ʙᴜᴛᴛᴏɴ.",
-                disable_web_page_preview=True,
-                reply_markup=InlineKeyboardMarkup(
-                    [
-                        [
-                            InlineKeyboardButton(
-                                "💸 ᴄʜᴇᴄᴋᴏᴜᴛ ᴘʀᴇᴍɪᴜᴍ ᴘʟᴀɴꜱ 💸",
-                                callback_data="getpremium",
-                            )
-                        ]
-                    ]
-                ),
-            )
-            await client.send_message(
-                LOG_CHANNEL,
-                text=f"#FREE_TRAIL_CLAIMED\n\n👤 ᴜꜱᴇʀ ɴᴀᴍᴇ - {query.from_user.mention}\n⚡ ᴜꜱᴇʀ ɪᴅ - {user_id}",
-                disable_web_page_preview=True,
-            )
-            return
 
-    elif query.data.startswith("stream"):
-        user_id = query.from_user.id
-        file_id = query.data.split("#", 1)[1]
-        log_msg = await client.send_cached_media(chat_id=LOG_CHANNEL, file_id=file_id)
-        fileName = quote_plus(get_name(log_msg))
-        online = f"{URL}watch/{log_msg.id}/{fileName}?hash={get_hash(log_msg)}"
-        download = f"{URL}{log_msg.id}/{fileName}?hash={get_hash(log_msg)}"
-        btn = [
-            [
-                InlineKeyboardButton(
-                    "🧿 ꜱᴛʀᴇᴀᴍ ᴏɴ ᴡᴇʙ 🖥", web_app=WebAppInfo(url=online)
-                )
-            ],
-            [
-                InlineKeyboardButton("ᴡᴀᴛᴄʜ ᴏɴʟɪɴᴇ", url=online),
-                InlineKeyboardButton("ꜰᴀꜱᴛ ᴅᴏᴡɴʟᴏᴀᴅ", url=download),
-            ],
-            [InlineKeyboardButton("✗ ᴄʟᴏsᴇ ✗", callback_data="close_data")],
-        ]
-        await query.edit_message_reply_markup(reply_markup=InlineKeyboardMarkup(btn))
-        username = query.from_user.username
-        await log_msg.reply_text(
-            text=f"#LinkGenrated\n\nIᴅ : <code>{user_id}</code>\nUꜱᴇʀɴᴀᴍᴇ : {username}\n\nNᴀᴍᴇ : {fileName}",
-            quote=True,
+@router.route("give_trial")
+async def cb_give_trial(client: Client, query: CallbackQuery):
+    user_id = query.from_user.id
+    has_free_trial = await db.check_trial_status(user_id)
+    if has_free_trial:
+        await query.answer(
+            " ʏᴏᴜ'ᴠᴇ ᴀʟʀᴇᴀᴅʏ ᴄʟᴀɪᴍᴇᴅ ʏᴏᴜʀ ꜰʀᴇᴇ ᴛʀɪᴀʟ ᴏɴᴄᴇ !\n\n📌 ᴄʜᴇᴄᴋᴏᴜᴛ ᴏᴜʀ ᴘʟᴀɴꜱ ʙʏ : /plan",
+            show_alert=True,
+        )
+        return
+    else:
+        await db.give_free_trial(user_id)
+        await query.message.edit_text(
+            text="ᴄᴏɴɢʀᴀᴛᴜʟᴀᴛɪᴏɴꜱ🎉 ʏᴏᴜ ᴄᴀɴ ᴜsᴇ ꜰʀᴇᴇ ᴛʀᴀɪʟ ꜰᴏʀ <u>5 ᴍɪɴᴜᴛᴇs</u> ꜰʀᴏᴍ ɴᴏᴡ !\n\nɴᴏᴡ ᴇxᴘᴇʀɪᴇɴᴄᴇ ᴏᴜʀ ᴘʀᴇᴍɪᴜᴍ ꜱᴇʀᴠɪᴄᴇ ꜰᴏʀ 5 ᴍɪɴᴜᴛᴇꜱ. ᴛᴏ ʙᴜʏ ᴏᴜʀ ᴘʀᴇᴍɪᴜᴍ ꜱᴇʀᴠɪᴄᴇ ᴄʟɪᴄᴋ ᴏɴ ʙᴇʟᴏᴡ ʙᴜᴛᴛᴏɴ.",
             disable_web_page_preview=True,
             reply_markup=InlineKeyboardMarkup(
                 [
                     [
-                        InlineKeyboardButton("🚀 ꜰᴀꜱᴛ ᴅᴏᴡɴʟᴏᴀᴅ", url=download),
-                        InlineKeyboardButton("ᴡᴀᴛᴄʜ ᴏɴʟɪɴᴇ 🧿", url=online),
+                        InlineKeyboardButton(
+                            "💸 ᴄʜᴇᴄᴋᴏᴜᴛ ᴘʀᴇᴍɪᴜᴍ ᴘʟᴀɴꜱ 💸",
+                            callback_data="getpremium",
+                        )
                     ]
                 ]
             ),
         )
+        await client.send_message(
+            LOG_CHANNEL,
+            text=f"#FREE_TRAIL_CLAIMED\n\n👤 ᴜꜱᴇʀ ɴᴀᴍᴇ - {query.from_user.mention}\n⚡ ᴜꜱᴇʀ ɪᴅ - {user_id}",
+            disable_web_page_preview=True,
+        )
+        return
+
+
+@router.route("stream", prefix=True)
+async def cb_stream(client: Client, query: CallbackQuery):
+    user_id = query.from_user.id
+    file_id = query.data.split("#", 1)[1]
+    log_msg = await client.send_cached_media(chat_id=LOG_CHANNEL, file_id=file_id)
+    fileName = quote_plus(get_name(log_msg))
+    online = f"{URL}watch/{log_msg.id}/{fileName}?hash={get_hash(log_msg)}"
+    download = f"{URL}{log_msg.id}/{fileName}?hash={get_hash(log_msg)}"
+    btn = [
+        [
+            InlineKeyboardButton(
+                "🧿 ꜱᴛʀᴇᴀᴍ ᴏɴ ᴡᴇʙ 🖥", web_app=WebAppInfo(url=online)
+            )
+        ],
+        [
+            InlineKeyboardButton("ᴡᴀᴛᴄʜ ᴏɴʟɪɴᴇ", url=online),
+            InlineKeyboardButton("ꜰᴀꜱᴛ ᴅᴏᴡɴʟᴏᴀᴅ", url=download),
+        ],
+        [InlineKeyboardButton("✗ ᴄʟᴏsᴇ ✗", callback_data="close_data")],
+    ]
+    await query.edit_message_reply_markup(reply_markup=InlineKeyboardMarkup(btn))
+    username = query.from_user.username
+    await log_msg.reply_text(
+        text=f"#LinkGenrated\n\nIᴅ : <code>{user_id}</code>\nUꜱᴇʀɴᴀᴍᴇ : {username}\n\nNᴀᴍᴇ : {fileName}",
+        quote=True,
+        disable_web_page_preview=True,
+        reply_markup=InlineKeyboardMarkup(
+            [
+                [
+                    InlineKeyboardButton("🚀 ꜰᴀꜱᴛ ᴅᴏᴡɴʟᴏᴀᴅ", url=download),
+                    InlineKeyboardButton("ᴡᴀᴛᴄʜ ᴏɴʟɪɴᴇ 🧿", url=online),
+                ]
+            ]
+        ),
+    )
 
-    elif query.data == "buttons":
-        await query.answer("ɴᴏ ᴍᴏʀᴇ ᴘᴀɢᴇs 😊", show_alert=True)
 
-    elif query.data == "pages":
-        await query.answer("ᴛʜɪs ɪs ᴘᴀɢᴇs ʙᴜᴛᴛᴏɴ 😅")
+@router.route("buttons")
+async def cb_buttons(client: Client, query: CallbackQuery):
+    await query.answer("ɴᴏ ᴍᴏʀᴇ ᴘᴀɢᴇs 😊", show_alert=True)
 
-    elif query.data.startswith("lang_art"):
-        _, lang = query.data.split("#")
-        await query.answer(f"ʏᴏᴜ sᴇʟᴇᴄᴛᴇᴅ {lang.title()} ʟᴀɴɢᴜᴀɢᴇ ⚡️", show_alert=True)
 
-    elif query.data == "start":
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "⇋ ᴀᴅᴅ ᴍᴇ ᴛᴏ ʏᴏᴜʀ ɢʀᴏᴜᴘ ⇋",
-                    url=f"http://telegram.dog/{temp.U_NAME}?startgroup=start",
-                )
-            ],
-            [
-                InlineKeyboardButton("• ᴅɪꜱᴀʙʟᴇ ᴀᴅꜱ •", callback_data="jisshupremium"),
-                InlineKeyboardButton("• ꜱᴘᴇᴄɪᴀʟ •", callback_data="special"),
-            ],
-            [
-                InlineKeyboardButton("• ʜᴇʟᴘ •", callback_data="help"),
-                InlineKeyboardButton("• ᴀʙᴏᴜᴛ •", callback_data="about"),
-            ],
-            [
-                InlineKeyboardButton(
-                    "• ᴇᴀʀɴ ᴜɴʟɪᴍɪᴛᴇᴅ ᴍᴏɴᴇʏ ᴡɪᴛʜ ʙᴏᴛ •", callback_data="earn"
-                )
-            ],
-        ]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await query.message.edit_media(
-            media=InputMediaPhoto(
-                media=random.choice(START_IMG),
-                caption=script.START_TXT.format(
-                    query.from_user.mention, get_status(), query.from_user.id
-                ),
-                parse_mode=enums.ParseMode.HTML,
+@router.route("pages")
+async def cb_pages(client: Client, query: CallbackQuery):
+    await query.answer("ᴛʜɪs ɪs ᴘᴀɢᴇs ʙᴜᴛᴛᴏɴ 😅")
+
+
+@router.route("lang_art", prefix=True)
+async def cb_lang_art(client: Client, query: CallbackQuery):
+    _, lang = query.data.split("#")
+    await query.answer(f"ʏᴏᴜ sᴇʟᴇᴄᴛᴇᴅ {lang.title()} ʟᴀɴɢᴜᴀɢᴇ ⚡️", show_alert=True)
+
+
+@router.route("start")
+async def cb_start(client: Client, query: CallbackQuery):
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "⇋ ᴀᴅᴅ ᴍᴇ ᴛᴏ ʏᴏᴜʀ ɢʀᴏᴜᴘ ⇋",
+                url=f"http://telegram.dog/{temp.U_NAME}?startgroup=start",
+            )
+        ],
+        [
+            InlineKeyboardButton("• ᴅɪꜱᴀʙʟᴇ ᴀᴅꜱ •", callback_data="jisshupremium"),
+            InlineKeyboardButton("• ꜱᴘᴇᴄɪᴀʟ •", callback_data="special"),
+        ],
+        [
+            InlineKeyboardButton("• ʜᴇʟᴘ •", callback_data="help"),
+            InlineKeyboardButton("• ᴀʙᴏᴜᴛ •", callback_data="about"),
+        ],
+        [
+            InlineKeyboardButton(
+                "• ᴇᴀʀɴ ᴜɴʟɪᴍɪᴛᴇᴅ ᴍᴏɴᴇʏ ᴡɪᴛʜ ʙᴏᴛ •", callback_data="earn"
+            )
+        ],
+    ]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await query.message.edit_media(
+        media=InputMediaPhoto(
+            media=random.choice(START_IMG),
+            caption=script.START_TXT.format(
+                query.from_user.mention, get_status(), query.from_user.id
             ),
-            reply_markup=reply_markup,
-        )
+            parse_mode=enums.ParseMode.HTML,
+        ),
+        reply_markup=reply_markup,
+    )
     #        await query.message.edit_text(
     #            text=script.START_TXT.format(query.from_user.mention, get_status(), query.from_user.id),
     #            reply_markup=reply_markup,
     #            parse_mode=enums.ParseMode.HTML
     #        )
 
-    elif query.data == "jisshupremium":
-        btn = [
-            [
-                InlineKeyboardButton("ʙᴜʏ ᴘʀᴇᴍɪᴜᴍ", callback_data="seeplans"),
-                InlineKeyboardButton("ʀᴇꜰᴇʀ & ᴇᴀʀɴ", callback_data="reffff"),
-            ],
-            [InlineKeyboardButton("⋞ ʜᴏᴍᴇ", callback_data="start")],
-        ]
-        reply_markup = InlineKeyboardMarkup(btn)
-        await query.message.edit_text(
-            text=script.JISSHUPREMIUM_TXT,
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
-
-    elif query.data == "special":
-        btn = [
-            [
-                InlineKeyboardButton("• ᴍᴏsᴛ sᴇᴀʀᴄʜ •", callback_data="mostsearch"),
-                InlineKeyboardButton("• ᴛᴏᴘ ᴛʀᴇɴᴅɪɴɢ •", callback_data="trending"),
-            ],
-            [
-                InlineKeyboardButton("• ɪᴍᴀɢᴇ ᴛᴏ ʟɪɴᴋ •", callback_data="telegraph"),
-            ],
-            [InlineKeyboardButton("⋞ ʜᴏᴍᴇ", callback_data="start")],
-        ]
-        reply_markup = InlineKeyboardMarkup(btn)
-        await query.message.edit_text(
-            text=script.SPECIAL_TXT,
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
 
-    elif query.data == "earn":
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "♻️ ᴀʟʟ ɢʀᴏᴜᴘ ꜱᴇᴛᴛɪɴɢꜱ ᴅᴇᴛᴀɪʟꜱ ♻️", callback_data="earn2"
-                )
-            ],
-            [InlineKeyboardButton("⪻ ʙᴀᴄᴋ ᴛᴏ ʜᴏᴍᴇ", callback_data="start")],
-        ]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await query.message.edit_text(
-            text=script.EARN_TEXT.format(temp.B_LINK),
-            reply_markup=reply_markup,
-            disable_web_page_preview=True,
-            parse_mode=enums.ParseMode.HTML,
-        )
+@router.route("jisshupremium")
+async def cb_jisshupremium(client: Client, query: CallbackQuery):
+    btn = [
+        [
+            InlineKeyboardButton("ʙᴜʏ ᴘʀᴇᴍɪᴜᴍ", callback_data="seeplans"),
+            InlineKeyboardButton("ʀᴇꜰᴇʀ & ᴇᴀʀɴ", callback_data="reffff"),
+        ],
+        [InlineKeyboardButton("⋞ ʜᴏᴍᴇ", callback_data="start")],
+    ]
+    reply_markup = InlineKeyboardMarkup(btn)
+    await query.message.edit_text(
+        text=script.JISSHUPREMIUM_TXT,
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
 
-    elif query.data == "seeplans":
-        btn = [
-            [
-                InlineKeyboardButton(
-                    "🍁 ᴄʜᴇᴄᴋ ᴀʟʟ ᴘʟᴀɴꜱ & ᴘʀɪᴄᴇꜱ 🍁", callback_data="free"
-                )
-            ],
-            [InlineKeyboardButton("⪻ ʙᴀᴄᴋ ᴛᴏ ʜᴏᴍᴇ", callback_data="start")],
-        ]
-        reply_markup = InlineKeyboardMarkup(btn)
-        await client.edit_message_media(
-            query.message.chat.id, query.message.id, InputMediaPhoto(SUBSCRIPTION)
-        )
-        await query.message.edit_text(
-            text=script.PREPLANS_TXT.format(query.from_user.mention),
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
 
-    elif query.data == "getpremium":
-        btn = [
-            [
-                InlineKeyboardButton(
-                    "🍁 ᴄʜᴇᴄᴋ ᴀʟʟ ᴘʟᴀɴꜱ & ᴘʀɪᴄᴇꜱ 🍁", callback_data="free"
-                )
-            ],
-            [InlineKeyboardButton("• 𝗖𝗹𝗼𝘀𝗲 •", callback_data="close_data")],
-        ]
-        reply_markup = InlineKeyboardMarkup(btn)
-        m = await query.message.reply_sticker(
-            "CAACAgUAAx0CZz_GMwACMBdnXZA4SejgJ6a_0TrNzOfn9ImI_QACNwsAArT4iFVaZPJf8ldVVh4E"
-        )
-        await m.delete()
-        await query.message.reply_photo(
-            photo=(SUBSCRIPTION),
-            caption=script.PREPLANS_TXT.format(query.from_user.mention),
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
+@router.route("special")
+async def cb_special(client: Client, query: CallbackQuery):
+    btn = [
+        [
+            InlineKeyboardButton("• ᴍᴏsᴛ sᴇᴀʀᴄʜ •", callback_data="mostsearch"),
+            InlineKeyboardButton("• ᴛᴏᴘ ᴛʀᴇɴᴅɪɴɢ •", callback_data="trending"),
+        ],
+        [
+            InlineKeyboardButton("• ɪᴍᴀɢᴇ ᴛᴏ ʟɪɴᴋ •", callback_data="telegraph"),
+        ],
+        [InlineKeyboardButton("⋞ ʜᴏᴍᴇ", callback_data="start")],
+    ]
+    reply_markup = InlineKeyboardMarkup(btn)
+    await query.message.edit_text(
+        text=script.SPECIAL_TXT,
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
 
-    elif query.data == "free":
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "☆📸 ꜱᴇɴᴅ ꜱᴄʀᴇᴇɴꜱʜᴏᴛ 📸☆",
-                    url=f"https://telegram.me/{OWNER_USERNAME}",
-                )
-            ],
-            [InlineKeyboardButton("💎 ᴄᴜꜱᴛᴏᴍ ᴘʟᴀɴ 💎", callback_data="other")],
-            [
-                InlineKeyboardButton("• ʙᴀᴄᴋ •", callback_data="seeplans"),
-                InlineKeyboardButton("• ᴄʟᴏꜱᴇ •", callback_data="close_data"),
-            ],
-        ]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await client.edit_message_media(
-            query.message.chat.id,
-            query.message.id,
-            InputMediaPhoto(random.choice(PAYPICS)),
-        )
-        await query.message.edit_text(
-            text=script.FREE_TXT.format(query.from_user.mention),
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
 
-    elif query.data == "other":
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "📲 ᴄᴏɴᴛᴀᴄᴛ ᴛᴏ ᴏᴡɴᴇʀ", url=f"https://telegram.me/{OWNER_USERNAME}"
-                )
-            ],
-            [InlineKeyboardButton("• 𝗕𝗮𝗰𝗸 •", callback_data="free")],
-        ]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await client.edit_message_media(
-            query.message.chat.id,
-            query.message.id,
-            InputMediaPhoto(random.choice(PAYPICS)),
-        )
-        await query.message.edit_text(
-            text=script.OTHER_TXT.format(query.from_user.mention),
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
+@router.route("earn")
+async def cb_earn(client: Client, query: CallbackQuery):
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "♻️ ᴀʟʟ ɢʀᴏᴜᴘ ꜱᴇᴛᴛɪɴɢꜱ ᴅᴇᴛᴀɪʟꜱ ♻️", callback_data="earn2"
+            )
+        ],
+        [InlineKeyboardButton("⪻ ʙᴀᴄᴋ ᴛᴏ ʜᴏᴍᴇ", callback_data="start")],
+    ]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await query.message.edit_text(
+        text=script.EARN_TEXT.format(temp.B_LINK),
+        reply_markup=reply_markup,
+        disable_web_page_preview=True,
+        parse_mode=enums.ParseMode.HTML,
+    )
 
-    elif query.data == "ref_point":
-        await query.answer(
-            f"You Have: {referdb.get_refer_points(query.from_user.id)} Refferal points.",
-            show_alert=True,
-        )
 
-    elif query.data == "verifyon":
-        await query.answer(
-            "Only the bot admin can ᴏɴ ✓ or ᴏғғ ✗ this feature.", show_alert=True
-        )
+@router.route("seeplans")
+async def cb_seeplans(client: Client, query: CallbackQuery):
+    btn = [
+        [
+            InlineKeyboardButton(
+                "🍁 ᴄʜᴇᴄᴋ ᴀʟʟ ᴘʟᴀɴꜱ & ᴘʀɪᴄᴇꜱ 🍁", callback_data="free"
+            )
+        ],
+        [InlineKeyboardButton("⪻ ʙᴀᴄᴋ ᴛᴏ ʜᴏᴍᴇ", callback_data="start")],
+    ]
+    reply_markup = InlineKeyboardMarkup(btn)
+    await client.edit_message_media(
+        query.message.chat.id, query.message.id, InputMediaPhoto(SUBSCRIPTION)
+    )
+    await query.message.edit_text(
+        text=script.PREPLANS_TXT.format(query.from_user.mention),
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
 
-    elif query.data == "help":
-        buttons = [
-            [
-                InlineKeyboardButton("• ᴀᴅᴍɪɴ •", callback_data="admincmd"),
-                InlineKeyboardButton("• ɢʀᴏᴜᴘ sᴇᴛᴜᴘ •", callback_data="earn2"),
-            ],
-            [InlineKeyboardButton("⋞ ʙᴀᴄᴋ ᴛᴏ ʜᴏᴍᴇ", callback_data="start")],
-        ]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await query.message.edit_media(
-            media=InputMediaPhoto(
-                media=random.choice(START_IMG),
-                caption=script.HELP_TXT,
-                parse_mode=enums.ParseMode.HTML,
-            ),
-            reply_markup=reply_markup,
-        )
 
-    elif query.data == "about":
-        await query.message.edit_text(
-            script.ABOUT_TEXT.format(query.from_user.mention(), temp.B_LINK),
-            reply_markup=InlineKeyboardMarkup(
-                [
-                    [
-                        InlineKeyboardButton(
-                            "‼️ ᴅɪꜱᴄʟᴀɪᴍᴇʀ ‼️", callback_data="disclaimer"
-                        )
-                    ],
-                    [
-                        InlineKeyboardButton("sᴏᴜʀᴄᴇ ᴄᴏᴅᴇ", callback_data="source"),
-                        InlineKeyboardButton(
-                            "ᴄᴏɴᴛʀɪʙᴜᴛᴏʀs", callback_data="mydevelopers"
-                        ),
-                    ],
-                    [InlineKeyboardButton("⋞ ʜᴏᴍᴇ", callback_data="start")],
-                ]
-            ),
-            disable_web_page_preview=True,
-        )
-    elif query.data == "mydevelopers":
-        await query.answer(
-            "❤️ A Big Thank To All Contributors & Pro Botz For Making This Bot Awesome!🎁🎪",
-            show_alert=True,
-        )
+@router.route("getpremium")
+async def cb_getpremium(client: Client, query: CallbackQuery):
+    btn = [
+        [
+            InlineKeyboardButton(
+                "🍁 ᴄʜᴇᴄᴋ ᴀʟʟ ᴘʟᴀɴꜱ & ᴘʀɪᴄᴇꜱ 🍁", callback_data="free"
+            )
+        ],
+        [InlineKeyboardButton("• 𝗖𝗹𝗼𝘀𝗲 •", callback_data="close_data")],
+    ]
+    reply_markup = InlineKeyboardMarkup(btn)
+    m = await query.message.reply_sticker(
+        "CAACAgUAAx0CZz_GMwACMBdnXZA4SejgJ6a_0TrNzOfn9ImI_QACNwsAArT4iFVaZPJf8ldVVh4E"
+    )
+    await m.delete()
+    await query.message.reply_photo(
+        photo=(SUBSCRIPTION),
+        caption=script.PREPLANS_TXT.format(query.from_user.mention),
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
 
-    elif query.data == "source":
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "👤 𝖢𝗋𝖾𝖺𝗍𝗈𝗋", url="https://t.me/Satyajeetkumarofficial"
-                )
-            ],
-            [
-                InlineKeyboardButton("⋞ ʙᴀᴄᴋ", callback_data="about"),
-                InlineKeyboardButton("• ᴄʟᴏsᴇ •", callback_data="close_data"),
-            ],
-        ]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await query.message.edit_text(
-            text=script.SOURCE_TXT,
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
 
-    elif query.data == "disclaimer":
-        btn = [
-            [
-                InlineKeyboardButton(
-                    "📲 ᴄᴏɴᴛᴀᴄᴛ ᴛᴏ ᴏᴡɴᴇʀ ", url=f"https://telegram.me/{OWNER_USERNAME}"
-                )
-            ],
-            [InlineKeyboardButton("⇋ ʙᴀᴄᴋ ⇋", callback_data="about")],
-        ]
-        reply_markup = InlineKeyboardMarkup(btn)
-        await query.message.edit_text(
-            text=(script.DISCLAIMER_TXT),
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
-    elif query.data == "earn2":
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "⇆ ᴀᴅᴅ ᴍᴇ ᴛᴏ ʏᴏᴜʀ ɢʀᴏᴜᴘs ⇆",
-                    url=f"http://telegram.dog/{temp.U_NAME}?startgroup=start",
-                )
-            ],
-            [InlineKeyboardButton("⋞ ʙᴀᴄᴋ", callback_data="help")],
-        ]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await client.edit_message_media(
-            chat_id=query.message.chat.id,
-            message_id=query.message.id,
-            media=InputMediaAnimation(
-                media="https://i.ibb.co/spG0z1LQ/km-20250209-1080p-30f-20250209-095501.gif",
-                caption=script.GROUP_TEXT.format(temp.B_LINK),
-                parse_mode=enums.ParseMode.HTML,
-            ),
-            reply_markup=reply_markup,
-        )
+@router.route("free")
+async def cb_free(client: Client, query: CallbackQuery):
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "☆📸 ꜱᴇɴᴅ ꜱᴄʀᴇᴇɴꜱʜᴏᴛ 📸☆",
+                url=f"https://telegram.me/{OWNER_USERNAME}",
+            )
+        ],
+        [InlineKeyboardButton("💎 ᴄᴜꜱᴛᴏᴍ ᴘʟᴀɴ 💎", callback_data="other")],
+        [
+            InlineKeyboardButton("• ʙᴀᴄᴋ •", callback_data="seeplans"),
+            InlineKeyboardButton("• ᴄʟᴏꜱᴇ •", callback_data="close_data"),
+        ],
+    ]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await client.edit_message_media(
+        query.message.chat.id,
+        query.message.id,
+        InputMediaPhoto(random.choice(PAYPICS)),
+    )
+    await query.message.edit_text(
+        text=script.FREE_TXT.format(query.from_user.mention),
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
 
-    elif query.data == "telegraph":
-        buttons = [[InlineKeyboardButton("⋞ ʙᴀᴄᴋ", callback_data="special")]]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await query.message.edit_text(
-            text=script.TELE_TXT,
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
-    elif query.data == "font":
-        buttons = [[InlineKeyboardButton("⋞ ʙᴀᴄᴋ", callback_data="special")]]
-        reply_markup = InlineKeyboardMarkup(buttons)
-        await query.message.edit_text(
-            text=script.FONT_TXT,
-            reply_markup=reply_markup,
-            parse_mode=enums.ParseMode.HTML,
-        )
 
-    elif query.data == "all_files_delete":
-        files = await Media.count_documents()
-        await query.answer("Deleting...")
-        await Media.collection.drop()
-        await query.message.edit_text(f"Successfully deleted {files} files")
+@router.route("other")
+async def cb_other(client: Client, query: CallbackQuery):
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "📲 ᴄᴏɴᴛᴀᴄᴛ ᴛᴏ ᴏᴡɴᴇʀ", url=f"https://telegram.me/{OWNER_USERNAME}"
+            )
+        ],
+        [InlineKeyboardButton("• 𝗕𝗮𝗰𝗸 •", callback_data="free")],
+    ]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await client.edit_message_media(
+        query.message.chat.id,
+        query.message.id,
+        InputMediaPhoto(random.choice(PAYPICS)),
+    )
+    await query.message.edit_text(
+        text=script.OTHER_TXT.format(query.from_user.mention),
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
 
-    elif query.data.startswith("killfilesak"):
-        ident, keyword = query.data.split("#")
-        await query.message.edit_text(
-            f"<b>ꜰᴇᴛᴄʜɪɴɢ ꜰɪʟᴇs ꜰᴏʀ ʏᴏᴜʀ ǫᴜᴇʀʏ {keyword} ᴏɴ ᴅʙ...\n\nᴘʟᴇᴀsᴇ ᴡᴀɪᴛ...</b>"
-        )
-        files, total = await get_bad_files(keyword)
-        await query.message.edit_text(
-            f"<b>ꜰᴏᴜɴᴅ {total} ꜰɪʟᴇs ꜰᴏʀ ʏᴏᴜʀ ǫᴜᴇʀʏ {keyword}!!</b>"
-        )
-        deleted = 0
-        async with lock:
-            try:
-                for file in files:
-                    file_ids = file.file_id
-                    file_name = file.file_name
-                    result = await Media.collection.delete_one(
-                        {
-                            "_id": file_ids,
-                        }
-                    )
-                    if result.deleted_count:
-                        print(f"Successfully deleted {file_name} from database.")
-                    deleted += 1
-                    if deleted % 20 == 0:
-                        await query.message.edit_text(
-                            f"<b>Process started for deleting files from DB. Successfully deleted {str(deleted)} files from DB for your query {keyword} !\n\nPlease wait...</b>"
-                        )
-            except Exception as e:
-                print(e)
-                await query.message.edit_text(f"Error: {e}")
-            else:
-                await query.message.edit_text(
-                    f"<b>Process Completed for file deletion !\n\nSuccessfully deleted {str(deleted)} files from database for your query {keyword}.</b>"
-                )
 
-    elif query.data.startswith("reset_grp_data"):
-        grp_id = query.message.chat.id
-        btn = [[InlineKeyboardButton("☕️ ᴄʟᴏsᴇ ☕️", callback_data="close_data")]]
-        reply_markup = InlineKeyboardMarkup(btn)
-        await save_group_settings(grp_id, "shortner", SHORTENER_WEBSITE)
-        await save_group_settings(grp_id, "api", SHORTENER_API)
-        await save_group_settings(grp_id, "shortner_two", SHORTENER_WEBSITE2)
-        await save_group_settings(grp_id, "api_two", SHORTENER_API2)
-        await save_group_settings(grp_id, "shortner_three", SHORTENER_WEBSITE3)
-        await save_group_settings(grp_id, "api_three", SHORTENER_API3)
-        await save_group_settings(grp_id, "verify_time", TWO_VERIFY_GAP)
-        await save_group_settings(grp_id, "third_verify_time", THREE_VERIFY_GAP)
-        await save_group_settings(grp_id, "tutorial", TUTORIAL)
-        await save_group_settings(grp_id, "tutorial_2", TUTORIAL_2)
-        await save_group_settings(grp_id, "tutorial_3", TUTORIAL_3)
-        await save_group_settings(grp_id, "template", IMDB_TEMPLATE)
-        await save_group_settings(grp_id, "caption", FILE_CAPTION)
-        await save_group_settings(grp_id, "fsub_id", AUTH_CHANNEL)
-        await save_group_settings(grp_id, "log", LOG_VR_CHANNEL)
-        await query.answer("ꜱᴜᴄᴄᴇꜱꜱғᴜʟʟʏ ʀᴇꜱᴇᴛ...")
-        await query.message.edit_text(
-            "<b>ꜱᴜᴄᴄᴇꜱꜱғᴜʟʟʏ ʀᴇꜱᴇᴛ ɢʀᴏᴜᴘ ꜱᴇᴛᴛɪɴɢꜱ...\n\nɴᴏᴡ ꜱᴇɴᴅ /details ᴀɢᴀɪɴ</b>",
-            reply_markup=reply_markup,
-        )
+@router.route("ref_point")
+async def cb_ref_point(client: Client, query: CallbackQuery):
+    await query.answer(
+        f"You Have: {await referdb.get_refer_points(query.from_user.id)} Refferal points.",
+        show_alert=True,
+    )
 
-    elif query.data.startswith("setgs"):
-        ident, set_type, status, grp_id = query.data.split("#")
-        userid = query.from_user.id if query.from_user else None
-        if not await is_check_admin(client, int(grp_id), userid):
-            await query.answer(script.ALRT_TXT, show_alert=True)
-            return
-        if status == "True":
-            await save_group_settings(int(grp_id), set_type, False)
-            await query.answer("ᴏғғ ❌")
-        else:
-            await save_group_settings(int(grp_id), set_type, True)
-            await query.answer("ᴏɴ ✅")
-        settings = await get_settings(int(grp_id))
-        if settings is not None:
-            buttons = [
-                [
-                    InlineKeyboardButton(
-                        "ᴀᴜᴛᴏ ꜰɪʟᴛᴇʀ",
-                        callback_data=f'setgs#auto_filter#{settings["auto_filter"]}#{grp_id}',
-                    ),
-                    InlineKeyboardButton(
-                        "ᴏɴ ✓" if settings["auto_filter"] else "ᴏғғ ✗",
-                        callback_data=f'setgs#auto_filter#{settings["auto_filter"]}#{grp_id}',
-                    ),
-                ],
-                [
-                    InlineKeyboardButton(
-                        "ɪᴍᴅʙ", callback_data=f'setgs#imdb#{settings["imdb"]}#{grp_id}'
-                    ),
-                    InlineKeyboardButton(
-                        "ᴏɴ ✓" if settings["imdb"] else "ᴏғғ ✗",
-                        callback_data=f'setgs#imdb#{settings["imdb"]}#{grp_id}',
-                    ),
-                ],
-                [
-                    InlineKeyboardButton(
-                        "sᴘᴇʟʟ ᴄʜᴇᴄᴋ",
-                        callback_data=f'setgs#spell_check#{settings["spell_check"]}#{grp_id}',
-                    ),
-                    InlineKeyboardButton(
-                        "ᴏɴ ✓" if settings["spell_check"] else "ᴏғғ ✗",
-                        callback_data=f'setgs#spell_check#{settings["spell_check"]}#{grp_id}',
-                    ),
-                ],
+
+@router.route("verifyon")
+async def cb_verifyon(client: Client, query: CallbackQuery):
+    await query.answer(
+        "Only the bot admin can ᴏɴ ✓ or ᴏғғ ✗ this feature.", show_alert=True
+    )
+
+
+@router.route("help")
+async def cb_help(client: Client, query: CallbackQuery):
+    buttons = [
+        [
+            InlineKeyboardButton("• ᴀᴅᴍɪɴ •", callback_data="admincmd"),
+            InlineKeyboardButton("• ɢʀᴏᴜᴘ sᴇᴛᴜᴘ •", callback_data="earn2"),
+        ],
+        [InlineKeyboardButton("⋞ ʙᴀᴄᴋ ᴛᴏ ʜᴏᴍᴇ", callback_data="start")],
+    ]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await query.message.edit_media(
+        media=InputMediaPhoto(
+            media=random.choice(START_IMG),
+            caption=script.HELP_TXT,
+            parse_mode=enums.ParseMode.HTML,
+        ),
+        reply_markup=reply_markup,
+    )
+
+
+@router.route("about")
+async def cb_about(client: Client, query: CallbackQuery):
+    await query.message.edit_text(
+        script.ABOUT_TEXT.format(query.from_user.mention(), temp.B_LINK),
+        reply_markup=InlineKeyboardMarkup(
+            [
                 [
                     InlineKeyboardButton(
-                        "ᴀᴜᴛᴏ ᴅᴇʟᴇᴛᴇ",
-                        callback_data=f'setgs#auto_delete#{settings["auto_delete"]}#{grp_id}',
-                    ),
-                    InlineKeyboardButton(
-                        (
-                            f"{get_readable_time(DELETE_TIME)}"
-                            if settings["auto_delete"]
-                            else "ᴏғғ ✗"
-                        ),
-                        callback_data=f'setgs#auto_delete#{settings["auto_delete"]}#{grp_id}',
-                    ),
+                        "‼️ ᴅɪꜱᴄʟᴀɪᴍᴇʀ ‼️", callback_data="disclaimer"
+                    )
                 ],
                 [
+                    InlineKeyboardButton("sᴏᴜʀᴄᴇ ᴄᴏᴅᴇ", callback_data="source"),
                     InlineKeyboardButton(
-                        "ʀᴇsᴜʟᴛ ᴍᴏᴅᴇ",
-                        callback_data=f'setgs#link#{settings["link"]}#{str(grp_id)}',
-                    ),
-                    InlineKeyboardButton(
-                        "⛓ ʟɪɴᴋ" if settings["link"] else "🧲 ʙᴜᴛᴛᴏɴ",
-                        callback_data=f'setgs#link#{settings["link"]}#{str(grp_id)}',
+                        "ᴄᴏɴᴛʀɪʙᴜᴛᴏʀs", callback_data="mydevelopers"
                     ),
                 ],
-                [InlineKeyboardButton("❌ ᴄʟᴏsᴇ ❌", callback_data="close_data")],
+                [InlineKeyboardButton("⋞ ʜᴏᴍᴇ", callback_data="start")],
             ]
-            reply_markup = InlineKeyboardMarkup(buttons)
-            d = await query.message.edit_reply_markup(reply_markup)
-            await asyncio.sleep(300)
-            await d.delete()
-        else:
-            await query.message.edit_text("<b>ꜱᴏᴍᴇᴛʜɪɴɢ ᴡᴇɴᴛ ᴡʀᴏɴɢ</b>")
+        ),
+        disable_web_page_preview=True,
+    )
 
-    elif query.data.startswith("show_options"):
-        ident, user_id, msg_id = query.data.split("#")
-        chnl_id = query.message.chat.id
-        userid = query.from_user.id
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "✅️ ᴀᴄᴄᴇᴘᴛ ᴛʜɪꜱ ʀᴇǫᴜᴇꜱᴛ ✅️",
-                    callback_data=f"accept#{user_id}#{msg_id}",
-                )
-            ],
-            [
-                InlineKeyboardButton(
-                    "🚫 ʀᴇᴊᴇᴄᴛ ᴛʜɪꜱ ʀᴇǫᴜᴇꜱᴛ 🚫",
-                    callback_data=f"reject#{user_id}#{msg_id}",
-                )
-            ],
-        ]
+
+@router.route("mydevelopers")
+async def cb_mydevelopers(client: Client, query: CallbackQuery):
+    await query.answer(
+        "❤️ A Big Thank To All Contributors & Pro Botz For Making This Bot Awesome!🎁🎪",
+        show_alert=True,
+    )
+
+
+@router.route("source")
+async def cb_source(client: Client, query: CallbackQuery):
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "👤 𝖢𝗋𝖾𝖺𝗍𝗈𝗋", url="https://t.me/Satyajeetkumarofficial"
+            )
+        ],
+        [
+            InlineKeyboardButton("⋞ ʙᴀᴄᴋ", callback_data="about"),
+            InlineKeyboardButton("• ᴄʟᴏsᴇ •", callback_data="close_data"),
+        ],
+    ]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await query.message.edit_text(
+        text=script.SOURCE_TXT,
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
+
+
+@router.route("disclaimer")
+async def cb_disclaimer(client: Client, query: CallbackQuery):
+    btn = [
+        [
+            InlineKeyboardButton(
+                "📲 ᴄᴏɴᴛᴀᴄᴛ ᴛᴏ ᴏᴡɴᴇʀ ", url=f"https://telegram.me/{OWNER_USERNAME}"
+            )
+        ],
+        [InlineKeyboardButton("⇋ ʙᴀᴄᴋ ⇋", callback_data="about")],
+    ]
+    reply_markup = InlineKeyboardMarkup(btn)
+    await query.message.edit_text(
+        text=(script.DISCLAIMER_TXT),
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
+
+
+@router.route("earn2")
+async def cb_earn2(client: Client, query: CallbackQuery):
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "⇆ ᴀᴅᴅ ᴍᴇ ᴛᴏ ʏᴏᴜʀ ɢʀᴏᴜᴘs ⇆",
+                url=f"http://telegram.dog/{temp.U_NAME}?startgroup=start",
+            )
+        ],
+        [InlineKeyboardButton("⋞ ʙᴀᴄᴋ", callback_data="help")],
+    ]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await client.edit_message_media(
+        chat_id=query.message.chat.id,
+        message_id=query.message.id,
+        media=InputMediaAnimation(
+            media="https://i.ibb.co/spG0z1LQ/km-20250209-1080p-30f-20250209-095501.gif",
+            caption=script.GROUP_TEXT.format(temp.B_LINK),
+            parse_mode=enums.ParseMode.HTML,
+        ),
+        reply_markup=reply_markup,
+    )
+
+
+@router.route("telegraph")
+async def cb_telegraph(client: Client, query: CallbackQuery):
+    buttons = [[InlineKeyboardButton("⋞ ʙᴀᴄᴋ", callback_data="special")]]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await query.message.edit_text(
+        text=script.TELE_TXT,
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
+
+
+@router.route("font")
+async def cb_font(client: Client, query: CallbackQuery):
+    buttons = [[InlineKeyboardButton("⋞ ʙᴀᴄᴋ", callback_data="special")]]
+    reply_markup = InlineKeyboardMarkup(buttons)
+    await query.message.edit_text(
+        text=script.FONT_TXT,
+        reply_markup=reply_markup,
+        parse_mode=enums.ParseMode.HTML,
+    )
+
+
+@router.route("all_files_delete")
+async def cb_all_files_delete(client: Client, query: CallbackQuery):
+    files = await Media.count_documents()
+    await query.answer("Deleting...")
+    await Media.collection.drop()
+    await query.message.edit_text(f"Successfully deleted {files} files")
+
+
+@router.route("killfilesak", prefix=True)
+async def cb_killfilesak(client: Client, query: CallbackQuery):
+    if query.from_user.id not in ADMINS:
+        return await query.answer(script.ALRT_TXT, show_alert=True)
+    ident, keyword = query.data.split("#", 1)
+    await query.message.edit_text(
+        f"<b>ꜰᴇᴛᴄʜɪɴɢ ꜰɪʟᴇs ꜰᴏʀ ʏᴏᴜʀ ǫᴜᴇʀʏ {keyword} ᴏɴ ᴅʙ...\n\nᴘʟᴇᴀsᴇ ᴡᴀɪᴛ...</b>"
+    )
+    total = await count_bad_files(keyword)
+    await query.message.edit_text(
+        f"<b>ꜰᴏᴜɴᴅ {total} ꜰɪʟᴇs ꜰᴏʀ ʏᴏᴜʀ ǫᴜᴇʀʏ {keyword}!!</b>"
+    )
+    last_edit = time.monotonic()
+
+    async def progress(deleted):
+        nonlocal last_edit
+        if time.monotonic() - last_edit < 5:
+            return
+        last_edit = time.monotonic()
         try:
-            st = await client.get_chat_member(chnl_id, userid)
-            if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
-                st.status == enums.ChatMemberStatus.OWNER
-            ):
-                await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
-            elif st.status == enums.ChatMemberStatus.MEMBER:
-                await query.answer(script.ALRT_TXT, show_alert=True)
-        except pyrogram.errors.exceptions.bad_request_400.UserNotParticipant:
-            await query.answer(
-                "⚠️ ʏᴏᴜ ᴀʀᴇ ɴᴏᴛ ᴀ ᴍᴇᴍʙᴇʀ ᴏꜰ ᴛʜɪꜱ ᴄʜᴀɴɴᴇʟ, ꜰɪʀꜱᴛ ᴊᴏɪɴ", show_alert=True
+            await query.message.edit_text(
+                f"<b>Process started for deleting files from DB. Successfully deleted {str(deleted)} / {total} files from DB for your query {keyword} !\n\nPlease wait...</b>"
             )
+        except Exception:
+            pass
 
-    elif query.data.startswith("reject"):
-        ident, user_id, msg_id = query.data.split("#")
-        chnl_id = query.message.chat.id
-        userid = query.from_user.id
-        buttons = [
-            [InlineKeyboardButton("✗ ʀᴇᴊᴇᴄᴛ ✗", callback_data=f"rj_alert#{user_id}")]
-        ]
-        btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
-        st = await client.get_chat_member(chnl_id, userid)
-        if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
-            st.status == enums.ChatMemberStatus.OWNER
-        ):
-            user = await client.get_users(user_id)
-            request = query.message.text
-            await query.answer("Message sent to requester")
-            await query.message.edit_text(f"<s>{request}</s>")
-            await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
-            try:
-                await client.send_message(
-                    chat_id=user_id,
-                    text="<b>sᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ʀᴇᴊᴇᴄᴛᴇᴅ 😶</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                )
-            except UserIsBlocked:
-                await client.send_message(
-                    SUPPORT_GROUP,
-                    text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nsᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ʀᴇᴊᴇᴄᴛᴇᴅ 😶</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                    reply_to_message_id=int(msg_id),
-                )
+    async with lock:
+        try:
+            deleted = await delete_bad_files(keyword, progress=progress)
+        except Exception as e:
+            print(e)
+            await query.message.edit_text(f"Error: {e}")
         else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
+            await query.message.edit_text(
+                f"<b>Process Completed for file deletion !\n\nSuccessfully deleted {str(deleted)} files from database for your query {keyword}.</b>"
+            )
+
 
-    elif query.data.startswith("accept"):
-        ident, user_id, msg_id = query.data.split("#")
-        chnl_id = query.message.chat.id
-        userid = query.from_user.id
+@router.route("reset_grp_data", prefix=True)
+async def cb_reset_grp_data(client: Client, query: CallbackQuery):
+    grp_id = query.message.chat.id
+    btn = [[InlineKeyboardButton("☕️ ᴄʟᴏsᴇ ☕️", callback_data="close_data")]]
+    reply_markup = InlineKeyboardMarkup(btn)
+    await save_group_settings(grp_id, "shortner", SHORTENER_WEBSITE)
+    await save_group_settings(grp_id, "api", SHORTENER_API)
+    await save_group_settings(grp_id, "shortner_two", SHORTENER_WEBSITE2)
+    await save_group_settings(grp_id, "api_two", SHORTENER_API2)
+    await save_group_settings(grp_id, "shortner_three", SHORTENER_WEBSITE3)
+    await save_group_settings(grp_id, "api_three", SHORTENER_API3)
+    await save_group_settings(grp_id, "verify_time", TWO_VERIFY_GAP)
+    await save_group_settings(grp_id, "third_verify_time", THREE_VERIFY_GAP)
+    await save_group_settings(grp_id, "tutorial", TUTORIAL)
+    await save_group_settings(grp_id, "tutorial_2", TUTORIAL_2)
+    await save_group_settings(grp_id, "tutorial_3", TUTORIAL_3)
+    await save_group_settings(grp_id, "template", IMDB_TEMPLATE)
+    await save_group_settings(grp_id, "caption", FILE_CAPTION)
+    await save_group_settings(grp_id, "fsub_id", AUTH_CHANNEL)
+    await save_group_settings(grp_id, "log", LOG_VR_CHANNEL)
+    await query.answer("ꜱᴜᴄᴄᴇꜱꜱғᴜʟʟʏ ʀᴇꜱᴇᴛ...")
+    await query.message.edit_text(
+        "<b>ꜱᴜᴄᴄᴇꜱꜱғᴜʟʟʏ ʀᴇꜱᴇᴛ ɢʀᴏᴜᴘ ꜱᴇᴛᴛɪɴɢꜱ...\n\nɴᴏᴡ ꜱᴇɴᴅ /details ᴀɢᴀɪɴ</b>",
+        reply_markup=reply_markup,
+    )
+
+
+@router.route("setgs", prefix=True)
+async def cb_setgs(client: Client, query: CallbackQuery):
+    ident, set_type, status, grp_id = query.data.split("#")
+    userid = query.from_user.id if query.from_user else None
+    if not await is_check_admin(client, int(grp_id), userid):
+        await query.answer(script.ALRT_TXT, show_alert=True)
+        return
+    if status == "True":
+        await save_group_settings(int(grp_id), set_type, False)
+        await query.answer("ᴏғғ ❌")
+    else:
+        await save_group_settings(int(grp_id), set_type, True)
+        await query.answer("ᴏɴ ✅")
+    settings = await get_settings(int(grp_id))
+    if settings is not None:
         buttons = [
             [
                 InlineKeyboardButton(
-                    "😊 ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ 😊",
-                    callback_data=f"already_available#{user_id}#{msg_id}",
-                )
-            ],
-            [
+                    "ᴀᴜᴛᴏ ꜰɪʟᴛᴇʀ",
+                    callback_data=f'setgs#auto_filter#{settings["auto_filter"]}#{grp_id}',
+                ),
                 InlineKeyboardButton(
-                    "‼️ ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ ‼️",
-                    callback_data=f"not_available#{user_id}#{msg_id}",
-                )
+                    "ᴏɴ ✓" if settings["auto_filter"] else "ᴏғғ ✗",
+                    callback_data=f'setgs#auto_filter#{settings["auto_filter"]}#{grp_id}',
+                ),
             ],
             [
                 InlineKeyboardButton(
-                    "🥵 ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀ/ʟᴀɴɢᴜᴀɢᴇ 🥵",
-                    callback_data=f"year#{user_id}#{msg_id}",
-                )
-            ],
-            [
+                    "ɪᴍᴅʙ", callback_data=f'setgs#imdb#{settings["imdb"]}#{grp_id}'
+                ),
                 InlineKeyboardButton(
-                    "🙃 ᴜᴘʟᴏᴀᴅᴇᴅ ɪɴ 1 ʜᴏᴜʀ 🙃",
-                    callback_data=f"upload_in#{user_id}#{msg_id}",
-                )
+                    "ᴏɴ ✓" if settings["imdb"] else "ᴏғғ ✗",
+                    callback_data=f'setgs#imdb#{settings["imdb"]}#{grp_id}',
+                ),
             ],
             [
                 InlineKeyboardButton(
-                    "☇ ᴜᴘʟᴏᴀᴅᴇᴅ ☇", callback_data=f"uploaded#{user_id}#{msg_id}"
-                )
+                    "sᴘᴇʟʟ ᴄʜᴇᴄᴋ",
+                    callback_data=f'setgs#spell_check#{settings["spell_check"]}#{grp_id}',
+                ),
+                InlineKeyboardButton(
+                    "ᴏɴ ✓" if settings["spell_check"] else "ᴏғғ ✗",
+                    callback_data=f'setgs#spell_check#{settings["spell_check"]}#{grp_id}',
+                ),
             ],
-        ]
-        try:
-            st = await client.get_chat_member(chnl_id, userid)
-            if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
-                st.status == enums.ChatMemberStatus.OWNER
-            ):
-                await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
-            elif st.status == enums.ChatMemberStatus.MEMBER:
-                await query.answer(
-                    script.OLD_ALRT_TXT.format(query.from_user.first_name),
-                    show_alert=True,
-                )
-        except pyrogram.errors.exceptions.bad_request_400.UserNotParticipant:
-            await query.answer(
-                "⚠️ ʏᴏᴜ ᴀʀᴇ ɴᴏᴛ ᴀ ᴍᴇᴍʙᴇʀ ᴏꜰ ᴛʜɪꜱ ᴄʜᴀɴɴᴇʟ, ꜰɪʀꜱᴛ ᴊᴏɪɴ", show_alert=True
-            )
-
-    elif query.data.startswith("not_available"):
-        ident, user_id, msg_id = query.data.split("#")
-        chnl_id = query.message.chat.id
-        userid = query.from_user.id
-        buttons = [
             [
                 InlineKeyboardButton(
-                    "🚫 ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ 🚫", callback_data=f"na_alert#{user_id}"
-                )
-            ]
-        ]
-        btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
-        st = await client.get_chat_member(chnl_id, userid)
-        if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
-            st.status == enums.ChatMemberStatus.OWNER
-        ):
-            user = await client.get_users(user_id)
-            request = query.message.text
-            await query.answer("Message sent to requester")
-            await query.message.edit_text(f"<s>{request}</s>")
-            await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
-            try:
-                await client.send_message(
-                    chat_id=user_id,
-                    text="<b>sᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ 😢</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                )
-            except UserIsBlocked:
-                await client.send_message(
-                    SUPPORT_GROUP,
-                    text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nsᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ 😢</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                    reply_to_message_id=int(msg_id),
-                )
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
-
-    elif query.data.startswith("uploaded"):
-        ident, user_id, msg_id = query.data.split("#")
-        chnl_id = query.message.chat.id
-        userid = query.from_user.id
-        buttons = [
-            [
+                    "ᴀᴜᴛᴏ ᴅᴇʟᴇᴛᴇ",
+                    callback_data=f'setgs#auto_delete#{settings["auto_delete"]}#{grp_id}',
+                ),
                 InlineKeyboardButton(
-                    "🙂 ᴜᴘʟᴏᴀᴅᴇᴅ 🙂", callback_data=f"ul_alert#{user_id}"
-                )
-            ]
-        ]
-        btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
-        st = await client.get_chat_member(chnl_id, userid)
-        if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
-            st.status == enums.ChatMemberStatus.OWNER
-        ):
-            user = await client.get_users(user_id)
-            request = query.message.text
-            await query.answer("Message sent to requester")
-            await query.message.edit_text(f"<s>{request}</s>")
-            await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
-            try:
-                await client.send_message(
-                    chat_id=user_id,
-                    text="<b>ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴜᴘʟᴏᴀᴅᴇᴅ ☺️</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                )
-            except UserIsBlocked:
-                await client.send_message(
-                    SUPPORT_GROUP,
-                    text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴜᴘʟᴏᴀᴅᴇᴅ ☺️</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                    reply_to_message_id=int(msg_id),
-                )
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
-
-    elif query.data.startswith("already_available"):
-        ident, user_id, msg_id = query.data.split("#")
-        chnl_id = query.message.chat.id
-        userid = query.from_user.id
-        buttons = [
+                    (
+                        f"{get_readable_time(DELETE_TIME)}"
+                        if settings["auto_delete"]
+                        else "ᴏғғ ✗"
+                    ),
+                    callback_data=f'setgs#auto_delete#{settings["auto_delete"]}#{grp_id}',
+                ),
+            ],
             [
                 InlineKeyboardButton(
-                    "🫤 ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ 🫤", callback_data=f"aa_alert#{user_id}"
-                )
-            ]
+                    "ʀᴇsᴜʟᴛ ᴍᴏᴅᴇ",
+                    callback_data=f'setgs#link#{settings["link"]}#{str(grp_id)}',
+                ),
+                InlineKeyboardButton(
+                    "⛓ ʟɪɴᴋ" if settings["link"] else "🧲 ʙᴜᴛᴛᴏɴ",
+                    callback_data=f'setgs#link#{settings["link"]}#{str(grp_id)}',
+                ),
+            ],
+            [InlineKeyboardButton("❌ ᴄʟᴏsᴇ ❌", callback_data="close_data")],
         ]
-        btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
+        reply_markup = InlineKeyboardMarkup(buttons)
+        d = await query.message.edit_reply_markup(reply_markup)
+        auto_deleter.schedule([d], 300)
+    else:
+        await query.message.edit_text("<b>ꜱᴏᴍᴇᴛʜɪɴɢ ᴡᴇɴᴛ ᴡʀᴏɴɢ</b>")
+
+
+@router.route("show_options", prefix=True)
+async def cb_show_options(client: Client, query: CallbackQuery):
+    ident, user_id, msg_id = query.data.split("#")
+    chnl_id = query.message.chat.id
+    userid = query.from_user.id
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "✅️ ᴀᴄᴄᴇᴘᴛ ᴛʜɪꜱ ʀᴇǫᴜᴇꜱᴛ ✅️",
+                callback_data=f"accept#{user_id}#{msg_id}",
+            )
+        ],
+        [
+            InlineKeyboardButton(
+                "🚫 ʀᴇᴊᴇᴄᴛ ᴛʜɪꜱ ʀᴇǫᴜᴇꜱᴛ 🚫",
+                callback_data=f"reject#{user_id}#{msg_id}",
+            )
+        ],
+    ]
+    try:
         st = await client.get_chat_member(chnl_id, userid)
         if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
             st.status == enums.ChatMemberStatus.OWNER
         ):
-            user = await client.get_users(user_id)
-            request = query.message.text
-            await query.answer("Message sent to requester")
-            await query.message.edit_text(f"<s>{request}</s>")
             await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
-            try:
-                await client.send_message(
-                    chat_id=user_id,
-                    text="<b>ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ 😋</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                )
-            except UserIsBlocked:
-                await client.send_message(
-                    SUPPORT_GROUP,
-                    text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ 😋</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                    reply_to_message_id=int(msg_id),
-                )
-        else:
+        elif st.status == enums.ChatMemberStatus.MEMBER:
             await query.answer(script.ALRT_TXT, show_alert=True)
+    except pyrogram.errors.exceptions.bad_request_400.UserNotParticipant:
+        await query.answer(
+            "⚠️ ʏᴏᴜ ᴀʀᴇ ɴᴏᴛ ᴀ ᴍᴇᴍʙᴇʀ ᴏꜰ ᴛʜɪꜱ ᴄʜᴀɴɴᴇʟ, ꜰɪʀꜱᴛ ᴊᴏɪɴ", show_alert=True
+        )
 
-    elif query.data.startswith("upload_in"):
-        ident, user_id, msg_id = query.data.split("#")
-        chnl_id = query.message.chat.id
-        userid = query.from_user.id
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "😌 ᴜᴘʟᴏᴀᴅ ɪɴ 1 ʜᴏᴜʀꜱ 😌", callback_data=f"upload_alert#{user_id}"
-                )
-            ]
-        ]
-        btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
+
+@router.route("reject", prefix=True)
+async def cb_reject(client: Client, query: CallbackQuery):
+    ident, user_id, msg_id = query.data.split("#")
+    chnl_id = query.message.chat.id
+    userid = query.from_user.id
+    buttons = [
+        [InlineKeyboardButton("✗ ʀᴇᴊᴇᴄᴛ ✗", callback_data=f"rj_alert#{user_id}")]
+    ]
+    btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
+    st = await client.get_chat_member(chnl_id, userid)
+    if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
+        st.status == enums.ChatMemberStatus.OWNER
+    ):
+        user = await client.get_users(user_id)
+        request = query.message.text
+        await query.answer("Message sent to requester")
+        await query.message.edit_text(f"<s>{request}</s>")
+        await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
+        try:
+            await client.send_message(
+                chat_id=user_id,
+                text="<b>sᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ʀᴇᴊᴇᴄᴛᴇᴅ 😶</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+            )
+        except UserIsBlocked:
+            await client.send_message(
+                SUPPORT_GROUP,
+                text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nsᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ʀᴇᴊᴇᴄᴛᴇᴅ 😶</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+                reply_to_message_id=int(msg_id),
+            )
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
+
+
+@router.route("accept", prefix=True)
+async def cb_accept(client: Client, query: CallbackQuery):
+    ident, user_id, msg_id = query.data.split("#")
+    chnl_id = query.message.chat.id
+    userid = query.from_user.id
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "😊 ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ 😊",
+                callback_data=f"already_available#{user_id}#{msg_id}",
+            )
+        ],
+        [
+            InlineKeyboardButton(
+                "‼️ ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ ‼️",
+                callback_data=f"not_available#{user_id}#{msg_id}",
+            )
+        ],
+        [
+            InlineKeyboardButton(
+                "🥵 ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀ/ʟᴀɴɢᴜᴀɢᴇ 🥵",
+                callback_data=f"year#{user_id}#{msg_id}",
+            )
+        ],
+        [
+            InlineKeyboardButton(
+                "🙃 ᴜᴘʟᴏᴀᴅᴇᴅ ɪɴ 1 ʜᴏᴜʀ 🙃",
+                callback_data=f"upload_in#{user_id}#{msg_id}",
+            )
+        ],
+        [
+            InlineKeyboardButton(
+                "☇ ᴜᴘʟᴏᴀᴅᴇᴅ ☇", callback_data=f"uploaded#{user_id}#{msg_id}"
+            )
+        ],
+    ]
+    try:
         st = await client.get_chat_member(chnl_id, userid)
         if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
             st.status == enums.ChatMemberStatus.OWNER
         ):
-            user = await client.get_users(user_id)
-            request = query.message.text
-            await query.answer("Message sent to requester")
-            await query.message.edit_text(f"<s>{request}</s>")
             await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
-            try:
-                await client.send_message(
-                    chat_id=user_id,
-                    text="<b>ʏᴏᴜʀ ʀᴇǫᴜᴇꜱᴛ ᴡɪʟʟ ʙᴇ ᴜᴘʟᴏᴀᴅᴇᴅ ᴡɪᴛʜɪɴ 1 ʜᴏᴜʀ 😁</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                )
-            except UserIsBlocked:
-                await client.send_message(
-                    SUPPORT_GROUP,
-                    text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nʏᴏᴜʀ ʀᴇǫᴜᴇꜱᴛ ᴡɪʟʟ ʙᴇ ᴜᴘʟᴏᴀᴅᴇᴅ ᴡɪᴛʜɪɴ 1 ʜᴏᴜʀ 😁</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                    reply_to_message_id=int(msg_id),
-                )
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
+        elif st.status == enums.ChatMemberStatus.MEMBER:
+            await query.answer(
+                script.OLD_ALRT_TXT.format(query.from_user.first_name),
+                show_alert=True,
+            )
+    except pyrogram.errors.exceptions.bad_request_400.UserNotParticipant:
+        await query.answer(
+            "⚠️ ʏᴏᴜ ᴀʀᴇ ɴᴏᴛ ᴀ ᴍᴇᴍʙᴇʀ ᴏꜰ ᴛʜɪꜱ ᴄʜᴀɴɴᴇʟ, ꜰɪʀꜱᴛ ᴊᴏɪɴ", show_alert=True
+        )
 
-    elif query.data.startswith("year"):
-        ident, user_id, msg_id = query.data.split("#")
-        chnl_id = query.message.chat.id
-        userid = query.from_user.id
-        buttons = [
-            [
-                InlineKeyboardButton(
-                    "⚠️ ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀꜱ & ʟᴀɴɢᴜᴀɢᴇ ⚠️", callback_data=f"yrs_alert#{user_id}"
-                )
-            ]
+
+@router.route("not_available", prefix=True)
+async def cb_not_available(client: Client, query: CallbackQuery):
+    ident, user_id, msg_id = query.data.split("#")
+    chnl_id = query.message.chat.id
+    userid = query.from_user.id
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "🚫 ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ 🚫", callback_data=f"na_alert#{user_id}"
+            )
         ]
-        btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
-        st = await client.get_chat_member(chnl_id, userid)
-        if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
-            st.status == enums.ChatMemberStatus.OWNER
-        ):
-            user = await client.get_users(user_id)
-            request = query.message.text
-            await query.answer("Message sent to requester")
-            await query.message.edit_text(f"<s>{request}</s>")
-            await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
-            try:
-                await client.send_message(
-                    chat_id=user_id,
-                    text="<b>ʙʀᴏ ᴘʟᴇᴀꜱᴇ ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀꜱ ᴀɴᴅ ʟᴀɴɢᴜᴀɢᴇ, ᴛʜᴇɴ ɪ ᴡɪʟʟ ᴜᴘʟᴏᴀᴅ 😬</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                )
-            except UserIsBlocked:
-                await client.send_message(
-                    SUPPORT_GROUP,
-                    text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nʙʀᴏ ᴘʟᴇᴀꜱᴇ ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀꜱ ᴀɴᴅ ʟᴀɴɢᴜᴀɢᴇ, ᴛʜᴇɴ ɪ ᴡɪʟʟ ᴜᴘʟᴏᴀᴅ 😬</b>",
-                    reply_markup=InlineKeyboardMarkup(btn),
-                    reply_to_message_id=int(msg_id),
-                )
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
+    ]
+    btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
+    st = await client.get_chat_member(chnl_id, userid)
+    if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
+        st.status == enums.ChatMemberStatus.OWNER
+    ):
+        user = await client.get_users(user_id)
+        request = query.message.text
+        await query.answer("Message sent to requester")
+        await query.message.edit_text(f"<s>{request}</s>")
+        await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
+        try:
+            await client.send_message(
+                chat_id=user_id,
+                text="<b>sᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ 😢</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+            )
+        except UserIsBlocked:
+            await client.send_message(
+                SUPPORT_GROUP,
+                text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nsᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ 😢</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+                reply_to_message_id=int(msg_id),
+            )
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
 
-    elif query.data.startswith("rj_alert"):
-        ident, user_id = query.data.split("#")
-        userid = query.from_user.id
-        if str(userid) in user_id:
-            await query.answer("sᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ʀᴇᴊᴇᴄᴛ", show_alert=True)
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
 
-    elif query.data.startswith("na_alert"):
-        ident, user_id = query.data.split("#")
-        userid = query.from_user.id
-        if str(userid) in user_id:
-            await query.answer("sᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ", show_alert=True)
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
+@router.route("uploaded", prefix=True)
+async def cb_uploaded(client: Client, query: CallbackQuery):
+    ident, user_id, msg_id = query.data.split("#")
+    chnl_id = query.message.chat.id
+    userid = query.from_user.id
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "🙂 ᴜᴘʟᴏᴀᴅᴇᴅ 🙂", callback_data=f"ul_alert#{user_id}"
+            )
+        ]
+    ]
+    btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
+    st = await client.get_chat_member(chnl_id, userid)
+    if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
+        st.status == enums.ChatMemberStatus.OWNER
+    ):
+        user = await client.get_users(user_id)
+        request = query.message.text
+        await query.answer("Message sent to requester")
+        await query.message.edit_text(f"<s>{request}</s>")
+        await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
+        try:
+            await client.send_message(
+                chat_id=user_id,
+                text="<b>ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴜᴘʟᴏᴀᴅᴇᴅ ☺️</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+            )
+        except UserIsBlocked:
+            await client.send_message(
+                SUPPORT_GROUP,
+                text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴜᴘʟᴏᴀᴅᴇᴅ ☺️</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+                reply_to_message_id=int(msg_id),
+            )
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
 
-    elif query.data.startswith("ul_alert"):
-        ident, user_id = query.data.split("#")
-        userid = query.from_user.id
-        if str(userid) in user_id:
-            await query.answer("ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴜᴘʟᴏᴀᴅᴇᴅ", show_alert=True)
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
 
-    elif query.data.startswith("aa_alert"):
-        ident, user_id = query.data.split("#")
-        userid = query.from_user.id
-        if str(userid) in user_id:
-            await query.answer("ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ", show_alert=True)
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
+@router.route("already_available", prefix=True)
+async def cb_already_available(client: Client, query: CallbackQuery):
+    ident, user_id, msg_id = query.data.split("#")
+    chnl_id = query.message.chat.id
+    userid = query.from_user.id
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "🫤 ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ 🫤", callback_data=f"aa_alert#{user_id}"
+            )
+        ]
+    ]
+    btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
+    st = await client.get_chat_member(chnl_id, userid)
+    if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
+        st.status == enums.ChatMemberStatus.OWNER
+    ):
+        user = await client.get_users(user_id)
+        request = query.message.text
+        await query.answer("Message sent to requester")
+        await query.message.edit_text(f"<s>{request}</s>")
+        await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
+        try:
+            await client.send_message(
+                chat_id=user_id,
+                text="<b>ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ 😋</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+            )
+        except UserIsBlocked:
+            await client.send_message(
+                SUPPORT_GROUP,
+                text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ 😋</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+                reply_to_message_id=int(msg_id),
+            )
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
 
-    elif query.data.startswith("upload_alert"):
-        ident, user_id = query.data.split("#")
-        userid = query.from_user.id
-        if str(userid) in user_id:
-            await query.answer(
-                "ʏᴏᴜʀ ʀᴇǫᴜᴇꜱᴛ ᴡɪʟʟ ʙᴇ ᴜᴘʟᴏᴀᴅᴇᴅ ᴡɪᴛʜɪɴ 1 ʜᴏᴜʀ 😁", show_alert=True
+
+@router.route("upload_in", prefix=True)
+async def cb_upload_in(client: Client, query: CallbackQuery):
+    ident, user_id, msg_id = query.data.split("#")
+    chnl_id = query.message.chat.id
+    userid = query.from_user.id
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "😌 ᴜᴘʟᴏᴀᴅ ɪɴ 1 ʜᴏᴜʀꜱ 😌", callback_data=f"upload_alert#{user_id}"
             )
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
+        ]
+    ]
+    btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
+    st = await client.get_chat_member(chnl_id, userid)
+    if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
+        st.status == enums.ChatMemberStatus.OWNER
+    ):
+        user = await client.get_users(user_id)
+        request = query.message.text
+        await query.answer("Message sent to requester")
+        await query.message.edit_text(f"<s>{request}</s>")
+        await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
+        try:
+            await client.send_message(
+                chat_id=user_id,
+                text="<b>ʏᴏᴜʀ ʀᴇǫᴜᴇꜱᴛ ᴡɪʟʟ ʙᴇ ᴜᴘʟᴏᴀᴅᴇᴅ ᴡɪᴛʜɪɴ 1 ʜᴏᴜʀ 😁</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+            )
+        except UserIsBlocked:
+            await client.send_message(
+                SUPPORT_GROUP,
+                text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nʏᴏᴜʀ ʀᴇǫᴜᴇꜱᴛ ᴡɪʟʟ ʙᴇ ᴜᴘʟᴏᴀᴅᴇᴅ ᴡɪᴛʜɪɴ 1 ʜᴏᴜʀ 😁</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+                reply_to_message_id=int(msg_id),
+            )
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
 
-    elif query.data.startswith("yrs_alert"):
-        ident, user_id = query.data.split("#")
-        userid = query.from_user.id
-        if str(userid) in user_id:
-            await query.answer(
-                "ʙʀᴏ ᴘʟᴇᴀꜱᴇ ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀꜱ ᴀɴᴅ ʟᴀɴɢᴜᴀɢᴇ, ᴛʜᴇɴ ɪ ᴡɪʟʟ ᴜᴘʟᴏᴀᴅ 😬",
-                show_alert=True,
+
+@router.route("year", prefix=True)
+async def cb_year(client: Client, query: CallbackQuery):
+    ident, user_id, msg_id = query.data.split("#")
+    chnl_id = query.message.chat.id
+    userid = query.from_user.id
+    buttons = [
+        [
+            InlineKeyboardButton(
+                "⚠️ ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀꜱ & ʟᴀɴɢᴜᴀɢᴇ ⚠️", callback_data=f"yrs_alert#{user_id}"
             )
-        else:
-            await query.answer(script.ALRT_TXT, show_alert=True)
+        ]
+    ]
+    btn = [[InlineKeyboardButton("♻️ ᴠɪᴇᴡ sᴛᴀᴛᴜs ♻️", url=f"{query.message.link}")]]
+    st = await client.get_chat_member(chnl_id, userid)
+    if (st.status == enums.ChatMemberStatus.ADMINISTRATOR) or (
+        st.status == enums.ChatMemberStatus.OWNER
+    ):
+        user = await client.get_users(user_id)
+        request = query.message.text
+        await query.answer("Message sent to requester")
+        await query.message.edit_text(f"<s>{request}</s>")
+        await query.message.edit_reply_markup(InlineKeyboardMarkup(buttons))
+        try:
+            await client.send_message(
+                chat_id=user_id,
+                text="<b>ʙʀᴏ ᴘʟᴇᴀꜱᴇ ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀꜱ ᴀɴᴅ ʟᴀɴɢᴜᴀɢᴇ, ᴛʜᴇɴ ɪ ᴡɪʟʟ ᴜᴘʟᴏᴀᴅ 😬</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+            )
+        except UserIsBlocked:
+            await client.send_message(
+                SUPPORT_GROUP,
+                text=f"<b>💥 ʜᴇʟʟᴏ {user.mention},\n\nʙʀᴏ ᴘʟᴇᴀꜱᴇ ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀꜱ ᴀɴᴅ ʟᴀɴɢᴜᴀɢᴇ, ᴛʜᴇɴ ɪ ᴡɪʟʟ ᴜᴘʟᴏᴀᴅ 😬</b>",
+                reply_markup=InlineKeyboardMarkup(btn),
+                reply_to_message_id=int(msg_id),
+            )
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
 
-    elif query.data.startswith("batchfiles"):
-        ident, group_id, message_id, user = query.data.split("#")
-        group_id = int(group_id)
-        message_id = int(message_id)
-        user = int(user)
-        if user != query.from_user.id:
-            await query.answer(script.ALRT_TXT, show_alert=True)
-            return
-        link = (
-            f"https://telegram.me/{temp.U_NAME}?start=allfiles_{group_id}-{message_id}"
+
+@router.route("rj_alert", prefix=True)
+async def cb_rj_alert(client: Client, query: CallbackQuery):
+    ident, user_id = query.data.split("#")
+    userid = query.from_user.id
+    if str(userid) in user_id:
+        await query.answer("sᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ʀᴇᴊᴇᴄᴛ", show_alert=True)
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
+
+
+@router.route("na_alert", prefix=True)
+async def cb_na_alert(client: Client, query: CallbackQuery):
+    ident, user_id = query.data.split("#")
+    userid = query.from_user.id
+    if str(userid) in user_id:
+        await query.answer("sᴏʀʀʏ ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ɴᴏᴛ ᴀᴠᴀɪʟᴀʙʟᴇ", show_alert=True)
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
+
+
+@router.route("ul_alert", prefix=True)
+async def cb_ul_alert(client: Client, query: CallbackQuery):
+    ident, user_id = query.data.split("#")
+    userid = query.from_user.id
+    if str(userid) in user_id:
+        await query.answer("ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴜᴘʟᴏᴀᴅᴇᴅ", show_alert=True)
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
+
+
+@router.route("aa_alert", prefix=True)
+async def cb_aa_alert(client: Client, query: CallbackQuery):
+    ident, user_id = query.data.split("#")
+    userid = query.from_user.id
+    if str(userid) in user_id:
+        await query.answer("ʏᴏᴜʀ ʀᴇǫᴜᴇsᴛ ɪs ᴀʟʀᴇᴀᴅʏ ᴀᴠᴀɪʟᴀʙʟᴇ", show_alert=True)
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
+
+
+@router.route("upload_alert", prefix=True)
+async def cb_upload_alert(client: Client, query: CallbackQuery):
+    ident, user_id = query.data.split("#")
+    userid = query.from_user.id
+    if str(userid) in user_id:
+        await query.answer(
+            "ʏᴏᴜʀ ʀᴇǫᴜᴇꜱᴛ ᴡɪʟʟ ʙᴇ ᴜᴘʟᴏᴀᴅᴇᴅ ᴡɪᴛʜɪɴ 1 ʜᴏᴜʀ 😁", show_alert=True
+        )
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
+
+
+@router.route("yrs_alert", prefix=True)
+async def cb_yrs_alert(client: Client, query: CallbackQuery):
+    ident, user_id = query.data.split("#")
+    userid = query.from_user.id
+    if str(userid) in user_id:
+        await query.answer(
+            "ʙʀᴏ ᴘʟᴇᴀꜱᴇ ᴛᴇʟʟ ᴍᴇ ʏᴇᴀʀꜱ ᴀɴᴅ ʟᴀɴɢᴜᴀɢᴇ, ᴛʜᴇɴ ɪ ᴡɪʟʟ ᴜᴘʟᴏᴀᴅ 😬",
+            show_alert=True,
         )
-        await query.answer(url=link)
+    else:
+        await query.answer(script.ALRT_TXT, show_alert=True)
+
+
+@router.route("batchfiles", prefix=True)
+async def cb_batchfiles(client: Client, query: CallbackQuery):
+    ident, group_id, message_id, user = query.data.split("#")
+    group_id = int(group_id)
+    message_id = int(message_id)
+    user = int(user)
+    if user != query.from_user.id:
+        await query.answer(script.ALRT_TXT, show_alert=True)
         return
+    link = (
+        f"https://telegram.me/{temp.U_NAME}?start=allfiles_{group_id}-{message_id}"
+    )
+    await query.answer(url=link)
+    return
+
+
+@Client.on_callback_query()
+async def cb_handler(client: Client, query: CallbackQuery):
+    await router.dispatch(client, query)
 
 
 async def ai_spell_check(wrong_name):
     async def search_movie(wrong_name):
-        search_results = imdb.search_movie(wrong_name)
+        search_results = get_imdb().search_movie(wrong_name)
         movie_list = [movie["title"] for movie in search_results]
         return movie_list
 
@@ -2176,45 +1833,11 @@ async def auto_filter(client, msg, spoll=False, pm_mode=False):
         if settings["auto_delete"]
         else ""
     )
-    links = ""
-    if settings["link"]:
-        btn = []
-        for file_num, file in enumerate(files, start=1):
-            links += f"""<b>\n\n{file_num}. <a href=https://telegram.dog/{temp.U_NAME}?start=file_{message.chat.id}_{file.file_id}>[{get_size(file.file_size)}] {formate_file_name(file.file_name)}</a></b>"""
-    else:
-        btn = [
-            [
-                InlineKeyboardButton(
-                    text=f"🔗 {get_size(file.file_size)}≽ {formate_file_name(file.file_name)}",
-                    url=f"https://telegram.dog/{temp.U_NAME}?start=file_{message.chat.id}_{file.file_id}",
-                ),
-            ]
-            for file in files
-        ]
+    btn, links = file_buttons(files, message.chat.id, link_mode=settings["link"])
     if offset != "":
         if total_results >= MAX_BTN:
-            btn.insert(
-                0,
-                [
-                    InlineKeyboardButton(
-                        "📥 sᴇɴᴅ ᴀʟʟ ғɪʟᴇs 📥", callback_data=f"send_all#{key}"
-                    ),
-                ],
-            )
-            btn.insert(
-                1,
-                [
-                    InlineKeyboardButton(
-                        "ǫᴜᴀʟɪᴛʏ ", callback_data=f"qualities#{key}#{offset}#{req}"
-                    ),
-                    InlineKeyboardButton(
-                        "ꜱᴇᴀꜱᴏɴ", callback_data=f"seasons#{key}#{offset}#{req}"
-                    ),
-                    InlineKeyboardButton(
-                        "ʟᴀɴɢᴜᴀɢᴇ ", callback_data=f"languages#{key}#{offset}#{req}"
-                    ),
-                ],
-            )
+            btn.insert(0, send_all_row(key))
+            btn.insert(1, facet_row(key, offset, req))
         else:
             btn.insert(
                 0,
@@ -2231,15 +1854,7 @@ async def auto_filter(client, msg, spoll=False, pm_mode=False):
                 1, [InlineKeyboardButton("🚸 ɴᴏ ᴍᴏʀᴇ ᴘᴀɢᴇs 🚸", user_id=ADMINS[0])]
             )
     else:
-        btn.insert(
-            0,
-            [
-                InlineKeyboardButton(
-                    "📥 sᴇɴᴅ ᴀʟʟ ғɪʟᴇs 📥", callback_data=f"send_all#{key}"
-                ),
-            ],
-        )
-
+        btn.insert(0, send_all_row(key))
         btn.insert(1, [InlineKeyboardButton("🚸 ɴᴏ ᴍᴏʀᴇ ᴘᴀɢᴇs 🚸", user_id=ADMINS[0])])
 
     if spoll:
@@ -2311,16 +1926,7 @@ async def auto_filter(client, msg, spoll=False, pm_mode=False):
     else:
         cap = f"<b>📂 ʜᴇʀᴇ ɪ ꜰᴏᴜɴᴅ ꜰᴏʀ ʏᴏᴜʀ sᴇᴀʀᴄʜ {search}</b>"
 
-    ads, ads_name, _ = await mdb.get_advirtisment()
-    ads_text = ""
-    if ads is not None and ads_name is not None:
-        ads_url = f"https://telegram.dog/{temp.U_NAME}?start=ads"
-        ads_text = f"<a href={ads_url}>{ads_name}</a>"
-    js_ads = (
-        f"\n━━━━━━━━━━━━━━━━━━\n <b>{ads_text}</b> \n━━━━━━━━━━━━━━━━━━"
-        if ads_text
-        else ""
-    )
+    js_ads = await ads_footer()
     CAP[key] = cap
     if imdb and imdb.get("poster"):
         try:
@@ -2332,12 +1938,7 @@ async def auto_filter(client, msg, spoll=False, pm_mode=False):
                     reply_markup=InlineKeyboardMarkup(btn),
                 )
                 #  await delSticker(st)
-                await asyncio.sleep(DELETE_TIME)
-                await k.delete()
-                try:
-                    await message.delete()
-                except:
-                    pass
+                auto_deleter.schedule([k, message], DELETE_TIME)
             else:
                 await message.reply_photo(
                     photo=imdb.get("poster"),
@@ -2355,12 +1956,7 @@ async def auto_filter(client, msg, spoll=False, pm_mode=False):
                     reply_markup=InlineKeyboardMarkup(btn),
                 )
                 # await delSticker(st)
-                await asyncio.sleep(DELETE_TIME)
-                await k.delete()
-                try:
-                    await message.delete()
-                except:
-                    pass
+                auto_deleter.schedule([k, message], DELETE_TIME)
             else:
                 await message.reply_photo(
                     photo=poster,
@@ -2381,12 +1977,7 @@ async def auto_filter(client, msg, spoll=False, pm_mode=False):
                     )
                 except Exception as e:
                     print("error", e)
-                await asyncio.sleep(DELETE_TIME)
-                await k.delete()
-                try:
-                    await message.delete()
-                except:
-                    pass
+                auto_deleter.schedule([k, message], DELETE_TIME)
             else:
                 await message.reply_text(
                     cap + links + js_ads,
@@ -2405,12 +1996,7 @@ async def auto_filter(client, msg, spoll=False, pm_mode=False):
         # await delSticker(st)
         if settings["auto_delete"]:
             #  await delSticker(st)
-            await asyncio.sleep(DELETE_TIME)
-            await k.delete()
-            try:
-                await message.delete()
-            except:
-                pass
+            auto_deleter.schedule([k, message], DELETE_TIME)
     return
 
 
@@ -2430,12 +2016,7 @@ async def advantage_spell_chok(message):
         movies = await get_poster(search, bulk=True)
     except:
         k = await message.reply(script.I_CUDNT.format(message.from_user.mention))
-        await asyncio.sleep(60)
-        await k.delete()
-        try:
-            await message.delete()
-        except:
-            pass
+        auto_deleter.schedule([k, message], 60)
         return
     if not movies:
         google = search.replace(" ", "+")
@@ -2451,12 +2032,7 @@ async def advantage_spell_chok(message):
             text=script.I_CUDNT.format(search),
             reply_markup=InlineKeyboardMarkup(button),
         )
-        await asyncio.sleep(120)
-        await k.delete()
-        try:
-            await message.delete()
-        except:
-            pass
+        auto_deleter.schedule([k, message], 120)
         return
     user = message.from_user.id if message.from_user else 0
     buttons = [
@@ -2475,9 +2051,4 @@ async def advantage_spell_chok(message):
         reply_markup=InlineKeyboardMarkup(buttons),
         reply_to_message_id=message.id,
     )
-    await asyncio.sleep(120)
-    await d.delete()
-    try:
-        await message.delete()
-    except:
-        pass
+    auto_deleter.schedule([d, message], 120)
@@ -9,6 +9,7 @@ from Jisshu.bot import multi_clients, work_loads
 from Jisshu.server.exceptions import FIleNotFound, InvalidHash
 from Jisshu.util.custom_dl import ByteStreamer
 from Jisshu.util.render_template import render_page
+from Jisshu.util import metrics
 from info import *
 
 
@@ -20,6 +21,14 @@ async def root_route_handler(request):
     return web.json_response("Telegram ~ ProBotXUpdate")
 
 
+# must stay above the catch-all stream route
+@routes.get("/metrics")
+async def metrics_handler(request):
+    return web.Response(
+        text=metrics.render(), content_type="text/plain", charset="utf-8"
+    )
+
+
 @routes.get(r"/watch/{path:\S+}", allow_head=True)
 async def stream_handler(request: web.Request):
     try:
@@ -5,15 +5,25 @@ from pyrogram.errors import (
     FloodWait,
     UserIsBlocked,
     PeerIdInvalid,
+    ChannelInvalid,
+    ChannelPrivate,
+    ChatIdInvalid,
+)
+from info import (
+    AUTH_CHANNEL,
+    LONG_IMDB_DESCRIPTION,
+    START_IMG,
+    MEMBER_CACHE_TTL,
+    MEMBER_CACHE_NEGATIVE_TTL,
+    MEMBER_CACHE_SIZE,
 )
-from info import AUTH_CHANNEL, LONG_IMDB_DESCRIPTION, START_IMG
-from imdb import Cinemagoer
 import asyncio
 from pyrogram.types import Message
 from pyrogram import enums
 import pytz
 import re
 import os
+import time
 from shortzy import Shortzy
 from datetime import datetime
 from typing import Any
@@ -24,7 +34,17 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 BANNED = {}
-imdb = Cinemagoer()
+_imdb = None
+
+
+def get_imdb():
+    # Cinemagoer pulls in a lot of modules, create it on the first lookup
+    global _imdb
+    if _imdb is None:
+        from imdb import Cinemagoer
+
+        _imdb = Cinemagoer()
+    return _imdb
 
 
 class temp(object):
@@ -39,8 +59,8 @@ class temp(object):
     USERS_CANCEL = False
     GROUPS_CANCEL = False
     CHAT = {}
-    BANNED_USERS = []
-    BANNED_CHATS = []
+    BANNED_USERS = set()
+    BANNED_CHATS = set()
 
 
 def formate_file_name(file_name):
@@ -55,8 +75,47 @@ def formate_file_name(file_name):
     return file_name
 
 
+class MembershipCache:
+    # users rarely leave, so positive answers live long, negative ones short
+    # enough that "try again" works right after joining
+    def __init__(self, ttl, negative_ttl, size):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.size = size
+        self.data = {}
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value and value[0] > time.time():
+            return value[1]
+        return None
+
+    def set(self, key, value):
+        if len(self.data) >= self.size:
+            self.data.pop(next(iter(self.data)))
+        ttl = self.ttl if value else self.negative_ttl
+        self.data[key] = (time.time() + ttl, value)
+
+    def invalidate(self, chat_id, user_id):
+        self.data.pop((chat_id, user_id), None)
+        self.data.pop(("req", chat_id, user_id), None)
+
+    def clear(self):
+        self.data.clear()
+
+
+member_cache = MembershipCache(
+    MEMBER_CACHE_TTL, MEMBER_CACHE_NEGATIVE_TTL, MEMBER_CACHE_SIZE
+)
+
+
 async def is_req_subscribed(bot, query):
+    key = ("req", AUTH_CHANNEL, query.from_user.id)
+    cached = member_cache.get(key)
+    if cached is not None:
+        return cached
     if await db.find_join_req(query.from_user.id):
+        member_cache.set(key, True)
         return True
     try:
         user = await bot.get_chat_member(AUTH_CHANNEL, query.from_user.id)
@@ -64,22 +123,31 @@ async def is_req_subscribed(bot, query):
         pass
     except Exception as e:
         print(e)
+        return False
     else:
         if user.status != enums.ChatMemberStatus.BANNED:
+            member_cache.set(key, True)
             return True
+    member_cache.set(key, False)
     return False
 
 
 async def is_subscribed(bot, user_id, channel_id):
+    key = (channel_id, user_id)
+    cached = member_cache.get(key)
+    if cached is not None:
+        return cached
     try:
         user = await bot.get_chat_member(channel_id, user_id)
     except UserNotParticipant:
         pass
     except Exception:
-        pass
+        return False
     else:
         if user.status != enums.ChatMemberStatus.BANNED:
+            member_cache.set(key, True)
             return True
+    member_cache.set(key, False)
     return False
 
 
@@ -97,7 +165,10 @@ async def get_poster(query, bulk=False, id=False, file=None):
                 year = list_to_str(year[:1])
         else:
             year = None
-        movieid = imdb.search_movie(title.lower(), results=10)
+        # Cinemagoer is blocking, keep it off the event loop
+        movieid = await asyncio.to_thread(
+            get_imdb().search_movie, title.lower(), results=10
+        )
         if not movieid:
             return None
         if year:
@@ -116,7 +187,7 @@ async def get_poster(query, bulk=False, id=False, file=None):
         movieid = movieid[0].movieID
     else:
         movieid = query
-    movie = imdb.get_movie(movieid)
+    movie = await asyncio.to_thread(get_imdb().get_movie, movieid)
     if movie.get("original air date"):
         date = movie["original air date"]
     elif movie.get("year"):
@@ -164,48 +235,59 @@ async def get_poster(query, bulk=False, id=False, file=None):
     }
 
 
-async def users_broadcast(user_id, message, is_pin):
+# the bot was kicked or the chat is gone, the chat is removed from the db
+DEAD_GROUP_ERRORS = (ChannelPrivate,)
+# usually a session/peer cache problem, reported but kept
+INVALID_GROUP_ERRORS = (ChannelInvalid, ChatIdInvalid, PeerIdInvalid)
+
+
+async def pin_broadcast(m, **kwargs):
+    # the copy is the delivery, a failed pin must not make the broadcaster
+    # send the message again
+    for _ in range(2):
+        try:
+            return await m.pin(**kwargs)
+        except FloodWait as e:
+            await asyncio.sleep(e.value)
+        except Exception as e:
+            logger.info(f"Pinning broadcast in {m.chat.id} failed: {e}")
+            return
+
+
+async def users_broadcast(client, user_id, message, is_pin):
     try:
-        m = await message.copy(chat_id=user_id)
-        if is_pin:
-            await m.pin(both_sides=True)
-        return True, "Success"
-    except FloodWait as e:
-        await asyncio.sleep(e.x)
-        return await users_broadcast(user_id, message)
+        m = await client.copy_message(user_id, message.chat.id, message.id)
+    except FloodWait:
+        raise
     except InputUserDeactivated:
-        await db.delete_user(int(user_id))
-        logging.info(f"{user_id}-Removed from Database, since deleted account.")
-        return False, "Deleted"
+        return "Deleted"
     except UserIsBlocked:
-        await db.delete_user(int(user_id))
-        logging.info(f"{user_id} - Removed from Database, since Blocked the bot.")
-        await db.delete_user(user_id)
-        return False, "Blocked"
+        return "Blocked"
     except PeerIdInvalid:
-        await db.delete_user(int(user_id))
-        logging.info(f"{user_id} - PeerIdInvalid")
-        return False, "Error"
-    except Exception:
-        return False, "Error"
+        return "Invalid"
+    except Exception as e:
+        logger.info(f"Broadcast to user {user_id} failed: {e}")
+        return "Error"
+    if is_pin:
+        await pin_broadcast(m, both_sides=True)
+    return "Success"
 
 
-async def groups_broadcast(chat_id, message, is_pin):
+async def groups_broadcast(client, chat_id, message, is_pin):
     try:
-        m = await message.copy(chat_id=chat_id)
-        if is_pin:
-            try:
-                await m.pin()
-            except:
-                pass
-        return "Success"
-    except FloodWait as e:
-        await asyncio.sleep(e.x)
-        return await groups_broadcast(chat_id, message)
-    except Exception:
-        await db.delete_chat(chat_id)
-        logging.info(f"{chat_id}-Removed from Database.")
+        m = await client.copy_message(chat_id, message.chat.id, message.id)
+    except FloodWait:
+        raise
+    except DEAD_GROUP_ERRORS:
+        return "Removed"
+    except INVALID_GROUP_ERRORS:
+        return "Invalid"
+    except Exception as e:
+        logger.info(f"Broadcast to group {chat_id} failed: {e}")
         return "Error"
+    if is_pin:
+        await pin_broadcast(m)
+    return "Success"
 
 
 async def get_settings(group_id):